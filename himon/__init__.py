@@ -1,10 +1,51 @@
-"""himon package entry file."""
+"""himon package entry file.
+
+The main classes, such as LeagueOfComicGeeks and SQLiteCache, are also available from the
+package, they're imported on first access so `import himon` stays fast.
+"""
 
 __version__ = "0.8.0"
-__all__ = ["__version__", "get_cache_root"]
+__all__ = [
+    "AuthenticationError",
+    "CircuitOpenError",
+    "LeagueOfComicGeeks",
+    "NotFoundError",
+    "RateLimitError",
+    "SQLiteCache",
+    "ServiceError",
+    "__version__",
+    "get_cache_root",
+    "profile",
+]
 
 import os
+from importlib import import_module
 from pathlib import Path
+from typing import Any, Final
+
+LAZY_ATTRIBUTES: Final[dict[str, str]] = {
+    "AuthenticationError": "himon.exceptions",
+    "CircuitOpenError": "himon.exceptions",
+    "LeagueOfComicGeeks": "himon.league_of_comic_geeks",
+    "NotFoundError": "himon.exceptions",
+    "profile": "himon.profiling",
+    "RateLimitError": "himon.exceptions",
+    "SQLiteCache": "himon.sqlite_cache",
+    "ServiceError": "himon.exceptions",
+}
+
+
+def __getattr__(name: str) -> Any:  # noqa: ANN401
+    """Import the main classes from their submodule on first access."""
+    if name in LAZY_ATTRIBUTES:
+        return getattr(import_module(LAZY_ATTRIBUTES[name]), name)
+    msg = f"module {__name__!r} has no attribute {name!r}"
+    raise AttributeError(msg)
+
+
+def __dir__() -> list[str]:
+    """List the module attributes, including the lazily imported classes."""
+    return sorted({*globals(), *LAZY_ATTRIBUTES})
 
 
 def get_cache_root() -> Path:
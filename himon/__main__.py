@@ -0,0 +1,266 @@
+"""The himon command line entry file.
+
+This module provides the following functions:
+
+- main
+"""
+
+__all__ = ["main"]
+
+import os
+import sys
+from argparse import ArgumentParser, FileType, Namespace
+from collections.abc import Iterator
+from pathlib import Path
+from typing import TextIO
+
+
+def read_ids(kind: str, streams: list[TextIO]) -> Iterator[tuple[str, int]]:
+    """Read one id per line, skipping blank lines and `#` comments.
+
+    Lines which aren't an id are skipped with a warning, giving their file and line number.
+
+    Args:
+        kind: Type of id, either `comic` or `series`.
+        streams: Files to read ids from.
+
+    Returns:
+        Pairs of the kind and each id.
+    """
+    for stream in streams:
+        for line_number, line in enumerate(stream, start=1):
+            value = line.split("#", 1)[0].strip()
+            if not value:
+                continue
+            try:
+                yield kind, int(value)
+            except ValueError:
+                name = getattr(stream, "name", "<stream>")
+                sys.stderr.write(f"{name}:{line_number}: Skipping invalid {kind} id `{value}`\n")
+
+
+def warm(args: Namespace) -> int:
+    """Populate the cache with the Comics and Series from the id files.
+
+    Args:
+        args: Parsed command line arguments.
+
+    Returns:
+        Exit code, non-zero if any id failed.
+    """
+    from himon.cache_warmer import CacheWarmer, WarmProgress  # noqa: PLC0415
+    from himon.league_of_comic_geeks import LeagueOfComicGeeks, format_time  # noqa: PLC0415
+    from himon.sqlite_cache import SQLiteCache  # noqa: PLC0415
+    from himon.token_store import TokenStore  # noqa: PLC0415
+
+    session = LeagueOfComicGeeks(
+        client_id=args.client_id,
+        client_secret=args.client_secret,
+        access_token=args.access_token,
+        cache=SQLiteCache(path=args.cache),
+        token_store=TokenStore(),
+    )
+
+    ids = [*read_ids("comic", args.comics), *read_ids("series", args.series)]
+
+    def _report(progress: WarmProgress) -> None:
+        eta = "unknown" if progress.eta is None else format_time(progress.eta)
+        sys.stderr.write(
+            f"\r{progress.done}/{progress.total} "
+            f"(fetched {progress.fetched}, skipped {progress.skipped}, failed {progress.failed})"
+            f" - {progress.throughput * 60:.1f}/min - ETA {eta}\033[K"
+        )
+
+    warmer = CacheWarmer(session=session, checkpoint=args.checkpoint, workers=args.workers)
+    progress = warmer.warm(ids=ids, callback=_report)
+    _report(progress)
+    sys.stderr.write("\n")
+    return 1 if progress.failed else 0
+
+
+def export(args: Namespace) -> int:
+    """Export the cache into a compressed snapshot.
+
+    Args:
+        args: Parsed command line arguments.
+
+    Returns:
+        Exit code of the command.
+    """
+    from himon.cache_snapshot import export_snapshot  # noqa: PLC0415
+    from himon.sqlite_cache import SQLiteCache  # noqa: PLC0415
+
+    count = export_snapshot(
+        cache=SQLiteCache(path=args.cache),
+        path=args.path,
+        endpoints=args.endpoint or None,
+        max_age=args.max_age,
+    )
+    sys.stderr.write(f"Exported {count} entries to {args.path}\n")
+    return 0
+
+
+def import_(args: Namespace) -> int:
+    """Merge a snapshot into the cache, keeping the newest copy of each entry.
+
+    Args:
+        args: Parsed command line arguments.
+
+    Returns:
+        Exit code of the command.
+    """
+    from himon.cache_snapshot import import_snapshot  # noqa: PLC0415
+    from himon.sqlite_cache import SQLiteCache  # noqa: PLC0415
+
+    count = import_snapshot(cache=SQLiteCache(path=args.cache), path=args.path)
+    sys.stderr.write(f"Imported {count} entries from {args.path}\n")
+    return 0
+
+
+def freeze(args: Namespace) -> int:
+    """Build a read-only, memory-mapped snapshot of the cache.
+
+    Args:
+        args: Parsed command line arguments.
+
+    Returns:
+        Exit code of the command.
+    """
+    from himon.frozen_cache import FrozenCache  # noqa: PLC0415
+    from himon.sqlite_cache import SQLiteCache  # noqa: PLC0415
+
+    snapshot = FrozenCache.build(
+        cache=SQLiteCache(path=args.cache), path=args.path, prefixes=args.endpoint or None
+    )
+    sys.stderr.write(f"Froze {len(snapshot)} entries into {args.path}\n")
+    snapshot.close()
+    return 0
+
+
+def tables(args: Namespace) -> int:
+    """Export the cached Comics and Series into flat tables.
+
+    Args:
+        args: Parsed command line arguments.
+
+    Returns:
+        Exit code of the command.
+    """
+    from himon.sqlite_cache import SQLiteCache  # noqa: PLC0415
+    from himon.table_export import export_tables  # noqa: PLC0415
+
+    counts = export_tables(
+        cache=SQLiteCache(path=args.cache), directory=args.directory, file_format=args.format
+    )
+    summary = ", ".join(f"{count} {table}" for table, count in counts.items())
+    sys.stderr.write(f"Exported {summary} to {args.directory}\n")
+    return 0
+
+
+def main(argv: list[str] | None = None) -> int:
+    """Run the himon command line.
+
+    Args:
+        argv: Command line arguments, defaults to `sys.argv`.
+
+    Returns:
+        Exit code of the command.
+    """
+    parser = ArgumentParser(prog="himon", description="A Python wrapper for League of Comic Geeks.")
+    subparsers = parser.add_subparsers(dest="command", required=True)
+
+    warm_parser = subparsers.add_parser(
+        "warm", help="Populate the cache from lists of Comic and Series ids."
+    )
+    warm_parser.add_argument(
+        "--comics",
+        type=FileType("r"),
+        action="append",
+        default=[],
+        help="File of Comic ids, one per line. Use `-` for stdin.",
+    )
+    warm_parser.add_argument(
+        "--series",
+        type=FileType("r"),
+        action="append",
+        default=[],
+        help="File of Series ids, one per line. Use `-` for stdin.",
+    )
+    warm_parser.add_argument("--client-id", default=os.getenv("LEAGUE_OF_COMIC_GEEKS__CLIENT_ID"))
+    warm_parser.add_argument(
+        "--client-secret", default=os.getenv("LEAGUE_OF_COMIC_GEEKS__CLIENT_SECRET")
+    )
+    warm_parser.add_argument(
+        "--access-token", default=os.getenv("LEAGUE_OF_COMIC_GEEKS__ACCESS_TOKEN")
+    )
+    warm_parser.add_argument("--cache", type=Path, default=None, help="Path to the cache database.")
+    warm_parser.add_argument(
+        "--checkpoint", type=Path, default=None, help="File to record progress for resuming."
+    )
+    warm_parser.add_argument("--workers", type=int, default=4, help="Count of concurrent requests.")
+    warm_parser.set_defaults(func=warm)
+
+    export_parser = subparsers.add_parser("export", help="Export the cache into a snapshot.")
+    export_parser.add_argument("path", type=Path, help="Snapshot to write, `.zst` or gzip.")
+    export_parser.add_argument(
+        "--endpoint",
+        action="append",
+        default=[],
+        help="Only export this endpoint, such as `/comic/format/json`.",
+    )
+    export_parser.add_argument(
+        "--max-age",
+        type=int,
+        default=None,
+        help="Only export entries cached within these days, defaults to the fresh entries.",
+    )
+    export_parser.add_argument(
+        "--cache", type=Path, default=None, help="Path to the cache database."
+    )
+    export_parser.set_defaults(func=export)
+
+    import_parser = subparsers.add_parser("import", help="Merge a snapshot into the cache.")
+    import_parser.add_argument("path", type=Path, help="Snapshot to read.")
+    import_parser.add_argument(
+        "--cache", type=Path, default=None, help="Path to the cache database."
+    )
+    import_parser.set_defaults(func=import_)
+
+    freeze_parser = subparsers.add_parser(
+        "freeze", help="Build a read-only, memory-mapped snapshot of the cache."
+    )
+    freeze_parser.add_argument("path", type=Path, help="Snapshot to write.")
+    freeze_parser.add_argument(
+        "--endpoint",
+        action="append",
+        default=[],
+        help="Only include this endpoint, such as `/comic/format/json`.",
+    )
+    freeze_parser.add_argument(
+        "--cache", type=Path, default=None, help="Path to the cache database."
+    )
+    freeze_parser.set_defaults(func=freeze)
+
+    tables_parser = subparsers.add_parser(
+        "tables", help="Export the cached Comics and Series into flat tables."
+    )
+    tables_parser.add_argument("directory", type=Path, help="Directory to write the tables into.")
+    tables_parser.add_argument(
+        "--format",
+        choices=["csv", "parquet", "feather"],
+        default="csv",
+        help="Parquet and Feather require pyarrow.",
+    )
+    tables_parser.add_argument(
+        "--cache", type=Path, default=None, help="Path to the cache database."
+    )
+    tables_parser.set_defaults(func=tables)
+
+    args = parser.parse_args(argv)
+    if args.command == "warm" and not args.client_id:
+        parser.error("--client-id or LEAGUE_OF_COMIC_GEEKS__CLIENT_ID is required")
+    return args.func(args)
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,142 @@
+"""The BulkValidation module.
+
+This module provides the following functions:
+
+- validate_entries
+"""
+
+__all__ = ["validate_entries"]
+
+import json
+import os
+from collections import deque
+from collections.abc import Callable, Generator, Iterable
+from concurrent.futures import Future, ProcessPoolExecutor
+from itertools import islice
+from typing import Any, TypeVar
+
+from pydantic import ValidationError
+
+from himon.schemas import BaseModel, get_adapter
+from himon.schemas.comic import Comic
+from himon.schemas.series import Series
+
+T = TypeVar("T", bound=BaseModel)
+# Query, result and error message of each validated entry
+ChunkResult = list[tuple[str, Any, str | None]]
+
+
+def _validate_chunk(
+    model_type: type[T], convert: Callable[[T], Any], chunk: list[tuple[str, str]]
+) -> ChunkResult:
+    """Validate raw responses, converting each model into its result.
+
+    Runs in a worker process, so results should be compact to reduce pickling.
+
+    Args:
+        model_type: Type to validate the responses as.
+        convert: Called with each validated model, such as a projection.
+        chunk: Query and raw Json response of each entry.
+
+    Returns:
+        The query, result and error message of each entry.
+    """
+    output = []
+    for query, response in chunk:
+        try:
+            data = json.loads(response)
+            if model_type is Series and isinstance(data, dict) and "details" in data:
+                data = data["details"]
+            result = get_adapter(
+                model_type=model_type, many=isinstance(data, list)
+            ).validate_python(data)
+        except (ValueError, ValidationError) as err:
+            output.append((query, None, str(err)))
+            continue
+        if isinstance(result, list):
+            output.append((query, [convert(x) for x in result], None))
+        else:
+            output.append((query, convert(result), None))
+    return output
+
+
+def _chunks(entries: Iterable[dict[str, Any]], chunk_size: int) -> Generator[list[tuple[str, str]]]:
+    entries = iter(entries)
+    while chunk := [(x["query"], x["response"]) for x in islice(entries, chunk_size)]:
+        yield chunk
+
+
+def _run_chunks(
+    chunks: Iterable[list[tuple[str, str]]],
+    model_type: type[T],
+    convert: Callable[[T], Any],
+    workers: int,
+) -> Generator[ChunkResult]:
+    """Validate chunks in a pool of processes, keeping a few chunks per worker in flight."""
+    if workers == 1:
+        for chunk in chunks:
+            yield _validate_chunk(model_type=model_type, convert=convert, chunk=chunk)
+        return
+    executor = ProcessPoolExecutor(max_workers=workers)
+    try:
+        pending: deque[Future[ChunkResult]] = deque()
+        for chunk in chunks:
+            pending.append(executor.submit(_validate_chunk, model_type, convert, chunk))
+            if len(pending) >= workers * 2:
+                yield pending.popleft().result()
+        while pending:
+            yield pending.popleft().result()
+    finally:
+        executor.shutdown(cancel_futures=True)
+
+
+def validate_entries(  # noqa: PLR0917
+    entries: Iterable[dict[str, Any]],
+    model_type: type[T] = Comic,
+    projection: Callable[[T], Any] | None = None,
+    workers: int | None = None,
+    chunk_size: int = 200,
+    on_error: Callable[[str, str], None] | None = None,
+) -> Generator[tuple[str, Any]]:
+    """Validate cached responses, across a pool of processes if projected.
+
+    With a `projection`, entries are sent to the workers in chunks of raw Json, and each worker
+    returns the result of `projection`, such as a few fields or `to_bytes` to store the models.
+    Rebuilding whole models from what a worker returns costs about as much as validating them,
+    so without a projection responses are validated in this process. Only a few chunks per
+    worker are in flight at once, so entries are streamed rather than loaded all at once.
+    Results are in the order of the entries, a list response results in a list.
+
+    Args:
+        entries: Entries in the format used by `SQLiteCache.iter_entries` or `read_snapshot`.
+        model_type: Type to validate the responses as, such as Comic or Series.
+        projection: Called with each validated model in the workers, its result is returned
+            instead of the model. Must be picklable, such as a module level function.
+        workers: Count of worker processes, defaults to the count of cores with a projection,
+            otherwise 1. If 1, responses are validated in this process.
+        chunk_size: Count of entries sent to a worker at once.
+        on_error: Called with the query and error message of each entry which isn't valid Json
+            or fails validation, these entries are skipped.
+
+    Returns:
+        The query and validated model, or projection, of each valid entry.
+
+    Raises:
+        ValueError: If there are multiple workers without a projection.
+    """
+    if projection is None:
+        if workers not in {None, 1}:
+            msg = "Validating in worker processes requires a projection, such as `to_bytes`"
+            raise ValueError(msg)
+        workers = 1
+    for results in _run_chunks(
+        chunks=_chunks(entries=entries, chunk_size=chunk_size),
+        model_type=model_type,
+        convert=projection or (lambda x: x),
+        workers=workers or os.cpu_count() or 1,
+    ):
+        for query, result, error in results:
+            if error is None:
+                yield query, result
+            elif on_error:
+                on_error(query, error)
@@ -0,0 +1,117 @@
+"""The CacheBackend module.
+
+This module provides the following classes:
+
+- CacheBackend
+- CacheStats
+"""
+
+__all__ = ["CacheBackend", "CacheStats"]
+
+from collections.abc import Iterable
+from dataclasses import dataclass
+from typing import Any, Protocol, runtime_checkable
+
+
+@dataclass
+class CacheStats:
+    """The CacheStats object contains the size and usage of a cache.
+
+    Attributes:
+        entries: Count of cached responses, including expired ones not yet cleaned up.
+        size: Bytes used to store the cached responses.
+        hits: Count of queries selected which had a fresh response, since the cache was opened.
+        misses: Count of queries selected which didn't, since the cache was opened.
+    """
+
+    entries: int = 0
+    size: int = 0
+    hits: int = 0
+    misses: int = 0
+
+
+@runtime_checkable
+class CacheBackend(Protocol):
+    """Interface of the caches a LeagueOfComicGeeks session can store responses in.
+
+    SQLiteCache, MemoryCache and ShardedFileCache implement it, as can any other class with
+    these methods. Cached misses, revalidation of expired responses, entities and identifiers
+    need the extra tables of a SQLiteCache, with other backends they're skipped.
+    """
+
+    def select(self, query: str) -> Any:  # noqa: ANN401
+        """Retrieve a fresh response.
+
+        Args:
+            query: Url string used as key.
+
+        Returns:
+            Empty dict or the cached response.
+        """
+
+    def select_many(self, queries: Iterable[str]) -> dict[str, Any]:
+        """Retrieve the fresh responses of many queries at once.
+
+        Args:
+            queries: Url strings used as keys.
+
+        Returns:
+            The cached response of each query found.
+        """
+
+    def insert(
+        self,
+        query: str,
+        response: Any,  # noqa: ANN401
+        etag: str | None = None,
+        last_modified: str | None = None,
+    ) -> None:
+        """Store a response, replacing any existing one.
+
+        Args:
+            query: Url string used as key.
+            response: Response dict from url.
+            etag: ETag header of the response.
+            last_modified: Last-Modified header of the response.
+        """
+
+    def insert_many(self, entries: dict[str, Any]) -> None:
+        """Store many responses at once, replacing any existing ones.
+
+        Args:
+            entries: Response of each url string.
+        """
+
+    def contains(self, query: str) -> bool:
+        """Check if there's a fresh response, without loading it.
+
+        Args:
+            query: Url string used as key.
+
+        Returns:
+            True if a fresh response exists.
+        """
+
+    def delete(self, query: str) -> None:
+        """Remove a response.
+
+        Args:
+            query: Url string used as key.
+        """
+
+    def delete_many(self, queries: Iterable[str]) -> None:
+        """Remove many responses at once.
+
+        Args:
+            queries: Url strings used as keys.
+        """
+
+    def cleanup(self) -> None:
+        """Remove every expired response."""
+
+    def stats(self) -> CacheStats:
+        """Measure the size and usage of the cache.
+
+        Returns:
+            The size and usage of the cache.
+        """
@@ -0,0 +1,122 @@
+"""The CacheSnapshot module.
+
+This module provides the following functions:
+
+- export_snapshot
+- import_snapshot
+- read_snapshot
+"""
+
+__all__ = ["export_snapshot", "import_snapshot", "read_snapshot"]
+
+import gzip
+import json
+from collections.abc import Generator
+from datetime import datetime, timedelta, timezone
+from pathlib import Path
+from typing import IO, Any, Final
+
+from himon import __version__
+from himon.league_of_comic_geeks import rebuild_identifiers
+from himon.sqlite_cache import SQLiteCache
+
+SCHEMA_VERSION: Final[int] = 1
+SNAPSHOT_FORMAT: Final[str] = "himon-cache"
+
+
+def _open(path: Path, mode: str) -> IO[str]:
+    """Open a snapshot as text, compressed with zstd if it ends in `.zst`, otherwise gzip.
+
+    Args:
+        path: Path to the snapshot.
+        mode: Either `rt` or `wt`.
+
+    Returns:
+        The opened snapshot.
+
+    Raises:
+        ValueError: If zstd is requested but not available, it requires Python 3.14+.
+    """
+    if path.suffix == ".zst":
+        try:
+            from compression import zstd  # noqa: PLC0415
+        except ImportError as err:
+            raise ValueError("zstd snapshots require Python 3.14 or newer") from err
+        return zstd.open(path, mode, encoding="UTF-8")
+    return gzip.open(path, mode, encoding="UTF-8")
+
+
+def export_snapshot(
+    cache: SQLiteCache, path: Path, endpoints: list[str] | None = None, max_age: int | None = None
+) -> int:
+    """Stream the cached responses into a compressed Json Lines snapshot.
+
+    The first line is a header containing the schema version, followed by one line per entry
+    with its key, timestamp, revalidation headers and raw response.
+
+    Args:
+        cache: SQLiteCache to export.
+        path: Path to write the snapshot to, `.zst` uses zstd otherwise gzip.
+        endpoints: Only export entries for these endpoints, such as `/comic/format/json`.
+        max_age: Only export entries cached within this many days, the entries which are still
+            fresh in the cache if not set.
+
+    Returns:
+        Count of entries exported.
+    """
+    since = (
+        datetime.now(tz=timezone.utc) - timedelta(days=max_age) if max_age else cache.fresh_since
+    )
+    count = 0
+    with _open(path=path, mode="wt") as stream:
+        header = {
+            "format": SNAPSHOT_FORMAT,
+            "schema_version": SCHEMA_VERSION,
+            "version": __version__,
+            "created": datetime.now(tz=timezone.utc).isoformat(),
+        }
+        stream.write(json.dumps(header) + "\n")
+        for entry in cache.iter_entries(prefixes=endpoints, since=since):
+            stream.write(json.dumps(entry) + "\n")
+            count += 1
+    return count
+
+
+def read_snapshot(path: Path) -> Generator[dict[str, Any]]:
+    """Stream the entries of a snapshot.
+
+    Args:
+        path: Path to the snapshot.
+
+    Returns:
+        Entries in the format used by `SQLiteCache.iter_entries`.
+
+    Raises:
+        ValueError: If the file isn't a snapshot or uses a newer schema version.
+    """
+    with _open(path=path, mode="rt") as stream:
+        header = json.loads(stream.readline() or "{}")
+        if header.get("format") != SNAPSHOT_FORMAT:
+            raise ValueError("File isn't a Himon cache snapshot")
+        if header.get("schema_version", 0) > SCHEMA_VERSION:
+            raise ValueError("Snapshot was created by a newer version of Himon")
+        for line in stream:
+            if line.strip():
+                yield json.loads(line)
+
+
+def import_snapshot(cache: SQLiteCache, path: Path) -> int:
+    """Merge a snapshot into the cache, keeping the newest copy of each entry.
+
+    The identifiers and entities of the imported Comics are recorded too.
+
+    Args:
+        cache: SQLiteCache to import into.
+        path: Path to the snapshot.
+
+    Returns:
+        Count of entries inserted or replaced.
+    """
+    count = cache.merge(entries=read_snapshot(path=path))
+    rebuild_identifiers(cache=cache)
+    return count
@@ -0,0 +1,145 @@
+"""The CacheWarmer module.
+
+This module provides the following classes:
+
+- CacheWarmer
+- WarmProgress
+"""
+
+__all__ = ["CacheWarmer", "WarmProgress"]
+
+import time
+from collections.abc import Callable, Iterable
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+from threading import Lock
+
+from himon import get_cache_root
+from himon.exceptions import NotFoundError, RateLimitError, ServiceError
+from himon.league_of_comic_geeks import ENDPOINTS, LeagueOfComicGeeks
+
+
+class WarmProgress:
+    """The WarmProgress object contains the progress of a CacheWarmer run.
+
+    Args:
+        total: Count of ids to warm.
+
+    Attributes:
+        total (int): Count of ids to warm.
+        fetched (int): Count of ids requested from League of Comic Geeks.
+        skipped (int): Count of ids already fresh in the cache or finished by a previous run.
+        failed (int): Count of ids which raised a ServiceError or RateLimitError, these are
+            retried by the next run.
+        started (float): Monotonic time the run started.
+    """
+
+    def __init__(self, total: int):
+        self.total = total
+        self.fetched = 0
+        self.skipped = 0
+        self.failed = 0
+        self.started = time.monotonic()
+
+    @property
+    def done(self) -> int:
+        """Count of ids processed so far."""
+        return self.fetched + self.skipped + self.failed
+
+    @property
+    def throughput(self) -> float:
+        """Ids requested from League of Comic Geeks per second."""
+        elapsed = time.monotonic() - self.started
+        return self.fetched / elapsed if elapsed else 0.0
+
+    @property
+    def eta(self) -> float | None:
+        """Estimated seconds until all ids are processed, None until a request has finished."""
+        if not self.throughput:
+            return None
+        return (self.total - self.done) / self.throughput
+
+
+class CacheWarmer:
+    """Populate the cache with Comics and Series, resuming interrupted runs.
+
+    Args:
+        session: LeagueOfComicGeeks session, with a cache set.
+        checkpoint: File recording finished ids, removed once a run completes.
+        workers: Count of concurrent requests, still bound by the rate limit.
+
+    Raises:
+        ValueError: If the session has no cache set.
+    """
+
+    def __init__(
+        self, session: LeagueOfComicGeeks, checkpoint: Path | None = None, workers: int = 4
+    ):
+        if not session.cache:
+            raise ValueError("CacheWarmer requires a session with a cache")
+        self.session = session
+        self._checkpoint = checkpoint or (get_cache_root() / "warm.checkpoint")
+        self._workers = workers
+        self._lock = Lock()
+
+    def _load_checkpoint(self) -> set[str]:
+        if not self._checkpoint.exists():
+            return set()
+        return {x.strip() for x in self._checkpoint.read_text().splitlines() if x.strip()}
+
+    def _warm(self, kind: str, entity_id: int, progress: WarmProgress) -> None:
+        if self.session.is_cached(kind=kind, entity_id=entity_id):
+            status = "skipped"
+        else:
+            try:
+                if kind == "comic":
+                    self.session.get_comic(comic_id=entity_id)
+                else:
+                    self.session.get_series(series_id=entity_id)
+                status = "fetched"
+            except NotFoundError:
+                status = "fetched"
+            except (ServiceError, RateLimitError):
+                status = "failed"
+        with self._lock:
+            setattr(progress, status, getattr(progress, status) + 1)
+            if status != "failed":
+                with self._checkpoint.open("a") as stream:
+                    stream.write(f"{kind}:{entity_id}\n")
+
+    def warm(
+        self, ids: Iterable[tuple[str, int]], callback: Callable[[WarmProgress], None] | None = None
+    ) -> WarmProgress:
+        """Request every id not already in the cache or finished by a previous run.
+
+        Args:
+            ids: Pairs of `comic` or `series` and the id to warm.
+            callback: Called with the progress after each id is processed.
+
+        Returns:
+            The final progress of the run.
+
+        Raises:
+            ValueError: If an id isn't a `comic` or `series`.
+        """
+        ids = list(dict.fromkeys(ids))
+        for kind, _ in ids:
+            if kind not in ENDPOINTS:
+                msg = f"Unknown type `{kind}`, expected one of {list(ENDPOINTS)}"
+                raise ValueError(msg)
+        finished = self._load_checkpoint()
+        progress = WarmProgress(total=len(ids))
+        pending = [(kind, x) for kind, x in ids if f"{kind}:{x}" not in finished]
+        progress.skipped = progress.total - len(pending)
+
+        def _task(kind: str, entity_id: int) -> None:
+            self._warm(kind=kind, entity_id=entity_id, progress=progress)
+            if callback:
+                callback(progress)
+
+        with ThreadPoolExecutor(max_workers=self._workers) as executor:
+            for future in [executor.submit(_task, kind, x) for kind, x in pending]:
+                future.result()
+        if not progress.failed:
+            self._checkpoint.unlink(missing_ok=True)
+        return progress
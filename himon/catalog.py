@@ -0,0 +1,304 @@
+"""The Catalog module.
+
+This module provides the following classes:
+
+- Catalog
+"""
+
+__all__ = ["Catalog"]
+
+import sqlite3
+from collections.abc import Generator
+from contextlib import contextmanager
+from datetime import date
+from pathlib import Path
+from typing import Any
+
+from himon import get_cache_root
+from himon.schemas.comic import Comic, KeyEventType
+
+
+class Catalog:
+    """The Catalog object is a normalized, indexed store of cached Comics.
+
+    Comics, Series, Creators (with their parsed roles), Characters and Key Events are stored in
+    their own tables, so reports across the catalog run as indexed SQL instead of validating
+    every cached response.
+
+    Args:
+        path: Path to database.
+    """
+
+    def __init__(self, path: Path | None = None):
+        self._db_path = path or (get_cache_root() / "catalog.sqlite")
+        self.initialize()
+
+    @contextmanager
+    def _connect(self) -> Generator[sqlite3.Connection]:
+        conn = None
+        try:
+            conn = sqlite3.connect(self._db_path)
+            conn.row_factory = sqlite3.Row
+            conn.execute("PRAGMA foreign_keys = ON")
+            yield conn
+        finally:
+            if conn:
+                conn.close()
+
+    def initialize(self) -> None:
+        """Create the catalog tables if they don't exist."""
+        with self._connect() as conn:
+            conn.executescript(
+                """
+                CREATE TABLE IF NOT EXISTS series (
+                    id INTEGER NOT NULL PRIMARY KEY,
+                    title TEXT NOT NULL,
+                    volume INTEGER,
+                    year_begin INTEGER,
+                    year_end INTEGER,
+                    publisher_id INTEGER NOT NULL,
+                    publisher_name TEXT NOT NULL,
+                    date_modified TIMESTAMP
+                );
+                CREATE TABLE IF NOT EXISTS comic (
+                    id INTEGER NOT NULL PRIMARY KEY,
+                    series_id INTEGER NOT NULL REFERENCES series (id),
+                    publisher_id INTEGER NOT NULL,
+                    title TEXT NOT NULL,
+                    format TEXT NOT NULL,
+                    is_variant INTEGER NOT NULL,
+                    date_release DATE NOT NULL,
+                    date_modified TIMESTAMP NOT NULL
+                );
+                CREATE INDEX IF NOT EXISTS comic_series ON comic (series_id);
+                CREATE INDEX IF NOT EXISTS comic_publisher ON comic (publisher_id);
+                CREATE INDEX IF NOT EXISTS comic_release ON comic (date_release);
+                CREATE TABLE IF NOT EXISTS creator (
+                    id INTEGER NOT NULL PRIMARY KEY,
+                    name TEXT NOT NULL,
+                    slug TEXT NOT NULL
+                );
+                CREATE TABLE IF NOT EXISTS comic_creator (
+                    comic_id INTEGER NOT NULL REFERENCES comic (id) ON DELETE CASCADE,
+                    creator_id INTEGER NOT NULL REFERENCES creator (id),
+                    role_id INTEGER NOT NULL,
+                    role TEXT NOT NULL,
+                    PRIMARY KEY (comic_id, creator_id, role_id)
+                );
+                CREATE INDEX IF NOT EXISTS comic_creator_creator
+                    ON comic_creator (creator_id, role);
+                CREATE TABLE IF NOT EXISTS character (
+                    id INTEGER NOT NULL PRIMARY KEY,
+                    name TEXT NOT NULL,
+                    full_name TEXT NOT NULL,
+                    parent_name TEXT,
+                    universe_name TEXT,
+                    publisher_name TEXT NOT NULL
+                );
+                CREATE TABLE IF NOT EXISTS comic_character (
+                    comic_id INTEGER NOT NULL REFERENCES comic (id) ON DELETE CASCADE,
+                    character_id INTEGER NOT NULL REFERENCES character (id),
+                    character_type TEXT NOT NULL,
+                    PRIMARY KEY (comic_id, character_id)
+                );
+                CREATE INDEX IF NOT EXISTS comic_character_character
+                    ON comic_character (character_id);
+                CREATE TABLE IF NOT EXISTS key_event (
+                    id INTEGER NOT NULL PRIMARY KEY,
+                    comic_id INTEGER NOT NULL REFERENCES comic (id) ON DELETE CASCADE,
+                    character_id INTEGER NOT NULL,
+                    key_event_type INTEGER NOT NULL,
+                    name TEXT NOT NULL,
+                    parent_name TEXT,
+                    universe_name TEXT NOT NULL
+                );
+                CREATE INDEX IF NOT EXISTS key_event_type ON key_event (key_event_type, comic_id);
+                CREATE INDEX IF NOT EXISTS key_event_comic ON key_event (comic_id);
+                """
+            )
+            conn.commit()
+
+    def add_comic(self, comic: Comic) -> None:
+        """Add or replace a Comic, skipping it if its `date_modified` is unchanged.
+
+        Args:
+            comic: Comic to add, along with its Series, Creators, Characters and Key Events.
+        """
+        with self._connect() as conn:
+            row = conn.execute(
+                "SELECT date_modified FROM comic WHERE id = ?;", (comic.id,)
+            ).fetchone()
+            if row and row["date_modified"] == comic.date_modified.isoformat():
+                return
+            series = comic.series
+            conn.execute(
+                "INSERT OR REPLACE INTO series (id, title, volume, year_begin, year_end, "
+                "publisher_id, publisher_name, date_modified) VALUES (?, ?, ?, ?, ?, ?, ?, ?);",
+                (
+                    series.id,
+                    series.title,
+                    series.volume,
+                    series.year_begin,
+                    series.year_end,
+                    series.publisher_id,
+                    series.publisher_name,
+                    series.date_modified.isoformat(),
+                ),
+            )
+            conn.execute("DELETE FROM comic WHERE id = ?;", (comic.id,))
+            conn.execute(
+                "INSERT INTO comic (id, series_id, publisher_id, title, format, is_variant, "
+                "date_release, date_modified) VALUES (?, ?, ?, ?, ?, ?, ?, ?);",
+                (
+                    comic.id,
+                    comic.series_id,
+                    comic.publisher_id,
+                    comic.title,
+                    comic.format.value,
+                    comic.is_variant,
+                    comic.date_release.isoformat(),
+                    comic.date_modified.isoformat(),
+                ),
+            )
+            conn.executemany(
+                "INSERT OR REPLACE INTO creator (id, name, slug) VALUES (?, ?, ?);",
+                [(x.id, x.name, x.slug) for x in comic.creators],
+            )
+            conn.executemany(
+                "INSERT OR IGNORE INTO comic_creator (comic_id, creator_id, role_id, role) "
+                "VALUES (?, ?, ?, ?);",
+                [
+                    (comic.id, x.id, role_id, role)
+                    for x in comic.creators
+                    for role_id, role in x.roles.items()
+                ],
+            )
+            conn.executemany(
+                "INSERT OR REPLACE INTO character (id, name, full_name, parent_name, "
+                "universe_name, publisher_name) VALUES (?, ?, ?, ?, ?, ?);",
+                [
+                    (x.id, x.name, x.full_name, x.parent_name, x.universe_name, x.publisher_name)
+                    for x in comic.characters
+                ],
+            )
+            conn.executemany(
+                "INSERT OR IGNORE INTO comic_character (comic_id, character_id, character_type) "
+                "VALUES (?, ?, ?);",
+                [(comic.id, x.id, x.character_type.name) for x in comic.characters],
+            )
+            conn.executemany(
+                "INSERT OR REPLACE INTO key_event (id, comic_id, character_id, key_event_type, "
+                "name, parent_name, universe_name) VALUES (?, ?, ?, ?, ?, ?, ?);",
+                [
+                    (
+                        x.id,
+                        comic.id,
+                        x.character_id,
+                        x.key_event_type.value,
+                        x.name,
+                        x.parent_name,
+                        x.universe_name,
+                    )
+                    for x in comic.keys
+                ],
+            )
+            conn.commit()
+
+    def comics_by_series(self, series_id: int) -> list[int]:
+        """List the ids of Comics in a Series, ordered by release date.
+
+        Args:
+            series_id: The Series id.
+
+        Returns:
+            A list of Comic ids.
+        """
+        with self._connect() as conn:
+            rows = conn.execute(
+                "SELECT id FROM comic WHERE series_id = ? ORDER BY date_release, id;", (series_id,)
+            ).fetchall()
+        return [x["id"] for x in rows]
+
+    def comics_by_creator(self, creator_id: int, role: str | None = None) -> list[int]:
+        """List the ids of Comics a Creator worked on, ordered by release date.
+
+        Args:
+            creator_id: The Creator id.
+            role: Only include Comics where the Creator had this role, such as `Writer`.
+
+        Returns:
+            A list of Comic ids.
+        """
+        role_clause = " AND comic_creator.role = :role" if role else ""
+        with self._connect() as conn:
+            rows = conn.execute(
+                "SELECT DISTINCT comic.id FROM comic_creator "  # noqa: S608
+                "JOIN comic ON comic.id = comic_creator.comic_id "
+                f"WHERE comic_creator.creator_id = :creator_id{role_clause} "
+                "ORDER BY comic.date_release, comic.id;",
+                {"creator_id": creator_id, "role": role.title() if role else None},
+            ).fetchall()
+        return [x["id"] for x in rows]
+
+    def comics_by_character(self, character_id: int) -> list[int]:
+        """List the ids of Comics a Character appears in, ordered by release date.
+
+        Args:
+            character_id: The Character id.
+
+        Returns:
+            A list of Comic ids.
+        """
+        with self._connect() as conn:
+            rows = conn.execute(
+                "SELECT comic.id FROM comic_character "
+                "JOIN comic ON comic.id = comic_character.comic_id "
+                "WHERE comic_character.character_id = ? ORDER BY comic.date_release, comic.id;",
+                (character_id,),
+            ).fetchall()
+        return [x["id"] for x in rows]
+
+    def key_events(
+        self,
+        key_event_type: KeyEventType | None = None,
+        released_after: date | None = None,
+        released_before: date | None = None,
+    ) -> list[dict[str, Any]]:
+        """List Key Events, such as First Appearances, with the release date of their Comic.
+
+        Args:
+            key_event_type: Only include this type of Key Event.
+            released_after: Only include Comics released on or after this date.
+            released_before: Only include Comics released on or before this date.
+
+        Returns:
+            Projections containing the `id`, `comic_id`, `character_id`, `key_event_type`,
+            `name`, `parent_name`, `universe_name` and `date_release`.
+        """
+        clauses = []
+        values = {}
+        if key_event_type is not None:
+            clauses.append("key_event.key_event_type = :key_event_type")
+            values["key_event_type"] = key_event_type.value
+        if released_after:
+            clauses.append("comic.date_release >= :released_after")
+            values["released_after"] = released_after.isoformat()
+        if released_before:
+            clauses.append("comic.date_release <= :released_before")
+            values["released_before"] = released_before.isoformat()
+        where = f"WHERE {' AND '.join(clauses)} " if clauses else ""
+        with self._connect() as conn:
+            rows = conn.execute(
+                "SELECT key_event.*, comic.date_release FROM key_event "  # noqa: S608
+                f"JOIN comic ON comic.id = key_event.comic_id {where}"
+                "ORDER BY comic.date_release, key_event.id;",
+                values,
+            ).fetchall()
+        return [
+            {
+                **dict(x),
+                "key_event_type": KeyEventType(x["key_event_type"]),
+                "date_release": date.fromisoformat(x["date_release"]),
+            }
+            for x in rows
+        ]
@@ -0,0 +1,192 @@
+"""The CircuitBreaker module.
+
+This module provides the following classes:
+
+- CircuitBreaker
+- CircuitState
+"""
+
+__all__ = ["CircuitBreaker", "CircuitState"]
+
+from collections.abc import Generator
+from contextlib import contextmanager
+from dataclasses import dataclass
+from enum import Enum
+from http import HTTPStatus
+from threading import Lock
+from time import monotonic
+
+from himon.exceptions import CircuitOpenError
+
+
+class CircuitState(str, Enum):
+    """State of the circuit of an endpoint."""
+
+    CLOSED = "closed"
+    OPEN = "open"
+    HALF_OPEN = "half_open"
+
+
+@dataclass
+class _Circuit:
+    state: CircuitState = CircuitState.CLOSED
+    failures: int = 0
+    opened_at: float = 0
+    probes: int = 0
+
+
+def _is_outage(err: BaseException) -> bool:
+    """Check if an error was caused by League of Comic Geeks being down or slow.
+
+    Args:
+        err: Error raised by a request.
+
+    Returns:
+        True for connection errors, timeouts and 5xx responses.
+    """
+    from httpx import HTTPStatusError, RequestError  # noqa: PLC0415
+
+    cause = err.__cause__ or err
+    if isinstance(cause, HTTPStatusError):
+        return cause.response.status_code >= HTTPStatus.INTERNAL_SERVER_ERROR
+    return isinstance(cause, RequestError)
+
+
+class CircuitBreaker:
+    """The CircuitBreaker object stops requests to an endpoint while it's failing.
+
+    Each endpoint has its own circuit. After `failure_threshold` connection errors, timeouts or
+    5xx responses in a row the circuit opens, and requests fail fast with a CircuitOpenError
+    without waiting for a response or using a rate limit token. Once `reset_timeout` has passed
+    the circuit is half-open, letting `half_open_probes` requests through to test for recovery,
+    a success closes the circuit and a failure opens it again.
+
+    A single CircuitBreaker can be shared by multiple sessions and threads.
+
+    Args:
+        failure_threshold: Count of failures in a row which opens a circuit.
+        reset_timeout: How long a circuit stays open (in seconds), before being probed.
+        half_open_probes: Count of requests let through at once while half-open.
+    """
+
+    def __init__(
+        self, failure_threshold: int = 5, reset_timeout: float = 30, half_open_probes: int = 1
+    ):
+        self.failure_threshold = failure_threshold
+        self.reset_timeout = reset_timeout
+        self.half_open_probes = half_open_probes
+        self._circuits: dict[str, _Circuit] = {}
+        self._lock = Lock()
+
+    def _update(self, circuit: _Circuit) -> None:
+        if (
+            circuit.state == CircuitState.OPEN
+            and monotonic() - circuit.opened_at >= self.reset_timeout
+        ):
+            circuit.state = CircuitState.HALF_OPEN
+            circuit.probes = 0
+
+    def state(self, endpoint: str) -> CircuitState:
+        """Get the state of the circuit of an endpoint.
+
+        Args:
+            endpoint: The endpoint, such as `/comic/format/json`.
+
+        Returns:
+            The state of the circuit.
+        """
+        with self._lock:
+            circuit = self._circuits.get(endpoint)
+            if circuit is None:
+                return CircuitState.CLOSED
+            self._update(circuit=circuit)
+            return circuit.state
+
+    def states(self) -> dict[str, CircuitState]:
+        """Get the state of every endpoint which has been requested.
+
+        Returns:
+            The state of each endpoint's circuit.
+        """
+        with self._lock:
+            for circuit in self._circuits.values():
+                self._update(circuit=circuit)
+            return {endpoint: circuit.state for endpoint, circuit in self._circuits.items()}
+
+    def before_request(self, endpoint: str) -> None:
+        """Check a request can be made, reserving a probe if the circuit is half-open.
+
+        Args:
+            endpoint: The endpoint, such as `/comic/format/json`.
+
+        Raises:
+            CircuitOpenError: If the circuit is open, or half-open with every probe in use.
+        """
+        with self._lock:
+            circuit = self._circuits.setdefault(endpoint, _Circuit())
+            self._update(circuit=circuit)
+            if circuit.state == CircuitState.CLOSED:
+                return
+            if circuit.state == CircuitState.HALF_OPEN and circuit.probes < self.half_open_probes:
+                circuit.probes += 1
+                return
+            remaining = max(self.reset_timeout - (monotonic() - circuit.opened_at), 0)
+        raise CircuitOpenError(
+            "Circuit for '%s' is open: Retrying in %.0f seconds.", endpoint, remaining
+        )
+
+    def record(self, endpoint: str, success: bool) -> None:
+        """Record the outcome of a request.
+
+        Args:
+            endpoint: The endpoint, such as `/comic/format/json`.
+            success: False if the request failed with a connection error, timeout or 5xx response.
+        """
+        with self._lock:
+            circuit = self._circuits.setdefault(endpoint, _Circuit())
+            if success:
+                circuit.state = CircuitState.CLOSED
+                circuit.failures = 0
+                circuit.probes = 0
+                return
+            circuit.failures += 1
+            if (
+                circuit.state == CircuitState.HALF_OPEN
+                or circuit.failures >= self.failure_threshold
+            ):
+                circuit.state = CircuitState.OPEN
+                circuit.opened_at = monotonic()
+                circuit.probes = 0
+
+    @contextmanager
+    def guard(self, endpoint: str) -> Generator[None]:
+        """Check a request can be made, then record its outcome.
+
+        Args:
+            endpoint: The endpoint, such as `/comic/format/json`.
+
+        Raises:
+            CircuitOpenError: If the circuit is open, or half-open with every probe in use.
+        """
+        self.before_request(endpoint=endpoint)
+        success = False
+        try:
+            yield
+            success = True
+        except Exception as err:
+            success = not _is_outage(err=err)
+            raise
+        finally:
+            self.record(endpoint=endpoint, success=success)
+
+    def reset(self, endpoint: str | None = None) -> None:
+        """Close the circuit of an endpoint, forgetting its failures.
+
+        Args:
+            endpoint: The endpoint to reset, or every endpoint if not set.
+        """
+        with self._lock:
+            if endpoint is None:
+                self._circuits.clear()
+            else:
+                self._circuits.pop(endpoint, None)
@@ -0,0 +1,198 @@
+"""The ComicCollection module.
+
+This module provides the following classes:
+
+- ComicCollection
+"""
+
+__all__ = ["ComicCollection"]
+
+from array import array
+from bisect import bisect_left, bisect_right
+from collections.abc import Iterable, Iterator, Sequence
+from datetime import date
+from typing import Any, Final, overload
+
+from himon.schemas.comic import Comic
+from himon.schemas.generic import ComicFormat
+
+GROUP_KEYS: Final[tuple[str, ...]] = (
+    "series_id",
+    "publisher_id",
+    "format",
+    "creator_id",
+    "character_id",
+)
+
+
+class ComicCollection(Sequence[Comic]):
+    """The ComicCollection object holds Comics with indexes for fast filtering and grouping.
+
+    Ids, series, publisher, format, creator (and role) and character are hash indexed to the
+    positions of matching Comics, and release dates are stored in an array which is kept sorted
+    for range queries, so filters intersect the smallest candidate sets instead of walking every
+    Comic.
+
+    Args:
+        comics: Comics to add to the collection.
+    """
+
+    def __init__(self, comics: Iterable[Comic] = ()):
+        self._comics: list[Comic] = []
+        self._positions: dict[int, int] = {}
+        self._releases: array[int] = array("l")
+        self._indexes: dict[str, dict[Any, array[int]]] = {x: {} for x in GROUP_KEYS}
+        self._indexes["creator_role"] = {}
+        self._release_order: array[int] | None = None
+        self._sorted_releases: array[int] | None = None
+        for comic in comics:
+            self.add(comic=comic)
+
+    def _index(self, name: str, value: Any, position: int) -> None:  # noqa: ANN401
+        positions = self._indexes[name].setdefault(value, array("I"))
+        if not positions or positions[-1] != position:
+            positions.append(position)
+
+    def add(self, comic: Comic) -> None:
+        """Add a Comic to the collection and its indexes.
+
+        Args:
+            comic: Comic to add.
+        """
+        position = len(self._comics)
+        self._comics.append(comic)
+        self._positions.setdefault(comic.id, position)
+        self._releases.append(comic.date_release.toordinal())
+        self._release_order = None
+        self._index(name="series_id", value=comic.series_id, position=position)
+        self._index(name="publisher_id", value=comic.publisher_id, position=position)
+        self._index(name="format", value=comic.format, position=position)
+        for creator in comic.creators:
+            self._index(name="creator_id", value=creator.id, position=position)
+            for role in creator.roles.values():
+                self._index(name="creator_role", value=(creator.id, role), position=position)
+        for character in comic.characters:
+            self._index(name="character_id", value=character.id, position=position)
+
+    def _release_range(self, released_after: date | None, released_before: date | None) -> set[int]:
+        if self._release_order is None:
+            self._release_order = array(
+                "I", sorted(range(len(self._releases)), key=self._releases.__getitem__)
+            )
+            self._sorted_releases = array("l", (self._releases[x] for x in self._release_order))
+        start = (
+            bisect_left(self._sorted_releases, released_after.toordinal()) if released_after else 0
+        )
+        end = (
+            bisect_right(self._sorted_releases, released_before.toordinal())
+            if released_before
+            else len(self._sorted_releases)
+        )
+        return set(self._release_order[start:end])
+
+    def filter(
+        self,
+        *,
+        series_id: int | None = None,
+        publisher_id: int | None = None,
+        format: ComicFormat | None = None,  # noqa: A002
+        creator_id: int | None = None,
+        role: str | None = None,
+        character_id: int | None = None,
+        released_after: date | None = None,
+        released_before: date | None = None,
+    ) -> list[Comic]:
+        """List the Comics matching every filter given, in the order they were added.
+
+        Args:
+            series_id: Only include Comics from this Series.
+            publisher_id: Only include Comics from this publisher.
+            format: Only include Comics of this format.
+            creator_id: Only include Comics this Creator worked on.
+            role: Only include Comics where `creator_id` had this role, such as `Writer`.
+            character_id: Only include Comics this Character appears in.
+            released_after: Only include Comics released on or after this date.
+            released_before: Only include Comics released on or before this date.
+
+        Returns:
+            A list of matching Comics.
+        """
+        candidates = []
+        for name, value in (
+            ("series_id", series_id),
+            ("publisher_id", publisher_id),
+            ("format", format),
+            ("character_id", character_id),
+        ):
+            if value is not None:
+                candidates.append(self._indexes[name].get(value, array("I")))
+        if creator_id is not None and role:
+            candidates.append(
+                self._indexes["creator_role"].get((creator_id, role.title()), array("I"))
+            )
+        elif creator_id is not None:
+            candidates.append(self._indexes["creator_id"].get(creator_id, array("I")))
+        candidates.sort(key=len)
+        positions = set(candidates[0]) if candidates else None
+        for other in candidates[1:]:
+            positions.intersection_update(other)
+        if released_after or released_before:
+            release_positions = self._release_range(
+                released_after=released_after, released_before=released_before
+            )
+            positions = release_positions if positions is None else positions & release_positions
+        if positions is None:
+            return list(self._comics)
+        return [self._comics[x] for x in sorted(positions)]
+
+    def group_by(self, key: str) -> dict[Any, list[Comic]]:
+        """Group the Comics using one of the indexes.
+
+        A Comic is in multiple groups when grouping by `creator_id` or `character_id`.
+
+        Args:
+            key: One of `series_id`, `publisher_id`, `format`, `creator_id` or `character_id`.
+
+        Returns:
+            The Comics for each value of the key.
+
+        Raises:
+            ValueError: If the key isn't indexed.
+        """
+        if key not in GROUP_KEYS:
+            msg = f"Unable to group by `{key}`, expected one of {list(GROUP_KEYS)}"
+            raise ValueError(msg)
+        return {
+            value: [self._comics[x] for x in positions]
+            for value, positions in self._indexes[key].items()
+        }
+
+    def get(self, comic_id: int) -> Comic | None:
+        """Find a Comic in the collection by its id.
+
+        Args:
+            comic_id: The Comic id.
+
+        Returns:
+            None or the Comic.
+        """
+        position = self._positions.get(comic_id)
+        return None if position is None else self._comics[position]
+
+    @overload
+    def __getitem__(self, index: int) -> Comic: ...
+
+    @overload
+    def __getitem__(self, index: slice) -> list[Comic]: ...
+
+    def __getitem__(self, index: int | slice) -> Comic | list[Comic]:
+        """Get the Comic at a position in the collection."""
+        return self._comics[index]
+
+    def __iter__(self) -> Iterator[Comic]:
+        """Iterate over the Comics in the order they were added."""
+        return iter(self._comics)
+
+    def __len__(self) -> int:
+        """Count of Comics in the collection."""
+        return len(self._comics)
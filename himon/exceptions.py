@@ -4,10 +4,18 @@
 
 - ServiceError
 - AuthenticationError
+- CircuitOpenError
+- NotFoundError
 - RateLimitError
 """
 
-__all__ = ["AuthenticationError", "RateLimitError", "ServiceError"]
+__all__ = [
+    "AuthenticationError",
+    "CircuitOpenError",
+    "NotFoundError",
+    "RateLimitError",
+    "ServiceError",
+]
 
 
 class ServiceError(Exception):
@@ -18,5 +26,13 @@ class AuthenticationError(ServiceError):
     """Class for any authentication errors."""
 
 
+class CircuitOpenError(ServiceError):
+    """Class for requests stopped by an open circuit."""
+
+
+class NotFoundError(ServiceError):
+    """Class for any not found errors."""
+
+
 class RateLimitError(Exception):
     """Class for any API Rate Limit errors."""
@@ -0,0 +1,192 @@
+"""The ShardedFileCache module.
+
+This module provides the following classes:
+
+- ShardedFileCache
+"""
+
+__all__ = ["ShardedFileCache"]
+
+import json
+import os
+import tempfile
+from collections.abc import Generator, Iterable
+from datetime import datetime, timedelta, timezone
+from hashlib import blake2b
+from pathlib import Path
+from threading import Lock
+from typing import Any
+
+from himon import get_cache_root
+from himon.cache_backend import CacheStats
+
+
+class ShardedFileCache:
+    """The ShardedFileCache object caches each response in its own Json file.
+
+    Files are named by a hash of their query, and sharded into two levels of directories by its
+    first 4 characters, so no directory grows too large. Each file is written to a temporary
+    file then renamed over the old one, readers never see a partial response, and multiple
+    processes can share the cache without a database lock.
+
+    Args:
+        path: Path to the root directory.
+        expiry: How long to keep cache results (in days).
+    """
+
+    def __init__(self, path: Path | None = None, expiry: int | None = 14):
+        self._root = path or (get_cache_root() / "files")
+        self._expiry = expiry
+        self._lock = Lock()
+        self._hits = 0
+        self._misses = 0
+        self._root.mkdir(parents=True, exist_ok=True)
+
+    def _path(self, query: str) -> Path:
+        key = blake2b(query.encode("UTF-8"), digest_size=16).hexdigest()
+        return self._root / key[:2] / key[2:4] / f"{key}.json"
+
+    def _files(self) -> Generator[Path]:
+        yield from self._root.glob("*/*/*.json")
+
+    def _is_fresh(self, timestamp: str) -> bool:
+        return not self._expiry or datetime.fromisoformat(timestamp) > datetime.now(
+            tz=timezone.utc
+        ) - timedelta(days=self._expiry)
+
+    def _read(self, path: Path) -> dict[str, Any] | None:
+        try:
+            with path.open("r", encoding="UTF-8") as stream:
+                return json.load(stream)
+        except (FileNotFoundError, json.JSONDecodeError):
+            return None
+
+    def _get(self, query: str) -> Any:  # noqa: ANN401
+        entry = self._read(path=self._path(query=query))
+        found = entry is not None and entry["query"] == query and self._is_fresh(entry["timestamp"])
+        with self._lock:
+            if found:
+                self._hits += 1
+            else:
+                self._misses += 1
+        return entry["response"] if found else None
+
+    def select(self, query: str) -> Any:  # noqa: ANN401
+        """Retrieve a fresh response.
+
+        Args:
+            query: Url string used as key.
+
+        Returns:
+            Empty dict or the cached response.
+        """
+        response = self._get(query=query)
+        return response if response is not None else {}
+
+    def select_many(self, queries: Iterable[str]) -> dict[str, Any]:
+        """Retrieve the fresh responses of many queries at once.
+
+        Args:
+            queries: Url strings used as keys.
+
+        Returns:
+            The cached response of each query found.
+        """
+        found = {x: self._get(query=x) for x in dict.fromkeys(queries)}
+        return {query: response for query, response in found.items() if response is not None}
+
+    def insert(
+        self,
+        query: str,
+        response: Any,  # noqa: ANN401
+        etag: str | None = None,
+        last_modified: str | None = None,
+    ) -> None:
+        """Store a response, replacing any existing one.
+
+        Args:
+            query: Url string used as key.
+            response: Response dict from url.
+            etag: ETag header of the response.
+            last_modified: Last-Modified header of the response.
+        """
+        path = self._path(query=query)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        entry = {
+            "query": query,
+            "response": response,
+            "timestamp": datetime.now(tz=timezone.utc).isoformat(),
+            "etag": etag,
+            "last_modified": last_modified,
+        }
+        handle, temp_path = tempfile.mkstemp(dir=path.parent, suffix=".tmp")
+        try:
+            with os.fdopen(handle, "w", encoding="UTF-8") as stream:
+                json.dump(entry, stream)
+            Path(temp_path).replace(path)
+        except BaseException:
+            Path(temp_path).unlink(missing_ok=True)
+            raise
+
+    def insert_many(self, entries: dict[str, Any]) -> None:
+        """Store many responses at once, replacing any existing ones.
+
+        Args:
+            entries: Response of each url string.
+        """
+        for query, response in entries.items():
+            self.insert(query=query, response=response)
+
+    def contains(self, query: str) -> bool:
+        """Check if there's a fresh response.
+
+        Args:
+            query: Url string used as key.
+
+        Returns:
+            True if a fresh response exists.
+        """
+        entry = self._read(path=self._path(query=query))
+        return entry is not None and entry["query"] == query and self._is_fresh(entry["timestamp"])
+
+    def delete(self, query: str) -> None:
+        """Remove a response.
+
+        Args:
+            query: Url string used as key.
+        """
+        self._path(query=query).unlink(missing_ok=True)
+
+    def delete_many(self, queries: Iterable[str]) -> None:
+        """Remove many responses at once.
+
+        Args:
+            queries: Url strings used as keys.
+        """
+        for query in queries:
+            self.delete(query=query)
+
+    def cleanup(self) -> None:
+        """Remove every expired or unreadable response."""
+        for path in list(self._files()):
+            entry = self._read(path=path)
+            if entry is None or not self._is_fresh(entry["timestamp"]):
+                path.unlink(missing_ok=True)
+
+    def stats(self) -> CacheStats:
+        """Measure the size and usage of the cache.
+
+        Returns:
+            The count and size of the cached files, and the hits and misses of selects.
+        """
+        stats = CacheStats()
+        for path in self._files():
+            try:
+                stats.size += path.stat().st_size
+            except FileNotFoundError:
+                continue
+            stats.entries += 1
+        with self._lock:
+            stats.hits = self._hits
+            stats.misses = self._misses
+        return stats
@@ -0,0 +1,148 @@
+"""The FrozenCache module.
+
+This module provides the following classes:
+
+- FrozenCache
+"""
+
+__all__ = ["FrozenCache"]
+
+import json
+import mmap
+import struct
+from hashlib import blake2b
+from pathlib import Path
+from typing import Any, Final
+
+from himon.sqlite_cache import SQLiteCache
+
+MAGIC: Final[bytes] = b"HIMONFC\x00"
+VERSION: Final[int] = 1
+# Magic, version, entry count, index offset
+HEADER: Final[struct.Struct] = struct.Struct("<8sIIQ")
+# Key hash, entry offset, key length, response length
+INDEX_ENTRY: Final[struct.Struct] = struct.Struct("<QQII")
+INDEX_HASH: Final[struct.Struct] = struct.Struct("<Q")
+
+
+def _hash_key(key: bytes) -> int:
+    return int.from_bytes(blake2b(key, digest_size=8).digest(), "little")
+
+
+class FrozenCache:
+    """The FrozenCache object is a read-only, memory-mapped snapshot of a SQLiteCache.
+
+    The file holds the raw responses followed by an index sorted by key hash, which is binary
+    searched in place. Every process opening the same file shares it through the OS page cache,
+    without copying it or taking any locks. Entries never expire, build a new snapshot instead.
+
+    Args:
+        path: Path to a snapshot created by `FrozenCache.build`.
+
+    Raises:
+        ValueError: If the file isn't a FrozenCache snapshot.
+    """
+
+    def __init__(self, path: Path):
+        with path.open("rb") as stream:
+            self._mmap = mmap.mmap(stream.fileno(), 0, access=mmap.ACCESS_READ)
+        magic, version, self._count, self._index_offset = HEADER.unpack_from(self._mmap, 0)
+        if magic != MAGIC or version != VERSION:
+            self._mmap.close()
+            raise ValueError("File isn't a supported FrozenCache snapshot")
+
+    @classmethod
+    def build(
+        cls, cache: SQLiteCache, path: Path, prefixes: list[str] | None = None
+    ) -> "FrozenCache":
+        """Write the fresh entries of a SQLiteCache into a new snapshot, replacing it atomically.
+
+        Args:
+            cache: SQLiteCache to read entries from.
+            path: Path to write the snapshot to.
+            prefixes: Only include entries whose url starts with one of these, such as an endpoint.
+
+        Returns:
+            The opened snapshot.
+        """
+        temp_path = path.with_name(path.name + ".tmp")
+        index = []
+        with temp_path.open("wb") as stream:
+            stream.write(HEADER.pack(MAGIC, VERSION, 0, 0))
+            offset = HEADER.size
+            for entry in cache.iter_entries(prefixes=prefixes, since=cache.fresh_since):
+                key = entry["query"].encode("UTF-8")
+                response = entry["response"].encode("UTF-8")
+                stream.write(key)
+                stream.write(response)
+                index.append((_hash_key(key), offset, len(key), len(response)))
+                offset += len(key) + len(response)
+            index.sort()
+            for item in index:
+                stream.write(INDEX_ENTRY.pack(*item))
+            stream.seek(0)
+            stream.write(HEADER.pack(MAGIC, VERSION, len(index), offset))
+        temp_path.replace(path)
+        return cls(path=path)
+
+    def _find(self, key_hash: int) -> int:
+        """Return the position in the index of the first entry with the key hash."""
+        low, high = 0, self._count
+        while low < high:
+            middle = (low + high) // 2
+            (value,) = INDEX_HASH.unpack_from(
+                self._mmap, self._index_offset + middle * INDEX_ENTRY.size
+            )
+            if value < key_hash:
+                low = middle + 1
+            else:
+                high = middle
+        return low
+
+    def select_raw(self, query: str) -> bytes | None:
+        """Retrieve the raw Json of an entry, copying only it out of the snapshot.
+
+        Args:
+            query: Url string used as key.
+
+        Returns:
+            None or the raw Json response.
+        """
+        key = query.encode("UTF-8")
+        key_hash = _hash_key(key)
+        position = self._find(key_hash=key_hash)
+        while position < self._count:
+            value, offset, key_length, response_length = INDEX_ENTRY.unpack_from(
+                self._mmap, self._index_offset + position * INDEX_ENTRY.size
+            )
+            if value != key_hash:
+                break
+            if self._mmap[offset : offset + key_length] == key:
+                start = offset + key_length
+                return self._mmap[start : start + response_length]
+            position += 1
+        return None
+
+    def select(self, query: str) -> dict[str, Any]:
+        """Retrieve data from the snapshot.
+
+        Args:
+            query: Url string used as key.
+
+        Returns:
+            Empty dict or select results.
+        """
+        raw = self.select_raw(query=query)
+        return json.loads(raw) if raw is not None else {}
+
+    def __contains__(self, query: str) -> bool:
+        """Check if the snapshot has an entry for the url string."""
+        return self.select_raw(query=query) is not None
+
+    def __len__(self) -> int:
+        """Count of entries in the snapshot."""
+        return self._count
+
+    def close(self) -> None:
+        """Unmap the snapshot."""
+        self._mmap.close()
@@ -0,0 +1,102 @@
+"""The IdentityMap module.
+
+This module provides the following classes:
+
+- IdentityMap
+"""
+
+__all__ = ["IdentityMap"]
+
+from typing import Final, TypeVar
+
+from himon.schemas import BaseModel
+from himon.schemas.comic import Character, Creator
+from himon.schemas.generic import GenericComic
+from himon.schemas.series import Series
+
+T = TypeVar("T", bound=BaseModel)
+
+# Low-cardinality fields which repeat across most Comics
+INTERNED_FIELDS: Final[frozenset[str]] = frozenset(
+    {
+        "full_name",
+        "name",
+        "parent_name",
+        "publisher_name",
+        "publisher_slug",
+        "role",
+        "role_id",
+        "role_name",
+        "series_name",
+        "slug",
+        "string_primary",
+        "universe_name",
+    }
+)
+SHARED_MODELS: Final[tuple[type[BaseModel], ...]] = (Character, Creator, GenericComic, Series)
+
+
+class IdentityMap:
+    """The IdentityMap object shares repeated values between loaded models to save memory.
+
+    Repeated strings, such as publisher and universe names, are interned and identical Series,
+    GenericComic, Creator and Character sub-objects are replaced by a single shared instance.
+    Values are replaced through the model `__dict__`, so no validation is re-run.
+
+    Shared instances are used by many models, so they shouldn't be modified once compacted.
+    """
+
+    def __init__(self) -> None:
+        self._strings: dict[str, str] = {}
+        self._models: dict[tuple[type[BaseModel], int], BaseModel] = {}
+
+    def intern(self, value: str) -> str:
+        """Get the shared copy of a string.
+
+        Args:
+            value: String to share.
+
+        Returns:
+            An equal string, shared with every other caller.
+        """
+        return self._strings.setdefault(value, value)
+
+    def _share(self, model: T) -> T:
+        try:
+            key = (type(model), hash(tuple(model.__dict__.values())))
+        except TypeError:
+            return model
+        shared = self._models.setdefault(key, model)
+        # Only the hash is kept, so a collision leaves the model unshared
+        return shared if shared.__dict__ == model.__dict__ else model
+
+    def compact(self, model: T) -> T:
+        """Intern the strings and share the sub-objects of a model, in place.
+
+        Args:
+            model: Model to compact, such as a Comic.
+
+        Returns:
+            The model, or an identical shared instance if it's a Series, GenericComic, Creator
+            or Character.
+        """
+        values = model.__dict__
+        for field, value in values.items():
+            if isinstance(value, str) and field in INTERNED_FIELDS:
+                values[field] = self.intern(value=value)
+            elif isinstance(value, BaseModel):
+                values[field] = self.compact(model=value)
+            elif isinstance(value, list):
+                value[:] = [self.compact(model=x) if isinstance(x, BaseModel) else x for x in value]
+        if isinstance(model, SHARED_MODELS):
+            return self._share(model=model)
+        return model
+
+    def __len__(self) -> int:
+        """Count of shared strings and sub-objects."""
+        return len(self._strings) + len(self._models)
+
+    def clear(self) -> None:
+        """Forget every shared value, already compacted models keep theirs."""
+        self._strings.clear()
+        self._models.clear()
@@ -0,0 +1,337 @@
+"""The JobQueue module.
+
+This module provides the following classes:
+
+- Job
+- JobQueue
+- JobStatus
+"""
+
+__all__ = ["Job", "JobQueue", "JobStatus"]
+
+import sqlite3
+import time
+from collections.abc import Callable, Generator
+from contextlib import contextmanager
+from dataclasses import dataclass
+from datetime import datetime, timedelta, timezone
+from enum import Enum
+from pathlib import Path
+
+from himon import get_cache_root
+from himon.exceptions import NotFoundError, RateLimitError, ServiceError
+from himon.league_of_comic_geeks import LeagueOfComicGeeks
+
+KINDS = ("comic", "series", "search")
+LEASE_EXPIRED = "Lease expired before the Job finished"
+
+
+class JobStatus(str, Enum):
+    """Status of a queued Job."""
+
+    PENDING = "pending"
+    RUNNING = "running"
+    DONE = "done"
+    FAILED = "failed"
+
+
+@dataclass
+class Job:
+    """The Job object contains the details of a queued lookup.
+
+    Attributes:
+        id: Handle of the Job.
+        kind: Type of lookup, either `comic`, `series` or `search`.
+        value: Comic id, Series id or search term to lookup.
+        status: Status of the Job.
+        attempts: Count of times the Job has been started.
+        error: Message of the last error, if any.
+        created: Date and time the Job was queued.
+        updated: Date and time the Job was last changed.
+    """
+
+    id: int
+    kind: str
+    value: str
+    status: JobStatus
+    attempts: int
+    error: str | None
+    created: datetime
+    updated: datetime
+
+
+def _to_job(row: sqlite3.Row) -> Job:
+    return Job(
+        id=row["id"],
+        kind=row["kind"],
+        value=row["value"],
+        status=JobStatus(row["status"]),
+        attempts=row["attempts"],
+        error=row["error"],
+        created=datetime.fromisoformat(row["created"]),
+        updated=datetime.fromisoformat(row["updated"]),
+    )
+
+
+class JobQueue:
+    """The JobQueue object persists Comic, Series and search lookups until they've completed.
+
+    Lookups are saved to a SQLite database, so queued Jobs survive restarts. Queuing a lookup
+    which is already pending returns the existing Job. `drain` runs the Jobs through a session
+    at the rate limit, retrying failures with a backoff, and results are saved to its cache.
+
+    Running Jobs are leased, if a drainer stops without finishing a Job it's run again once the
+    lease expires, or failed if it's out of attempts.
+
+    Args:
+        path: Path to database.
+        max_attempts: Count of times a Job is tried before it's failed.
+        retry_delay: Delay before a Job is retried (in seconds), doubled after each attempt.
+        lease: How long a drainer has to finish a Job (in seconds), before it's run again.
+    """
+
+    def __init__(
+        self,
+        path: Path | None = None,
+        max_attempts: int = 5,
+        retry_delay: float = 60,
+        lease: float = 600,
+    ):
+        self._db_path = path or (get_cache_root() / "jobs.sqlite")
+        self.max_attempts = max_attempts
+        self.retry_delay = retry_delay
+        self.lease = lease
+        self.initialize()
+
+    @contextmanager
+    def _connect(self) -> Generator[sqlite3.Connection]:
+        conn = None
+        try:
+            conn = sqlite3.connect(self._db_path, isolation_level=None)
+            conn.row_factory = sqlite3.Row
+            yield conn
+        finally:
+            if conn:
+                conn.close()
+
+    def initialize(self) -> None:
+        """Create the job table if it doesn't exist."""
+        with self._connect() as conn:
+            conn.execute(
+                """
+                CREATE TABLE IF NOT EXISTS job (
+                    id INTEGER PRIMARY KEY,
+                    kind TEXT NOT NULL,
+                    value TEXT NOT NULL,
+                    status TEXT NOT NULL,
+                    attempts INTEGER NOT NULL DEFAULT 0,
+                    error TEXT,
+                    available TIMESTAMP NOT NULL,
+                    created TIMESTAMP NOT NULL,
+                    updated TIMESTAMP NOT NULL,
+                    UNIQUE (kind, value)
+                );
+                """
+            )
+            conn.execute("CREATE INDEX IF NOT EXISTS job_available ON job (status, available);")
+
+    @staticmethod
+    def _now(delay: float = 0) -> str:
+        return (datetime.now(tz=timezone.utc) + timedelta(seconds=delay)).isoformat()
+
+    def enqueue(self, kind: str, value: int | str) -> int:
+        """Queue a lookup, unless it's already pending.
+
+        A lookup which has already finished is queued again.
+
+        Args:
+            kind: Type of lookup, either `comic`, `series` or `search`.
+            value: Comic id, Series id or search term to lookup.
+
+        Returns:
+            Handle of the Job, used to check its status.
+
+        Raises:
+            ValueError: If the kind isn't a `comic`, `series` or `search`.
+        """
+        if kind not in KINDS:
+            msg = f"Unknown type `{kind}`, expected one of {list(KINDS)}"
+            raise ValueError(msg)
+        now = self._now()
+        with self._connect() as conn:
+            conn.execute(
+                "INSERT INTO job (kind, value, status, available, created, updated) "
+                "VALUES (?, ?, ?, ?, ?, ?) ON CONFLICT (kind, value) DO UPDATE SET "
+                "status = excluded.status, attempts = 0, error = NULL, "
+                "available = excluded.available, updated = excluded.updated "
+                "WHERE status IN (?, ?);",
+                (
+                    kind,
+                    str(value),
+                    JobStatus.PENDING,
+                    now,
+                    now,
+                    now,
+                    JobStatus.DONE,
+                    JobStatus.FAILED,
+                ),
+            )
+            return conn.execute(
+                "SELECT id FROM job WHERE kind = ? AND value = ?;", (kind, str(value))
+            ).fetchone()["id"]
+
+    def get(self, job_id: int) -> Job | None:
+        """Retrieve a Job, to poll its status.
+
+        Args:
+            job_id: Handle of the Job.
+
+        Returns:
+            None or the Job.
+        """
+        with self._connect() as conn:
+            row = conn.execute("SELECT * FROM job WHERE id = ?;", (job_id,)).fetchone()
+            return _to_job(row=row) if row else None
+
+    def counts(self) -> dict[JobStatus, int]:
+        """Count the Jobs of each status.
+
+        Returns:
+            Count of Jobs for every status.
+        """
+        with self._connect() as conn:
+            rows = conn.execute("SELECT status, COUNT(*) FROM job GROUP BY status;").fetchall()
+        return {**dict.fromkeys(JobStatus, 0), **{JobStatus(x[0]): x[1] for x in rows}}
+
+    def claim(self) -> Job | None:
+        """Lease the oldest Job which is ready to run.
+
+        Returns:
+            None or the Job, marked as running.
+        """
+        now = self._now()
+        with self._connect() as conn:
+            conn.execute("BEGIN IMMEDIATE;")
+            try:
+                conn.execute(
+                    "UPDATE job SET status = ?, error = ?, updated = ? "
+                    "WHERE status = ? AND available <= ? AND attempts >= ?;",
+                    (
+                        JobStatus.FAILED,
+                        LEASE_EXPIRED,
+                        now,
+                        JobStatus.RUNNING,
+                        now,
+                        self.max_attempts,
+                    ),
+                )
+                row = conn.execute(
+                    "SELECT id FROM job WHERE status IN (?, ?) AND available <= ? "
+                    "ORDER BY id LIMIT 1;",
+                    (JobStatus.PENDING, JobStatus.RUNNING, now),
+                ).fetchone()
+                if row:
+                    conn.execute(
+                        "UPDATE job SET status = ?, attempts = attempts + 1, available = ?, "
+                        "updated = ? WHERE id = ?;",
+                        (JobStatus.RUNNING, self._now(delay=self.lease), now, row["id"]),
+                    )
+                conn.execute("COMMIT;")
+            except BaseException:
+                conn.execute("ROLLBACK;")
+                raise
+        return self.get(job_id=row["id"]) if row else None
+
+    def complete(self, job_id: int) -> None:
+        """Mark a Job as done.
+
+        Args:
+            job_id: Handle of the Job.
+        """
+        with self._connect() as conn:
+            conn.execute(
+                "UPDATE job SET status = ?, error = NULL, updated = ? WHERE id = ?;",
+                (JobStatus.DONE, self._now(), job_id),
+            )
+
+    def fail(self, job_id: int, error: str, retry: bool = True) -> None:
+        """Record an error, retrying the Job after a backoff until it runs out of attempts.
+
+        Args:
+            job_id: Handle of the Job.
+            error: Message of the error.
+            retry: Retry the Job if it has attempts left, otherwise fail it immediately.
+        """
+        job = self.get(job_id=job_id)
+        if job is None:
+            return
+        retry = retry and job.attempts < self.max_attempts
+        with self._connect() as conn:
+            conn.execute(
+                "UPDATE job SET status = ?, error = ?, available = ?, updated = ? WHERE id = ?;",
+                (
+                    JobStatus.PENDING if retry else JobStatus.FAILED,
+                    error,
+                    self._now(delay=self.retry_delay * 2 ** (job.attempts - 1)),
+                    self._now(),
+                    job_id,
+                ),
+            )
+
+    def _is_unfinished(self) -> bool:
+        with self._connect() as conn:
+            return bool(
+                conn.execute(
+                    "SELECT 1 FROM job WHERE status IN (?, ?) LIMIT 1;",
+                    (JobStatus.PENDING, JobStatus.RUNNING),
+                ).fetchone()
+            )
+
+    @staticmethod
+    def _run(session: LeagueOfComicGeeks, job: Job) -> None:
+        if job.kind == "comic":
+            session.get_comic(comic_id=int(job.value))
+        elif job.kind == "series":
+            session.get_series(series_id=int(job.value))
+        else:
+            session.search(search_term=job.value)
+
+    def drain(
+        self,
+        session: LeagueOfComicGeeks,
+        callback: Callable[[Job], None] | None = None,
+        wait: bool = False,
+        poll_interval: float = 1,
+    ) -> int:
+        """Run queued Jobs through a session, at its rate limit.
+
+        Args:
+            session: LeagueOfComicGeeks session, with a cache set to save results to.
+            callback: Called with each Job once it's done or failed.
+            wait: Keep waiting for new Jobs, instead of returning once every Job has finished.
+            poll_interval: How long to wait (in seconds) before checking for Jobs again.
+
+        Returns:
+            Count of Jobs run.
+        """
+        count = 0
+        while True:
+            job = self.claim()
+            if job is None:
+                if not wait and not self._is_unfinished():
+                    return count
+                time.sleep(poll_interval)
+                continue
+            try:
+                self._run(session=session, job=job)
+            # Invalid values and responses, including pydantic ValidationErrors, won't change
+            except (NotFoundError, ValueError) as err:
+                self.fail(job_id=job.id, error=str(err), retry=False)
+            except (RateLimitError, ServiceError) as err:
+                self.fail(job_id=job.id, error=str(err))
+            else:
+                self.complete(job_id=job.id)
+            count += 1
+            job = self.get(job_id=job.id)
+            if callback and job.status in {JobStatus.DONE, JobStatus.FAILED}:
+                callback(job)
@@ -3,30 +3,68 @@
 This module provides the following classes:
 
 - LeagueOfComicGeeks
+
+This module provides the following functions:
+
+- rebuild_identifiers
 """
 
-__all__ = ["LeagueOfComicGeeks"]
+__all__ = ["LeagueOfComicGeeks", "rebuild_identifiers"]
 
 import platform
-from json import JSONDecodeError
-from typing import Any, ClassVar, Final
+import re
+from collections.abc import Generator, Iterable
+from contextlib import AbstractContextManager, nullcontext
+from http import HTTPStatus
+from itertools import chain
+from json import JSONDecodeError, JSONDecoder, loads
+from threading import Lock
+from time import time
+from typing import TYPE_CHECKING, Any, ClassVar, Final, TypeVar
 from urllib.parse import urlencode
 
-from httpx import Client, HTTPStatusError, RequestError, TimeoutException, codes
-from pydantic import TypeAdapter, ValidationError
-from pyrate_limiter import Duration, Limiter, Rate, SQLiteBucket
+from pydantic import ValidationError
 
 from himon import __version__
-from himon.exceptions import AuthenticationError, RateLimitError, ServiceError
+from himon.cache_backend import CacheBackend
+from himon.catalog import Catalog
+from himon.circuit_breaker import CircuitBreaker
+from himon.exceptions import (
+    AuthenticationError,
+    CircuitOpenError,
+    NotFoundError,
+    RateLimitError,
+    ServiceError,
+)
+from himon.frozen_cache import FrozenCache
+from himon.identity_map import IdentityMap
+from himon.profiling import stage
+from himon.schemas import BaseModel, get_adapter
 from himon.schemas.comic import Comic
 from himon.schemas.generic import GenericComic
 from himon.schemas.series import Series
+from himon.search_index import SearchIndex
 from himon.sqlite_cache import SQLiteCache
+from himon.token_store import TokenStore
+
+if TYPE_CHECKING:
+    from httpx import Response
+    from pyrate_limiter import Limiter
+
+    from himon.prefetcher import Prefetcher
+
+T = TypeVar("T", bound=BaseModel)
 
 # Constants
+AUTHORIZE_ENDPOINT: Final[str] = "/authorize/format/json"
+ENDPOINTS: Final[dict[str, tuple[str, str]]] = {
+    "comic": ("/comic/format/json", "comic_id"),
+    "series": ("/series/format/json", "series_id"),
+}
 MINUTE_RATE: Final[int] = 20
 SECONDS_PER_HOUR: Final[int] = 3_600
 SECONDS_PER_MINUTE: Final[int] = 60
+WHITESPACE: Final[re.Pattern[str]] = re.compile(r"[ \t\n\r]*")
 
 
 def rate_mapping(*args: Any, **kwargs: Any) -> tuple[str, int]:
@@ -60,6 +98,196 @@ def format_time(seconds: str | float) -> str:
     return ", ".join(parts)
 
 
+def get_cache_key(endpoint: str, params: dict[str, str] | None = None) -> str:
+    """Build the key used to cache a request.
+
+    Args:
+        endpoint: The endpoint to request information from.
+        params: Parameters to add to the request.
+
+    Returns:
+        The endpoint with its url encoded parameters.
+    """
+    return endpoint + (f"?{urlencode(params)}" if params else "")
+
+
+def get_date_modified(response: Any) -> str | None:  # noqa: ANN401
+    """Get the `date_modified` from the details of a Comic or Series response.
+
+    Args:
+        response: Json response from League of Comic Geeks.
+
+    Returns:
+        The `date_modified` value if the response has one.
+    """
+    if isinstance(response, dict) and isinstance(response.get("details"), dict):
+        return response["details"].get("date_modified")
+    return None
+
+
+def get_conditional_headers(stale: dict[str, Any]) -> dict[str, str]:
+    """Build the headers to revalidate an expired cache entry.
+
+    Args:
+        stale: Expired cache entry, containing its `etag` and `last_modified`.
+
+    Returns:
+        The If-None-Match and If-Modified-Since headers the entry has values for.
+    """
+    headers = {}
+    if stale.get("etag"):
+        headers["If-None-Match"] = stale["etag"]
+    if stale.get("last_modified"):
+        headers["If-Modified-Since"] = stale["last_modified"]
+    return headers
+
+
+def _decode_items(
+    decoder: JSONDecoder, buffer: str, position: int, final: bool
+) -> Generator[Any, None, int | None]:
+    """Decode the complete items of a Json array from a buffer.
+
+    Returns:
+        Each complete item, then the position to continue from, or None if the array has ended.
+    """
+    while True:
+        position = WHITESPACE.match(buffer, position).end()
+        if position < len(buffer) and buffer[position] == "]":
+            return None
+        if position < len(buffer) and buffer[position] == ",":
+            position += 1
+            continue
+        if position >= len(buffer) and not final:
+            return position
+        try:
+            item, end = decoder.raw_decode(buffer, position)
+        except JSONDecodeError:
+            if final:
+                raise
+            return position
+        # A number at the end of the buffer may continue in the next chunk
+        if end == len(buffer) and not final:
+            return position
+        yield item
+        position = end
+
+
+def _validate(model_type: type[T], data: Any, many: bool = False) -> Any:  # noqa: ANN401
+    """Validate a Json response as a model, or list of models, recording it as a stage."""
+    with stage(name=f"validate:{model_type.__name__}"):
+        return get_adapter(model_type=model_type, many=many).validate_python(data)
+
+
+def iter_json_array(chunks: Iterable[str]) -> Generator[Any]:
+    """Decode the items of a Json array incrementally, as its text arrives.
+
+    Args:
+        chunks: Pieces of the Json document, such as `Response.iter_text()`.
+
+    Returns:
+        Each item of the array, as soon as it's complete.
+
+    Raises:
+        ValueError: If the document isn't valid Json, or is a non-empty value other than an array.
+    """
+    decoder = JSONDecoder()
+    buffer = ""
+    is_array = None
+    for chunk in chain(chunks, [None]):
+        buffer += chunk or ""
+        position = WHITESPACE.match(buffer).end()
+        if is_array is None and position < len(buffer):
+            is_array = buffer[position] == "["
+            position += 1
+        if is_array:
+            position = yield from _decode_items(
+                decoder=decoder, buffer=buffer, position=position, final=chunk is None
+            )
+            if position is None:
+                return
+            buffer = buffer[position:]
+    if buffer.strip() and loads(buffer):
+        raise ValueError("Expected a Json array")
+
+
+def get_identifiers(comic: Comic) -> list[tuple[str, str | int, int]]:
+    """List the UPC, ISBN and SKU identifiers of a Comic and its Variants.
+
+    Args:
+        comic: Comic to read identifiers from.
+
+    Returns:
+        The kind of identifier, its value and the Comic or Variant id it belongs to.
+    """
+    identifiers = [
+        (kind, value, comic.id)
+        for kind, value in (
+            ("upc", comic.upc),
+            ("isbn", comic.isbn),
+            ("sku", comic.sku),
+            ("sku_diamond", comic.sku_diamond),
+        )
+        if value
+    ]
+    identifiers.extend(("sku", x.sku, x.id) for x in comic.variants if x.sku)
+    return identifiers
+
+
+def get_entities(result: dict[str, Any]) -> dict[str, list[dict[str, Any]]]:
+    """List the sub-documents embedded in a Comic response, by type of entity.
+
+    Args:
+        result: Json response of a Comic from League of Comic Geeks.
+
+    Returns:
+        The Series and GenericComics of the Comic.
+    """
+    return {
+        "series": [result["series"]] if result.get("series") else [],
+        "generic_comic": [
+            *(result.get("collected_in") or []),
+            *(result.get("collected_issues") or []),
+        ],
+    }
+
+
+def _insert_index(
+    cache: SQLiteCache,
+    entities: dict[str, list[dict[str, Any]]],
+    identifiers: list[tuple[str, str | int, int]],
+) -> None:
+    """Store the identifiers of Comics, and the sub-documents embedded in them as entities."""
+    for entity_type, values in entities.items():
+        if values:
+            cache.insert_entities(entity_type=entity_type, entities=values)
+    if identifiers:
+        cache.insert_identifiers(identifiers=identifiers)
+
+
+def rebuild_identifiers(cache: SQLiteCache) -> None:
+    """Record the identifiers and entities of every Comic held in a SQLiteCache.
+
+    Run this after entries are merged or imported, as only Comics requested from the API are
+    recorded otherwise.
+
+    Args:
+        cache: SQLiteCache to read entries from, and write identifiers and entities into.
+    """
+    entities = {"series": [], "generic_comic": []}
+    identifiers = []
+    for entry in cache.iter_entries(prefixes=[ENDPOINTS["comic"][0]]):
+        result = loads(entry["response"])
+        try:
+            comic = _validate(model_type=Comic, data=result)
+        except ValidationError:
+            continue
+        for entity_type, values in get_entities(result=result).items():
+            entities[entity_type].extend(values)
+        identifiers.extend(get_identifiers(comic=comic))
+    # Written after reading, the entries are streamed from an open read transaction
+    _insert_index(cache=cache, entities=entities, identifiers=identifiers)
+
+
 class LeagueOfComicGeeks:
     """Wrapper to allow calling League of Comic Geeks API endpoints.
 
@@ -68,28 +296,49 @@ class LeagueOfComicGeeks:
         client_secret: User's Client Secret to access League of Comic Geeks.
         access_token: User's Access Token to access League of Comic Geeks.
         timeout: Set how long requests will wait for a response (in seconds).
-        cache: SQLiteCache to use if set.
+        cache: Cache to store responses in if set, such as a SQLiteCache. Cached misses,
+            revalidation, entities and identifiers need a SQLiteCache, expired responses are
+            revalidated for the `stale_expiry` of the SQLiteCache.
+        snapshot: Read-only FrozenCache to check before the cache, if set.
+        search_index: SearchIndex to add Comics and search results to, if set.
+        catalog: Catalog to add Comics to, if set.
+        identity_map: IdentityMap to compact results with, sharing repeated values, if set.
+        token_store: TokenStore to load the access token from, and save new ones to, if set.
+        circuit_breaker: CircuitBreaker to stop requests to failing endpoints, if set.
 
     Attributes:
-        cache (SQLiteCache | None): SQLiteCache to use if set.
+        cache (CacheBackend | None): Cache to store responses in if set.
+        snapshot (FrozenCache | None): Read-only FrozenCache to check before the cache, if set.
+        search_index (SearchIndex | None): SearchIndex to add Comics and search results to, if set.
+        catalog (Catalog | None): Catalog to add Comics to, if set.
+        identity_map (IdentityMap | None): IdentityMap to compact results with, if set.
+        token_store (TokenStore | None): TokenStore to load and save access tokens with, if set.
+        prefetcher (Prefetcher | None): Prefetcher to queue related Comics and Series with, if
+            set, see `Prefetcher`.
+        circuit_breaker (CircuitBreaker | None): CircuitBreaker to stop requests to failing
+            endpoints, if set.
         access_token (str | None): User's Access Token to access League of Comic Geeks.
     """
 
-    _minute_rate = Rate(MINUTE_RATE, Duration.MINUTE)
-    _rates: ClassVar[list[Rate]] = [_minute_rate]
-    _bucket = SQLiteBucket.init_from_file(_rates)  # Save between sessions
-    # Can a `BucketFullException` be raised when used as a decorator?
-    _limiter = Limiter(_bucket, raise_when_fail=False, max_delay=Duration.DAY)
-    decorator = _limiter.as_decorator()
+    _limiter: ClassVar["Limiter | None"] = None
+    _limiter_lock: ClassVar[Lock] = Lock()
 
-    def __init__(
+    def __init__(  # noqa: PLR0917
         self,
         client_id: str,
         client_secret: str,
         access_token: str | None = None,
         timeout: float = 30,
-        cache: SQLiteCache | None = None,
+        cache: CacheBackend | None = None,
+        snapshot: FrozenCache | None = None,
+        search_index: SearchIndex | None = None,
+        catalog: Catalog | None = None,
+        identity_map: IdentityMap | None = None,
+        token_store: TokenStore | None = None,
+        circuit_breaker: CircuitBreaker | None = None,
     ):
+        from httpx import Client  # noqa: PLC0415
+
         self._client = Client(
             base_url="https://leagueofcomicgeeks.com/api",
             headers={
@@ -100,56 +349,244 @@ def __init__(
             timeout=timeout,
         )
         self.cache = cache
-
+        self.snapshot = snapshot
+        self.search_index = search_index
+        self.catalog = catalog
+        self.identity_map = identity_map
+        self.token_store = token_store
+        self.circuit_breaker = circuit_breaker
+        self.prefetcher: Prefetcher | None = None
+
+        self._client_id = client_id
         self._client_secret = client_secret
+        self._token_lock = Lock()
+        if access_token is None and token_store:
+            access_token = token_store.select(client_id=client_id)
         self.access_token = access_token
 
-    @decorator(rate_mapping)
+    @property
+    def _sqlite_cache(self) -> SQLiteCache | None:
+        """The cache if it's a SQLiteCache, which stores misses, entities and identifiers."""
+        return self.cache if isinstance(self.cache, SQLiteCache) else None
+
+    @classmethod
+    def _get_limiter(cls) -> "Limiter":
+        """Create the shared rate limiter on first use, its bucket is saved between sessions.
+
+        Returns:
+            The rate limiter.
+        """
+        with cls._limiter_lock:
+            if cls._limiter is None:
+                from pyrate_limiter import Duration, Limiter, Rate, SQLiteBucket  # noqa: PLC0415
+
+                bucket = SQLiteBucket.init_from_file([Rate(MINUTE_RATE, Duration.MINUTE)])
+                cls._limiter = Limiter(bucket, raise_when_fail=False, max_delay=Duration.DAY)
+        return cls._limiter
+
+    @classmethod
+    def available_tokens(cls) -> int:
+        """Count the requests which can be made now, without waiting for the rate limit.
+
+        Returns:
+            Count of unused rate limit tokens.
+        """
+        bucket = cls._get_limiter().buckets()[0]
+        rate = bucket.rates[0]
+        # Items are timestamped in milliseconds, newest first
+        window_start = int(time() * 1000) - rate.interval
+        used = 0
+        while used < rate.limit:
+            item = bucket.peek(used)
+            if item is None or item.timestamp < window_start:
+                break
+            used += 1
+        return rate.limit - used
+
+    def refresh_access_token(self, expired: str | None = None) -> str:
+        """Request a new access token, saving it to the TokenStore if set.
+
+        Args:
+            expired: The rejected access token, if another thread has already replaced it the
+                new token is returned without making a request.
+
+        Returns:
+            The new access token.
+
+        Raises:
+            ServiceError: If there is an issue with the client id or secret.
+        """
+        with self._token_lock:
+            if expired is not None and self.access_token not in {None, expired}:
+                return self.access_token
+            access_token = self.generate_access_token()
+            self.access_token = access_token
+            self._client.headers["X-API-KEY"] = access_token
+            if self.token_store:
+                self.token_store.insert(client_id=self._client_id, access_token=access_token)
+            return access_token
+
     def _perform_get_request(
-        self, endpoint: str, params: dict[str, str] | None = None
-    ) -> dict[str, Any]:
+        self,
+        endpoint: str,
+        params: dict[str, str] | None = None,
+        headers: dict[str, str] | None = None,
+        stream: bool = False,
+    ) -> "Response":
+        """Make GET request to League of Comic Geeks, refreshing the access token if needed.
+
+        If there's no access token one is requested first, and if the access token is rejected
+        it's refreshed and the request is retried once.
+
+        Args:
+            endpoint: The endpoint to request information from.
+            params: Parameters to add to the request.
+            headers: Headers to add to the request.
+            stream: Return before reading the body, the caller must close the response.
+
+        Returns:
+            Successful or Not Modified response from League of Comic Geeks.
+
+        Raises:
+            RateLimitError: If the API rate limit is exceeded.
+            ServiceError: If there is an issue with the request or response.
+            AuthenticationError:
+                If League of Comic Geeks returns with an invalid API Key or Client Id response.
+            NotFoundError: If League of Comic Geeks returns a not found response.
+        """
+        if endpoint == AUTHORIZE_ENDPOINT or not self._client_secret:
+            return self._send_get_request(
+                endpoint=endpoint, params=params, headers=headers, stream=stream
+            )
+        access_token = self.access_token or self.refresh_access_token()
+        try:
+            return self._send_get_request(
+                endpoint=endpoint, params=params, headers=headers, stream=stream
+            )
+        except AuthenticationError:
+            self.refresh_access_token(expired=access_token)
+        return self._send_get_request(
+            endpoint=endpoint, params=params, headers=headers, stream=stream
+        )
+
+    def _send_get_request(
+        self,
+        endpoint: str,
+        params: dict[str, str] | None = None,
+        headers: dict[str, str] | None = None,
+        stream: bool = False,
+    ) -> "Response":
         """Make GET request to League of Comic Geeks.
 
         Args:
             endpoint: The endpoint to request information from.
             params: Parameters to add to the request.
+            headers: Headers to add to the request.
+            stream: Return before reading the body, the caller must close the response.
 
         Returns:
-            Json response from League of Comic Geeks.
+            Successful or Not Modified response from League of Comic Geeks.
 
         Raises:
             RateLimitError: If the API rate limit is exceeded.
             ServiceError: If there is an issue with the request or response.
             AuthenticationError:
                 If League of Comic Geeks returns with an invalid API Key or Client Id response.
+            NotFoundError: If League of Comic Geeks returns a not found response.
+            CircuitOpenError: If the CircuitBreaker has stopped requests to the endpoint.
         """
+        from httpx import HTTPStatusError, RequestError, TimeoutException  # noqa: PLC0415
+
         if params is None:
             params = {}
 
+        with self._guard(endpoint=endpoint):
+            with stage(name="rate_limit"):
+                self._get_limiter().try_acquire(*rate_mapping())
+            try:
+                request = self._client.build_request(
+                    "GET", endpoint, params=params, headers=headers
+                )
+                with stage(name="http"):
+                    response = self._client.send(request, stream=stream)
+                if response.status_code != HTTPStatus.NOT_MODIFIED:
+                    response.raise_for_status()
+            except TimeoutException as err:
+                raise ServiceError("Service took too long to respond") from err
+            except RequestError as err:
+                raise ServiceError("Unable to connect to '%s'", err.request.url.path) from err
+            except HTTPStatusError as err:
+                err.response.close()
+                if err.response.status_code == HTTPStatus.FORBIDDEN:
+                    raise AuthenticationError("Invalid Access Token") from err
+                if err.response.status_code == HTTPStatus.NOT_FOUND:
+                    raise NotFoundError("Unknown Endpoint") from err
+                if err.response.status_code == HTTPStatus.TOO_MANY_REQUESTS:
+                    period = format_time(err.response.headers["Retry-After"])
+                    raise RateLimitError("Too Many API Requests: Need to wait %s.", period) from err
+                raise ServiceError(err) from err
+        return response
+
+    def _guard(self, endpoint: str) -> AbstractContextManager[None]:
+        """Check the CircuitBreaker, if set, before a request and record its outcome after."""
+        if self.circuit_breaker is not None:
+            return self.circuit_breaker.guard(endpoint=endpoint)
+        return nullcontext()
+
+    @staticmethod
+    def _parse_json(response: "Response") -> Any:  # noqa: ANN401
+        """Parse the Json body of a response.
+
+        Args:
+            response: Response from League of Comic Geeks.
+
+        Returns:
+            Json response from League of Comic Geeks.
+
+        Raises:
+            ServiceError: If the response isn't valid Json.
+        """
         try:
-            response = self._client.get(endpoint, params=params)
-            response.raise_for_status()
-            return response.json()
-        except RequestError as err:
-            raise ServiceError("Unable to connect to '%s'", err.request.url.path) from err
-        except HTTPStatusError as err:
-            if err.response.status_code == codes.FORBIDDEN:
-                raise AuthenticationError("Invalid Access Token") from err
-            if err.response.status_code == codes.NOT_FOUND:
-                raise ServiceError("Unknown Endpoint") from err
-            if err.response.status_code == codes.TOO_MANY_REQUESTS:
-                period = format_time(err.response.headers["Retry-After"])
-                raise RateLimitError("Too Many API Requests: Need to wait %s.", period) from err
-            raise ServiceError(err) from err
+            with stage(name="json"):
+                return response.json()
         except JSONDecodeError as err:
             raise ServiceError("Unable to parse response from as Json") from err
-        except TimeoutException as err:
-            raise ServiceError("Service took too long to respond") from err
+
+    def _select_cached(self, query: str) -> Any:  # noqa: ANN401
+        """Check the snapshot, then the cache, for a response or miss.
+
+        Args:
+            query: Url string used as key.
+
+        Returns:
+            None or the cached Json response.
+
+        Raises:
+            NotFoundError: If a not found response has been cached.
+        """
+        if self.snapshot:
+            snapshot_response = self.snapshot.select(query=query)
+            if snapshot_response:
+                return snapshot_response
+        if not self.cache:
+            return None
+        cached_response = self.cache.select(query=query)
+        if cached_response:
+            return cached_response
+        if self._sqlite_cache is None:
+            return None
+        cached_miss = self._sqlite_cache.select_negative(query=query)
+        if cached_miss:
+            status, response = cached_miss
+            if status == HTTPStatus.NOT_FOUND:
+                raise NotFoundError("Unknown Endpoint")
+            return response
+        return None
 
     def _get_request(
         self, endpoint: str, params: dict[str, str] | None = None, skip_cache: bool = False
     ) -> dict[str, Any]:
-        """Check cache or make GET request to League of Comic Geeks.
+        """Check cache or make GET request to League of Comic Geeks, see `_fetch`.
 
         Args:
             endpoint: The endpoint to request information from.
@@ -158,28 +595,129 @@ def _get_request(
 
         Returns:
             Json response from League of Comic Geeks.
+        """
+        return self._fetch(endpoint=endpoint, params=params, skip_cache=skip_cache)[0]
+
+    def _fetch(
+        self, endpoint: str, params: dict[str, str] | None = None, skip_cache: bool = False
+    ) -> tuple[Any, bool]:
+        """Check cache or make GET request to League of Comic Geeks.
+
+        Expired cache entries are revalidated using their ETag/Last-Modified headers, or the
+        `date_modified` of the response, only refreshing their timestamp if unchanged. While the
+        CircuitBreaker has stopped requests to the endpoint, expired cache entries are returned.
+
+        Args:
+            endpoint: The endpoint to request information from.
+            params: Parameters to add to the request.
+            skip_cache: Don't save or read from the cache.
+
+        Returns:
+            Json response from League of Comic Geeks, and whether it was read from a new response
+            rather than the cache.
 
         Raises:
             ServiceError: If there is an issue with the request or response.
             AuthenticationError:
                 If League of Comic Geeks returns with an invalid API Key or Client Id response.
+            NotFoundError: If League of Comic Geeks returns, or has cached, a not found response.
+            CircuitOpenError:
+                If the CircuitBreaker has stopped requests to the endpoint and nothing is cached.
         """
         if params is None:
             params = {}
 
-        cache_params = f"?{urlencode(params)}" if params else ""
-        cache_key = endpoint + cache_params
+        cache_key = get_cache_key(endpoint=endpoint, params=params)
 
-        if self.cache and not skip_cache:
-            cached_response = self.cache.select(query=cache_key)
-            if cached_response:
-                return cached_response
-        response = self._perform_get_request(endpoint=endpoint, params=params)
-        if self.cache and not skip_cache:
-            self.cache.insert(query=cache_key, response=response)
-        return response
+        if not skip_cache:
+            cached_response = self._select_cached(query=cache_key)
+            if cached_response is not None:
+                return cached_response, False
+        if not self.cache or skip_cache:
+            response = self._perform_get_request(endpoint=endpoint, params=params)
+            return self._parse_json(response=response), True
+
+        response, stale = self._request_or_stale(endpoint=endpoint, params=params, query=cache_key)
+        if response is None:
+            return stale["response"], False
+        result = self._parse_json(response=response)
+        self._cache_response(query=cache_key, result=result, response=response, stale=stale)
+        return result, True
+
+    def _request_or_stale(
+        self, endpoint: str, params: dict[str, str], query: str, stream: bool = False
+    ) -> tuple["Response | None", dict[str, Any]]:
+        """Make GET request to League of Comic Geeks, revalidating the expired cache entry.
+
+        Args:
+            endpoint: The endpoint to request information from.
+            params: Parameters to add to the request.
+            query: Url string used as key.
+            stream: Return before reading the body, the caller must close the response.
+
+        Returns:
+            The response, or None if the expired entry is still to be used, and the expired cache
+            entry of the query, if any.
+
+        Raises:
+            ServiceError: If there is an issue with the request or response.
+            AuthenticationError:
+                If League of Comic Geeks returns with an invalid API Key or Client Id response.
+            NotFoundError: If League of Comic Geeks returns a not found response.
+            CircuitOpenError:
+                If the CircuitBreaker has stopped requests to the endpoint and nothing is cached.
+        """
+        sqlite_cache = self._sqlite_cache
+        stale = sqlite_cache.select_stale(query=query) if sqlite_cache else {}
+        try:
+            response = self._perform_get_request(
+                endpoint=endpoint,
+                params=params,
+                headers=get_conditional_headers(stale=stale),
+                stream=stream,
+            )
+        except NotFoundError:
+            if sqlite_cache:
+                sqlite_cache.insert_negative(query=query, status=HTTPStatus.NOT_FOUND)
+            raise
+        except CircuitOpenError:
+            if stale:
+                return None, stale
+            raise
+        if stale and response.status_code == HTTPStatus.NOT_MODIFIED:
+            response.close()
+            sqlite_cache.touch(query=query)
+            return None, stale
+        return response, stale
+
+    def _cache_response(
+        self,
+        query: str,
+        result: Any,  # noqa: ANN401
+        response: "Response",
+        stale: dict[str, Any],
+    ) -> None:
+        """Store a response, or refresh the timestamp of its expired entry if unchanged.
+
+        Args:
+            query: Url string used as key.
+            result: Json response from League of Comic Geeks.
+            response: Response the result was read from.
+            stale: Expired cache entry of the query, if any.
+        """
+        date_modified = get_date_modified(response=result)
+        if stale and date_modified and date_modified == get_date_modified(stale["response"]):
+            self._sqlite_cache.touch(query=query)
+        elif result:
+            self.cache.insert(
+                query=query,
+                response=result,
+                etag=response.headers.get("ETag"),
+                last_modified=response.headers.get("Last-Modified"),
+            )
+        elif self._sqlite_cache:
+            self._sqlite_cache.insert_negative(query=query, status=HTTPStatus.OK, response=result)
 
-    @decorator(rate_mapping)
     def _str_get_request(self, endpoint: str, params: dict[str, str] | None = None) -> str:
         """Make GET request to League of Comic Geeks, expecting a str response.
 
@@ -195,28 +733,8 @@ def _str_get_request(self, endpoint: str, params: dict[str, str] | None = None)
             AuthenticationError:
                 If League of Comic Geeks returns with an invalid API Key or Client Id response.
         """
-        if params is None:
-            params = {}
-
-        try:
-            response = self._client.get(endpoint, params=params)
-            response.raise_for_status()
-            return response.json()
-        except RequestError as err:
-            raise ServiceError("Unable to connect to '%s'", err.request.url.path) from err
-        except HTTPStatusError as err:
-            if err.response.status_code == codes.FORBIDDEN:
-                raise AuthenticationError("Invalid Access Token") from err
-            if err.response.status_code == codes.NOT_FOUND:
-                raise ServiceError("Unknown Endpoint") from err
-            if err.response.status_code == codes.TOO_MANY_REQUESTS:
-                period = format_time(err.response.headers["Retry-After"])
-                raise RateLimitError("Too Many API Requests: Need to wait %s.", period) from err
-            raise ServiceError(err) from err
-        except JSONDecodeError as err:
-            raise ServiceError("Unable to parse response from as Json") from err
-        except TimeoutException as err:
-            raise ServiceError("Service took too long to respond") from err
+        response = self._perform_get_request(endpoint=endpoint, params=params)
+        return self._parse_json(response=response)
 
     def generate_access_token(self) -> str:
         """Request an access token.
@@ -229,7 +747,7 @@ def generate_access_token(self) -> str:
         """
         if self._client_secret:
             self._client.headers["X-API-KEY"] = self._client_secret
-        return self._str_get_request("/authorize/format/json")
+        return self._str_get_request(AUTHORIZE_ENDPOINT)
 
     def search(self, search_term: str) -> list[GenericComic]:
         """Request a list of search results.
@@ -245,10 +763,115 @@ def search(self, search_term: str) -> list[GenericComic]:
         try:
             if self.access_token:
                 self._client.headers["X-API-KEY"] = self.access_token
-            results = self._get_request("/search/format/json", params={"query": search_term})
-            return TypeAdapter(list[GenericComic]).validate_python(results)
+            results, fetched = self._fetch("/search/format/json", params={"query": search_term})
+            output = _validate(model_type=GenericComic, data=results, many=True)
         except ValidationError as err:
             raise ServiceError(err) from err
+        output = [self._compact(model=x) for x in output]
+        if fetched:
+            self._index_search_results(results=results)
+        return output
+
+    def iter_search(self, search_term: str, limit: int | None = None) -> Generator[GenericComic]:
+        """Stream a list of search results, validating each as it's read.
+
+        Results are decoded from the response as it arrives, so the first is available before
+        the rest have downloaded. The results are only cached once every one has been read.
+        Expired results are revalidated, and used while the CircuitBreaker has stopped requests,
+        as by `search`.
+
+        Args:
+            search_term: Search query string
+            limit: Stop after this many results.
+
+        Returns:
+            Each result, in the order returned.
+
+        Raises:
+            ServiceError: If there is an issue with the request or validating a result.
+            AuthenticationError:
+                If League of Comic Geeks returns with an invalid API Key or Client Id response.
+        """
+        if self.access_token:
+            self._client.headers["X-API-KEY"] = self.access_token
+        endpoint = "/search/format/json"
+        params = {"query": search_term}
+        cache_key = get_cache_key(endpoint=endpoint, params=params)
+        try:
+            cached_response = self._select_cached(query=cache_key)
+            if cached_response is None:
+                response, stale = self._request_or_stale(
+                    endpoint=endpoint, params=params, query=cache_key, stream=True
+                )
+                if response is None:
+                    cached_response = stale["response"]
+            if cached_response is not None:
+                for result in cached_response[:limit]:
+                    yield self._compact(model=_validate(model_type=GenericComic, data=result))
+                return
+            results = []
+            if not (yield from self._iter_results(response=response, results=results, limit=limit)):
+                return
+        except ValidationError as err:
+            raise ServiceError(err) from err
+        except ValueError as err:
+            raise ServiceError("Unable to parse response from as Json") from err
+        if self.cache:
+            self._cache_response(query=cache_key, result=results, response=response, stale=stale)
+        self._index_search_results(results=results)
+
+    def _iter_results(
+        self, response: "Response", results: list[dict[str, Any]], limit: int | None
+    ) -> Generator[GenericComic, None, bool]:
+        """Validate each search result as it's read from a streamed response, then close it.
+
+        Args:
+            response: Streamed response from League of Comic Geeks.
+            results: List to add the Json of each result to.
+            limit: Stop after this many results.
+
+        Returns:
+            Each result, then whether every result was read.
+        """
+        try:
+            for result in iter_json_array(chunks=response.iter_text()):
+                output = self._compact(model=_validate(model_type=GenericComic, data=result))
+                results.append(result)
+                yield output
+                if limit is not None and len(results) >= limit:
+                    return False
+        finally:
+            response.close()
+        return True
+
+    def search_local(
+        self, search_term: str, limit: int = 50, fallback: bool = False
+    ) -> list[GenericComic]:
+        """Search the SearchIndex of cached Comics, without making a request.
+
+        Args:
+            search_term: Search query string, each word is matched as a prefix.
+            limit: Maximum count of results.
+            fallback: Use the search endpoint if nothing in the index matches.
+
+        Returns:
+            A list of results, best matches first.
+
+        Raises:
+            ServiceError: If there is no SearchIndex set or an issue with validating the results.
+        """
+        if not self.search_index:
+            raise ServiceError("A SearchIndex is required to search locally")
+        try:
+            results = self.search_index.search(search_term=search_term, limit=limit)
+            if results:
+                output = _validate(model_type=GenericComic, data=results, many=True)
+                return [self._compact(model=x) for x in output]
+        except ValidationError as err:
+            raise ServiceError(err) from err
+        if fallback:
+            return self.search(search_term=search_term)[:limit]
+        return []
 
     def get_series(self, series_id: int) -> Series:
         """Request data for a Series based on its id.
@@ -263,14 +886,23 @@ def get_series(self, series_id: int) -> Series:
             ServiceError: If there is an issue with validating the response.
         """
         try:
-            if self.access_token:
-                self._client.headers["X-API-KEY"] = self.access_token
-            result = self._get_request("/series/format/json", params={"series_id": str(series_id)})
-            if "details" in result:
-                result = result["details"]
-            return TypeAdapter(Series).validate_python(result)
+            result = None
+            if self._sqlite_cache:
+                result = self._sqlite_cache.select_entity(entity_type="series", entity_id=series_id)
+            if not result:
+                if self.access_token:
+                    self._client.headers["X-API-KEY"] = self.access_token
+                result = self._get_request(
+                    "/series/format/json", params={"series_id": str(series_id)}
+                )
+                if "details" in result:
+                    result = result["details"]
+            output = self._compact(model=_validate(model_type=Series, data=result))
         except ValidationError as err:
             raise ServiceError(err) from err
+        if self.prefetcher is not None:
+            self.prefetcher.queue_series(series=output)
+        return output
 
     def get_comic(self, comic_id: int) -> Comic:
         """Request data for a Comic based on its id.
@@ -287,7 +919,97 @@ def get_comic(self, comic_id: int) -> Comic:
         try:
             if self.access_token:
                 self._client.headers["X-API-KEY"] = self.access_token
-            result = self._get_request("/comic/format/json", params={"comic_id": str(comic_id)})
-            return TypeAdapter(Comic).validate_python(result)
+            result, fetched = self._fetch("/comic/format/json", params={"comic_id": str(comic_id)})
+            output = self._compact(model=_validate(model_type=Comic, data=result))
         except ValidationError as err:
             raise ServiceError(err) from err
+        if fetched:
+            self._index_comic(result=result, comic=output)
+        if self.prefetcher is not None:
+            self.prefetcher.queue_comic(comic=output)
+        return output
+
+    def lookup_by_identifier(self, identifier: str | int, kind: str | None = None) -> int | None:
+        """Find the id of a cached Comic or Variant using its UPC, ISBN or SKU.
+
+        Identifiers are recorded as Comics are requested, so this never makes a request.
+
+        Args:
+            identifier: Value of the identifier, such as a scanned barcode.
+            kind: Only match this kind of identifier, such as `upc`, `isbn`, `sku` or
+                `sku_diamond`.
+
+        Returns:
+            None or the Comic id.
+        """
+        if not self._sqlite_cache:
+            return None
+        return self._sqlite_cache.select_identifier(value=identifier, kind=kind)
+
+    def is_cached(self, kind: str, entity_id: int) -> bool:
+        """Check if a Comic or Series can be read without making a request.
+
+        Args:
+            kind: Either `comic` or `series`.
+            entity_id: The Comic or Series id.
+
+        Returns:
+            True if the snapshot or cache has a fresh response, or miss, for the id, or a Series
+            embedded in a cached Comic.
+        """
+        endpoint, param = ENDPOINTS[kind]
+        query = get_cache_key(endpoint=endpoint, params={param: str(entity_id)})
+        if self.snapshot and query in self.snapshot:
+            return True
+        if not self.cache:
+            return False
+        if (
+            kind == "series"
+            and self._sqlite_cache
+            and self._sqlite_cache.select_entity(entity_type="series", entity_id=entity_id)
+        ):
+            return True
+        return self.cache.contains(query=query)
+
+    def _compact(self, model: T) -> T:
+        """Compact a validated model using the IdentityMap, if set."""
+        if self.identity_map is not None:
+            return self.identity_map.compact(model=model)
+        return model
+
+    def _index_search_results(self, results: list[dict[str, Any]]) -> None:
+        """Add newly requested search results to the entities and SearchIndex.
+
+        Args:
+            results: Json search results.
+        """
+        if not results:
+            return
+        if self._sqlite_cache:
+            self._sqlite_cache.insert_entities(entity_type="generic_comic", entities=results)
+        if self.search_index:
+            self.search_index.index_generic_comics(results=results)
+
+    def _index_comic(self, result: dict[str, Any], comic: Comic) -> None:
+        """Add a newly requested Comic to the entities, identifiers, SearchIndex and Catalog.
+
+        Cache hits were added when they were requested, or by `rebuild_identifiers`, so are skipped
+        by the callers.
+
+        Args:
+            result: Json response of the Comic from League of Comic Geeks.
+            comic: The validated Comic.
+        """
+        entities = get_entities(result=result)
+        if self._sqlite_cache:
+            _insert_index(
+                cache=self._sqlite_cache,
+                entities=entities,
+                identifiers=get_identifiers(comic=comic),
+            )
+        if self.search_index:
+            self.search_index.index_comic(result=result)
+            if entities["generic_comic"]:
+                self.search_index.index_generic_comics(results=entities["generic_comic"])
+        if self.catalog:
+            self.catalog.add_comic(comic=comic)
@@ -0,0 +1,160 @@
+"""The MemoryCache module.
+
+This module provides the following classes:
+
+- MemoryCache
+"""
+
+__all__ = ["MemoryCache"]
+
+import json
+from collections import OrderedDict
+from collections.abc import Iterable
+from datetime import datetime, timedelta, timezone
+from threading import Lock
+from typing import Any
+
+from himon.cache_backend import CacheStats
+
+
+class MemoryCache:
+    """The MemoryCache object caches responses in memory, for the life of the process.
+
+    Responses are stored as Json text, so callers never share or modify a cached copy. Once
+    `max_entries` responses are cached, the least recently used is removed.
+
+    Args:
+        expiry: How long to keep cache results (in days).
+        max_entries: Count of responses to keep, unlimited if not set.
+    """
+
+    def __init__(self, expiry: int | None = 14, max_entries: int | None = None):
+        self._expiry = expiry
+        self._max_entries = max_entries
+        self._entries: OrderedDict[str, tuple[datetime, str]] = OrderedDict()
+        self._lock = Lock()
+        self._hits = 0
+        self._misses = 0
+
+    def _is_fresh(self, timestamp: datetime) -> bool:
+        return not self._expiry or timestamp > datetime.now(tz=timezone.utc) - timedelta(
+            days=self._expiry
+        )
+
+    def _get(self, query: str) -> str | None:
+        entry = self._entries.get(query)
+        if entry is None or not self._is_fresh(timestamp=entry[0]):
+            self._misses += 1
+            return None
+        self._entries.move_to_end(query)
+        self._hits += 1
+        return entry[1]
+
+    def select(self, query: str) -> Any:  # noqa: ANN401
+        """Retrieve a fresh response.
+
+        Args:
+            query: Url string used as key.
+
+        Returns:
+            Empty dict or the cached response.
+        """
+        with self._lock:
+            data = self._get(query=query)
+        return json.loads(data) if data is not None else {}
+
+    def select_many(self, queries: Iterable[str]) -> dict[str, Any]:
+        """Retrieve the fresh responses of many queries at once.
+
+        Args:
+            queries: Url strings used as keys.
+
+        Returns:
+            The cached response of each query found.
+        """
+        with self._lock:
+            found = {x: self._get(query=x) for x in dict.fromkeys(queries)}
+        return {query: json.loads(data) for query, data in found.items() if data is not None}
+
+    def insert(
+        self,
+        query: str,
+        response: Any,  # noqa: ANN401
+        etag: str | None = None,  # noqa: ARG002
+        last_modified: str | None = None,  # noqa: ARG002
+    ) -> None:
+        """Store a response, replacing any existing one.
+
+        Args:
+            query: Url string used as key.
+            response: Response dict from url.
+            etag: Unused, expired responses aren't kept for revalidation.
+            last_modified: Unused, expired responses aren't kept for revalidation.
+        """
+        self.insert_many(entries={query: response})
+
+    def insert_many(self, entries: dict[str, Any]) -> None:
+        """Store many responses at once, replacing any existing ones.
+
+        Args:
+            entries: Response of each url string.
+        """
+        timestamp = datetime.now(tz=timezone.utc)
+        data = {query: json.dumps(response) for query, response in entries.items()}
+        with self._lock:
+            for query, value in data.items():
+                self._entries[query] = (timestamp, value)
+                self._entries.move_to_end(query)
+            while self._max_entries is not None and len(self._entries) > self._max_entries:
+                self._entries.popitem(last=False)
+
+    def contains(self, query: str) -> bool:
+        """Check if there's a fresh response, without loading it.
+
+        Args:
+            query: Url string used as key.
+
+        Returns:
+            True if a fresh response exists.
+        """
+        with self._lock:
+            entry = self._entries.get(query)
+            return entry is not None and self._is_fresh(timestamp=entry[0])
+
+    def delete(self, query: str) -> None:
+        """Remove a response.
+
+        Args:
+            query: Url string used as key.
+        """
+        self.delete_many(queries=[query])
+
+    def delete_many(self, queries: Iterable[str]) -> None:
+        """Remove many responses at once.
+
+        Args:
+            queries: Url strings used as keys.
+        """
+        with self._lock:
+            for query in queries:
+                self._entries.pop(query, None)
+
+    def cleanup(self) -> None:
+        """Remove every expired response."""
+        with self._lock:
+            for query in [k for k, v in self._entries.items() if not self._is_fresh(v[0])]:
+                del self._entries[query]
+
+    def stats(self) -> CacheStats:
+        """Measure the size and usage of the cache.
+
+        Returns:
+            The count and size of the cached responses, and the hits and misses of selects.
+        """
+        with self._lock:
+            return CacheStats(
+                entries=len(self._entries),
+                size=sum(len(x[1]) for x in self._entries.values()),
+                hits=self._hits,
+                misses=self._misses,
+            )
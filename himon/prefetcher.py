@@ -0,0 +1,176 @@
+"""The Prefetcher module.
+
+This module provides the following classes:
+
+- Prefetcher
+"""
+
+__all__ = ["Prefetcher"]
+
+from collections import deque
+from threading import Condition, Thread, current_thread
+
+from himon.exceptions import RateLimitError
+from himon.league_of_comic_geeks import LeagueOfComicGeeks
+from himon.schemas.comic import Comic
+from himon.schemas.series import Series
+
+
+class Prefetcher:
+    """Request the Comics and Series related to each result in the background, caching them.
+
+    Once attached, every `get_comic` queues the parent, variants, collected in/collected issues
+    and series of the Comic, and every `get_series` queues its first issue. Queued ids are only
+    requested while at least `reserve` rate limit tokens are unused, so they never delay other
+    requests. The newest ids are requested first, and the oldest are dropped once `max_queue`
+    ids are waiting. Results of prefetched requests aren't prefetched themselves. Failed ids
+    are dropped, except those stopped by the API rate limit, which are requeued after a pause.
+
+    Args:
+        session: LeagueOfComicGeeks session, with a cache set, the Prefetcher attaches itself to.
+        reserve: Count of rate limit tokens left unused for other requests.
+        max_queue: Count of ids waiting to be requested.
+        poll_interval: How long to wait (in seconds) for rate limit tokens to become unused.
+        backoff: How long to pause (in seconds) once the API rate limit is exceeded.
+
+    Raises:
+        ValueError: If the session has no cache set.
+    """
+
+    def __init__(
+        self,
+        session: LeagueOfComicGeeks,
+        reserve: int = 5,
+        max_queue: int = 100,
+        poll_interval: float = 1,
+        backoff: float = 60,
+    ):
+        if not session.cache:
+            raise ValueError("Prefetcher requires a session with a cache")
+        self.session = session
+        self.reserve = reserve
+        self.poll_interval = poll_interval
+        self.backoff = backoff
+        self._queue: deque[tuple[str, int]] = deque(maxlen=max_queue)
+        self._in_flight = 0
+        self._closed = False
+        self._condition = Condition()
+        self._thread = Thread(target=self._run, name="himon-prefetcher", daemon=True)
+        self._thread.start()
+        session.prefetcher = self
+
+    def __len__(self) -> int:
+        """Count of ids waiting to be requested."""
+        with self._condition:
+            return len(self._queue)
+
+    def queue(self, kind: str, ids: list[int]) -> None:
+        """Queue ids to be requested, skipping those already queued.
+
+        Args:
+            kind: Either `comic` or `series`.
+            ids: The ids to request.
+        """
+        if current_thread() is self._thread:
+            return
+        with self._condition:
+            for entity_id in dict.fromkeys(ids):
+                if entity_id and (kind, entity_id) not in self._queue:
+                    self._queue.append((kind, entity_id))
+            self._condition.notify_all()
+
+    def queue_comic(self, comic: Comic) -> None:
+        """Queue the Comics and Series related to a Comic.
+
+        Args:
+            comic: The Comic which was requested.
+        """
+        self.queue(
+            kind="comic",
+            ids=[
+                *(x.id for x in comic.collected_issues),
+                *(x.id for x in comic.collected_in),
+                *(x.id for x in comic.variants),
+                comic.parent_id,
+            ],
+        )
+        self.queue(kind="series", ids=[comic.series.id])
+
+    def queue_series(self, series: Series) -> None:
+        """Queue the first issue of a Series.
+
+        Args:
+            series: The Series which was requested.
+        """
+        self.queue(kind="comic", ids=[series.first_issue_id])
+
+    def _next(self) -> tuple[str, int] | None:
+        """Wait for a queued id, None once closed."""
+        with self._condition:
+            self._condition.wait_for(lambda: self._queue or self._closed)
+            if self._closed:
+                return None
+            self._in_flight += 1
+            return self._queue.pop()
+
+    def _wait_for_tokens(self) -> bool:
+        """Wait until more than `reserve` rate limit tokens are unused, False once closed."""
+        with self._condition:
+            while not self._closed:
+                if self.session.available_tokens() > self.reserve:
+                    return True
+                self._condition.wait(timeout=self.poll_interval)
+        return False
+
+    def _requeue(self, item: tuple[str, int]) -> None:
+        """Queue an id stopped by the API rate limit again, then pause until closed or resumed."""
+        with self._condition:
+            if item not in self._queue:
+                self._queue.append(item)
+            self._condition.wait_for(lambda: self._closed, timeout=self.backoff)
+
+    def _run(self) -> None:
+        while (item := self._next()) is not None:
+            kind, entity_id = item
+            try:
+                if (
+                    not self.session.is_cached(kind=kind, entity_id=entity_id)
+                    and self._wait_for_tokens()
+                ):
+                    if kind == "comic":
+                        self.session.get_comic(comic_id=entity_id)
+                    else:
+                        self.session.get_series(series_id=entity_id)
+            except RateLimitError:
+                self._requeue(item=item)
+            except Exception:  # noqa: BLE001, S110
+                # Failed ids are left to be requested directly, the thread must keep running
+                pass
+            finally:
+                with self._condition:
+                    self._in_flight -= 1
+                    self._condition.notify_all()
+
+    def join(self, timeout: float | None = None) -> bool:
+        """Wait until every queued id has been requested.
+
+        Args:
+            timeout: How long to wait (in seconds), forever if not set.
+
+        Returns:
+            True if the queue is empty, False if the timeout was reached first.
+        """
+        with self._condition:
+            return self._condition.wait_for(
+                lambda: not self._queue and not self._in_flight, timeout=timeout
+            )
+
+    def close(self) -> None:
+        """Stop requesting queued ids and detach from the session."""
+        with self._condition:
+            self._closed = True
+            self._queue.clear()
+            self._condition.notify_all()
+        self._thread.join()
+        if self.session.prefetcher is self:
+            self.session.prefetcher = None
@@ -0,0 +1,192 @@
+"""The Profiling module.
+
+This module provides the following classes:
+
+- Profile
+- StageStats
+
+This module provides the following functions:
+
+- profile
+- stage
+"""
+
+__all__ = ["Profile", "StageStats", "profile", "stage"]
+
+import cProfile
+import io
+import pstats
+import tracemalloc
+from collections.abc import Generator
+from contextlib import contextmanager
+from dataclasses import dataclass
+from pathlib import Path
+from threading import Lock
+from time import perf_counter
+
+_active: "Profile | None" = None
+
+
+@dataclass
+class StageStats:
+    """The StageStats object contains the totals of one stage of a request.
+
+    Attributes:
+        calls: Count of times the stage ran.
+        seconds: Total time spent in the stage.
+        allocated: Total bytes of memory allocated, and still held, when the stage ended.
+    """
+
+    calls: int = 0
+    seconds: float = 0
+    allocated: int = 0
+
+
+class Profile:
+    """The Profile object collects CPU and allocation statistics, bucketed by stage.
+
+    Stages are `rate_limit`, `http`, `cache`, `json` and `validate:<Model>`. Stage timings are
+    collected from every thread, but the cProfile statistics only cover the thread which
+    started profiling.
+
+    Args:
+        memory: Trace allocations using tracemalloc, this slows down the profiled code.
+
+    Attributes:
+        stages (dict[str, StageStats]): Totals for each stage.
+        stats (pstats.Stats | None): cProfile statistics, once profiling has stopped.
+        snapshot (tracemalloc.Snapshot | None): Allocations, once profiling has stopped.
+    """
+
+    def __init__(self, memory: bool = True):
+        self.memory = memory
+        self.stages: dict[str, StageStats] = {}
+        self.stats: pstats.Stats | None = None
+        self.snapshot: tracemalloc.Snapshot | None = None
+        self._profiler = cProfile.Profile()
+        self._lock = Lock()
+        self._started_tracing = False
+
+    def start(self) -> None:
+        """Start collecting statistics."""
+        if self.memory and not tracemalloc.is_tracing():
+            tracemalloc.start()
+            self._started_tracing = True
+        self._profiler.enable()
+
+    def stop(self) -> None:
+        """Stop collecting statistics."""
+        self._profiler.disable()
+        self.stats = pstats.Stats(self._profiler)
+        if self.memory and tracemalloc.is_tracing():
+            self.snapshot = tracemalloc.take_snapshot()
+            if self._started_tracing:
+                tracemalloc.stop()
+
+    def add(self, name: str, seconds: float, allocated: int = 0) -> None:
+        """Record a run of a stage.
+
+        Args:
+            name: Name of the stage.
+            seconds: Time spent in the stage.
+            allocated: Bytes of memory allocated, and still held, during the stage.
+        """
+        with self._lock:
+            stats = self.stages.setdefault(name, StageStats())
+            stats.calls += 1
+            stats.seconds += seconds
+            stats.allocated += max(allocated, 0)
+
+    def summary(self, limit: int = 10) -> str:
+        """Build a report of the stages, slowest functions and largest allocations.
+
+        Args:
+            limit: Count of functions and allocations to include.
+
+        Returns:
+            The report as text.
+        """
+        lines = [f"{'Stage':<24} {'Calls':>7} {'Total (s)':>10} {'Mean (ms)':>10} {'KiB':>10}"]
+        for name, stats in sorted(self.stages.items(), key=lambda x: -x[1].seconds):
+            lines.append(
+                f"{name:<24} {stats.calls:>7} {stats.seconds:>10.3f} "
+                f"{stats.seconds / stats.calls * 1000:>10.2f} {stats.allocated / 1024:>10.1f}"
+            )
+        if self.stats:
+            stream = io.StringIO()
+            pstats.Stats(self._profiler, stream=stream).sort_stats("cumulative").print_stats(limit)
+            lines.extend(["", stream.getvalue().strip()])
+        if self.snapshot:
+            lines.extend(["", "Largest allocations:"])
+            lines.extend(str(x) for x in self.snapshot.statistics("lineno")[:limit])
+        return "\n".join(lines)
+
+    def dump(self, path: Path) -> None:
+        """Write the statistics to files, for use with tools such as snakeviz.
+
+        Writes the cProfile statistics to `path`, the summary to `path` with a `.txt` suffix, and
+        the allocations to `path` with a `.tracemalloc` suffix.
+
+        Args:
+            path: Path to write the cProfile statistics to.
+        """
+        if self.stats:
+            self.stats.dump_stats(path)
+        path.with_suffix(".txt").write_text(self.summary(), encoding="UTF-8")
+        if self.snapshot:
+            self.snapshot.dump(str(path.with_suffix(".tracemalloc")))
+
+
+@contextmanager
+def profile(memory: bool = True, path: Path | None = None) -> Generator[Profile]:
+    """Profile the LeagueOfComicGeeks calls made inside the block.
+
+    Can also be used as a decorator, set `path` to keep the statistics.
+
+    Args:
+        memory: Trace allocations using tracemalloc, this slows down the profiled code.
+        path: Dump the statistics to this path when the block ends, see `Profile.dump`.
+
+    Returns:
+        The Profile, its statistics are available once the block ends.
+
+    Raises:
+        RuntimeError: If a profile is already active.
+    """
+    global _active  # noqa: PLW0603
+    if _active is not None:
+        raise RuntimeError("Only one profile can be active at a time")
+    output = Profile(memory=memory)
+    _active = output
+    output.start()
+    try:
+        yield output
+    finally:
+        output.stop()
+        _active = None
+        if path:
+            output.dump(path=path)
+
+
+@contextmanager
+def stage(name: str) -> Generator[None]:
+    """Record the time and memory spent in a stage, if a profile is active.
+
+    Args:
+        name: Name of the stage, such as `http` or `validate:Comic`.
+    """
+    active = _active
+    if active is None:
+        yield
+        return
+    tracing = tracemalloc.is_tracing()
+    memory = tracemalloc.get_traced_memory()[0] if tracing else 0
+    start = perf_counter()
+    try:
+        yield
+    finally:
+        active.add(
+            name=name,
+            seconds=perf_counter() - start,
+            allocated=tracemalloc.get_traced_memory()[0] - memory if tracing else 0,
+        )
@@ -3,11 +3,59 @@
 This module provides the following classes:
 
 - BaseModel
+
+This module provides the following functions:
+
+- get_adapter
+
+The models from the submodules, such as Comic and Series, are also available from the package,
+they're imported on first access.
 """
 
-__all__ = ["BaseModel"]
+__all__ = [
+    "BaseModel",
+    "CharacterType",
+    "Comic",
+    "ComicFormat",
+    "CoverType",
+    "GenericComic",
+    "GenericCover",
+    "KeyEventType",
+    "Series",
+    "get_adapter",
+]
+
+from functools import cache
+from importlib import import_module
+from typing import Any, Final, TypeVar
+
+from pydantic import BaseModel as PydanticModel, TypeAdapter
+
+T = TypeVar("T", bound="BaseModel")
 
-from pydantic import BaseModel as PydanticModel
+LAZY_ATTRIBUTES: Final[dict[str, str]] = {
+    "CharacterType": "himon.schemas.comic",
+    "Comic": "himon.schemas.comic",
+    "ComicFormat": "himon.schemas.generic",
+    "CoverType": "himon.schemas.generic",
+    "GenericComic": "himon.schemas.generic",
+    "GenericCover": "himon.schemas.generic",
+    "KeyEventType": "himon.schemas.comic",
+    "Series": "himon.schemas.series",
+}
+
+
+def __getattr__(name: str) -> Any:  # noqa: ANN401
+    """Import the models from their submodule on first access."""
+    if name in LAZY_ATTRIBUTES:
+        return getattr(import_module(LAZY_ATTRIBUTES[name]), name)
+    msg = f"module {__name__!r} has no attribute {name!r}"
+    raise AttributeError(msg)
+
+
+def __dir__() -> list[str]:
+    """List the module attributes, including the lazily imported models."""
+    return sorted({*globals(), *LAZY_ATTRIBUTES})
 
 
 class BaseModel(
@@ -17,5 +65,44 @@ class BaseModel(
     validate_assignment=True,
     revalidate_instances="always",
     extra="forbid",
+    defer_build=True,
 ):
-    """Base model for himon resources."""
+    """Base model for himon resources.
+
+    Validators are built on first use instead of when the model is defined, keeping imports fast.
+    """
+
+    def to_bytes(self) -> bytes:
+        """Serialize into a compact binary payload, see `himon.serialization.to_bytes`."""
+        from himon.serialization import to_bytes  # noqa: PLC0415
+
+        return to_bytes(model=self)
+
+    @classmethod
+    def from_bytes(cls: type[T], data: bytes, trusted: bool = False) -> T:  # noqa: PYI019
+        """Deserialize a payload, see `himon.serialization.from_bytes`.
+
+        Args:
+            data: The serialized model.
+            trusted: Skip validation, only use for payloads Himon created.
+
+        Returns:
+            The deserialized model.
+        """
+        from himon.serialization import from_bytes  # noqa: PLC0415
+
+        return from_bytes(data=data, model_type=cls, trusted=trusted)
+
+
+@cache
+def get_adapter(model_type: type[BaseModel], many: bool = False) -> TypeAdapter:
+    """Get the shared TypeAdapter of a model, or list of models, building it on first use.
+
+    Args:
+        model_type: Type of model to validate.
+        many: Validate a list of the model instead.
+
+    Returns:
+        The TypeAdapter, cached for reuse.
+    """
+    return TypeAdapter(list[model_type] if many else model_type)
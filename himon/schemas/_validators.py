@@ -16,6 +16,8 @@ def validate_bool(value: str) -> bool:
     Raises:
         ValueError: If value isn't a 0/1
     """
+    if isinstance(value, bool):
+        return value
     if str(value) == "0":
         return False
     if str(value) == "1":
@@ -31,6 +33,8 @@ def validate_date(value: str) -> date | None:
     Return:
         Value mapped as None or date
     """
+    if isinstance(value, date):
+        return value
     if not value or value == "0000-00-00":
         return None
     try:
@@ -279,7 +279,7 @@ class Comic(BaseModel):
     variants: list[Variant] = Field(default_factory=list)
 
     def __init__(self, **data: Any):
-        for key, value in data["details"].items():
+        for key, value in data.get("details", {}).items():
             data[key] = value  # noqa: PERF403
         del_fields = (
             "details",
@@ -297,5 +297,5 @@ def __init__(self, **data: Any):
             "listed_members_count",
         )
         for field in del_fields:
-            del data[field]
+            data.pop(field, None)
         super().__init__(**data)
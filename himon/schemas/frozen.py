@@ -0,0 +1,143 @@
+"""The Frozen module.
+
+This module provides the following classes:
+
+- FrozenCharacter
+- FrozenComic
+- FrozenCreator
+- FrozenGenericComic
+- FrozenGenericCover
+- FrozenKeyEvent
+- FrozenModel
+- FrozenSeries
+- FrozenVariant
+
+This module provides the following functions:
+
+- freeze
+"""
+
+__all__ = [
+    "FrozenCharacter",
+    "FrozenComic",
+    "FrozenCreator",
+    "FrozenGenericComic",
+    "FrozenGenericCover",
+    "FrozenKeyEvent",
+    "FrozenModel",
+    "FrozenSeries",
+    "FrozenVariant",
+    "freeze",
+]
+
+from typing import Final
+
+from himon.schemas import BaseModel
+from himon.schemas.comic import Character, Comic, Creator, KeyEvent, Variant
+from himon.schemas.generic import GenericComic, GenericCover
+from himon.schemas.series import Series
+
+
+class FrozenModel(BaseModel, frozen=True, revalidate_instances="never"):
+    """Base model for immutable himon resources.
+
+    Instances are hashable by their type, id and `date_modified`, and aren't validated again
+    when nested inside another model.
+    """
+
+    def __hash__(self) -> int:
+        """Hash by the type, id and `date_modified` of the resource."""
+        return hash((type(self), self.id, getattr(self, "date_modified", None)))
+
+
+class FrozenSeries(FrozenModel, Series, frozen=True, revalidate_instances="never"):
+    """The FrozenSeries object is an immutable, hashable Series."""
+
+
+class FrozenGenericComic(FrozenModel, GenericComic, frozen=True, revalidate_instances="never"):
+    """The FrozenGenericComic object is an immutable, hashable GenericComic."""
+
+
+class FrozenGenericCover(FrozenModel, GenericCover, frozen=True, revalidate_instances="never"):
+    """The FrozenGenericCover object is an immutable, hashable GenericCover."""
+
+
+class FrozenCharacter(FrozenModel, Character, frozen=True, revalidate_instances="never"):
+    """The FrozenCharacter object is an immutable, hashable Character."""
+
+
+class FrozenCreator(FrozenModel, Creator, frozen=True, revalidate_instances="never"):
+    """The FrozenCreator object is an immutable, hashable Creator."""
+
+
+class FrozenKeyEvent(FrozenModel, KeyEvent, frozen=True, revalidate_instances="never"):
+    """The FrozenKeyEvent object is an immutable, hashable KeyEvent."""
+
+
+class FrozenVariant(FrozenModel, Variant, frozen=True, revalidate_instances="never"):
+    """The FrozenVariant object is an immutable, hashable Variant."""
+
+
+class FrozenComic(FrozenModel, Comic, frozen=True, revalidate_instances="never"):
+    """The FrozenComic object is an immutable, hashable Comic, its lists are tuples.
+
+    Attributes:
+        characters: Tuple of Characters in the Issue.
+        collected_in: Tuple of Issues this has been collected in.
+        collected_issues: Tuple of Issues this has collected.
+        covers: Tuple of Covers associated with the Issue.
+        creators: Tuple of Creators associated with the Issue
+        keys: Tuple of Key Events taken place in the Issue.
+        series: The series this Issue comes from.
+        variants: Tuple of variants this Issue has.
+    """
+
+    characters: tuple[FrozenCharacter, ...] = ()
+    collected_in: tuple[FrozenGenericComic, ...] = ()
+    collected_issues: tuple[FrozenGenericComic, ...] = ()
+    covers: tuple[FrozenGenericCover, ...] = ()
+    creators: tuple[FrozenCreator, ...] = ()
+    keys: tuple[FrozenKeyEvent, ...] = ()
+    series: FrozenSeries
+    variants: tuple[FrozenVariant, ...] = ()
+
+
+FROZEN_MODELS: Final[dict[type[BaseModel], type[FrozenModel]]] = {
+    Character: FrozenCharacter,
+    Comic: FrozenComic,
+    Creator: FrozenCreator,
+    GenericComic: FrozenGenericComic,
+    GenericCover: FrozenGenericCover,
+    KeyEvent: FrozenKeyEvent,
+    Series: FrozenSeries,
+    Variant: FrozenVariant,
+}
+
+
+def freeze(model: BaseModel) -> FrozenModel:
+    """Copy an already validated model into its frozen variant, without validating it again.
+
+    Args:
+        model: Model to freeze, such as a Comic or Series.
+
+    Returns:
+        The frozen variant, lists are converted to tuples.
+
+    Raises:
+        TypeError: If the model has no frozen variant.
+    """
+    if isinstance(model, FrozenModel):
+        return model
+    frozen_type = FROZEN_MODELS.get(type(model))
+    if frozen_type is None:
+        msg = f"{type(model).__name__} has no frozen variant"
+        raise TypeError(msg)
+    values = {}
+    for field, value in model.__dict__.items():
+        if isinstance(value, BaseModel):
+            values[field] = freeze(model=value)
+        elif isinstance(value, list):
+            values[field] = tuple(freeze(model=x) if isinstance(x, BaseModel) else x for x in value)
+        else:
+            values[field] = value
+    return frozen_type.model_construct(_fields_set=model.model_fields_set, **values)
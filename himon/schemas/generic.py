@@ -96,7 +96,7 @@ def __init__(self, **data: Any):
             "my_rating_dec",
         )
         for field in del_fields:
-            del data[field]
+            data.pop(field, None)
         super().__init__(**data)
 
 
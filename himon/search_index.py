@@ -0,0 +1,217 @@
+"""The SearchIndex module.
+
+This module provides the following classes:
+
+- SearchIndex
+"""
+
+__all__ = ["SearchIndex"]
+
+import json
+import re
+import sqlite3
+from collections.abc import Generator
+from contextlib import contextmanager
+from pathlib import Path
+from typing import Any
+
+from himon import get_cache_root
+from himon.sqlite_cache import SQLiteCache
+
+
+def _generic_from_comic(result: dict[str, Any]) -> dict[str, Any]:
+    """Convert a Comic response into the format of a GenericComic search result.
+
+    Args:
+        result: Json response of a Comic from League of Comic Geeks.
+
+    Returns:
+        Dict which validates as a GenericComic.
+    """
+    details = result["details"]
+    series = result.get("series") or {}
+    return {
+        "id": details["id"],
+        "parent_id": details.get("parent_id"),
+        "publisher_id": details["publisher_id"],
+        "publisher_name": details["publisher_name"],
+        "series_id": details["series_id"],
+        "series_name": series.get("title", ""),
+        "series_volume": series.get("volume"),
+        "series_end": series.get("year_end"),
+        "series_begin": series.get("year_begin", 0),
+        "title": details["title"],
+        "parent_title": details.get("parent_title"),
+        "date_release": details["date_release"],
+        "date_foc": details.get("date_foc"),
+        "description": details.get("description"),
+        "format": details["format"],
+        "variant": details["variant"],
+        "price": details.get("price"),
+        "cover": details["cover"],
+        "count_pulls": details["count_pulls"],
+        "date_modified": details["date_modified"],
+        "enabled": details["enabled"],
+    }
+
+
+def _match_query(search_term: str) -> str:
+    """Convert a search term into a FTS5 query, matching every word as a prefix."""
+    words = re.findall(r"\w+", search_term)
+    return " ".join(f'"{x}"*' for x in words)
+
+
+class SearchIndex:
+    """The SearchIndex object is an offline full-text index of cached Comics.
+
+    Comic titles, series titles, publisher names, creators and characters are indexed using
+    SQLite FTS5, and each entry stores the data needed to return it as a GenericComic.
+
+    Args:
+        path: Path to database.
+    """
+
+    def __init__(self, path: Path | None = None):
+        self._db_path = path or (get_cache_root() / "search.sqlite")
+        self.initialize()
+
+    @contextmanager
+    def _connect(self) -> Generator[sqlite3.Connection]:
+        conn = None
+        try:
+            conn = sqlite3.connect(self._db_path)
+            conn.row_factory = sqlite3.Row
+            yield conn
+        finally:
+            if conn:
+                conn.close()
+
+    def initialize(self) -> None:
+        """Create the index tables if they don't exist."""
+        with self._connect() as conn:
+            conn.execute(
+                """
+                CREATE TABLE IF NOT EXISTS document (
+                    id INTEGER NOT NULL PRIMARY KEY,
+                    data TEXT NOT NULL,
+                    is_full INTEGER NOT NULL
+                );
+                """
+            )
+            conn.execute(
+                """
+                CREATE VIRTUAL TABLE IF NOT EXISTS search USING fts5(
+                    title, series, publisher, creators, characters,
+                    tokenize = 'unicode61 remove_diacritics 2'
+                );
+                """
+            )
+            conn.commit()
+
+    @staticmethod
+    def _replace(
+        conn: sqlite3.Connection, data: dict[str, Any], creators: str, characters: str, full: bool
+    ) -> None:
+        comic_id = int(data["id"])
+        conn.execute(
+            "INSERT OR REPLACE INTO document (id, data, is_full) VALUES (?, ?, ?);",
+            (comic_id, json.dumps(data), int(full)),
+        )
+        conn.execute("DELETE FROM search WHERE rowid = ?;", (comic_id,))
+        conn.execute(
+            "INSERT INTO search (rowid, title, series, publisher, creators, characters) "
+            "VALUES (?, ?, ?, ?, ?, ?);",
+            (
+                comic_id,
+                data["title"],
+                data["series_name"],
+                data["publisher_name"],
+                creators,
+                characters,
+            ),
+        )
+
+    def _index_comic(self, conn: sqlite3.Connection, result: dict[str, Any]) -> None:
+        creators = " ".join(x["name"] for x in result.get("creators") or [])
+        characters = " ".join(
+            f"{x['name']} {x.get('parent_name') or ''}" for x in result.get("characters") or []
+        )
+        self._replace(
+            conn=conn,
+            data=_generic_from_comic(result=result),
+            creators=creators,
+            characters=characters,
+            full=True,
+        )
+
+    def _index_generic_comics(
+        self, conn: sqlite3.Connection, results: list[dict[str, Any]]
+    ) -> None:
+        for result in results:
+            row = conn.execute(
+                "SELECT is_full FROM document WHERE id = ?;", (int(result["id"]),)
+            ).fetchone()
+            if not row or not row["is_full"]:
+                self._replace(conn=conn, data=result, creators="", characters="", full=False)
+
+    def index_comic(self, result: dict[str, Any]) -> None:
+        """Add or replace a Comic in the index.
+
+        Args:
+            result: Json response of a Comic from League of Comic Geeks.
+        """
+        with self._connect() as conn:
+            self._index_comic(conn=conn, result=result)
+            conn.commit()
+
+    def index_generic_comics(self, results: list[dict[str, Any]]) -> None:
+        """Add GenericComics to the index, without replacing the details of full Comics.
+
+        Args:
+            results: Json GenericComics, from search results or collected issues.
+        """
+        with self._connect() as conn:
+            self._index_generic_comics(conn=conn, results=results)
+            conn.commit()
+
+    def rebuild(self, cache: SQLiteCache) -> None:
+        """Index every Comic and search result held in a SQLiteCache.
+
+        Args:
+            cache: SQLiteCache to read entries from.
+        """
+        with self._connect() as conn:
+            for entry in cache.iter_entries(prefixes=["/comic/format/json"]):
+                result = json.loads(entry["response"])
+                self._index_comic(conn=conn, result=result)
+                self._index_generic_comics(
+                    conn=conn,
+                    results=[
+                        *(result.get("collected_in") or []),
+                        *(result.get("collected_issues") or []),
+                    ],
+                )
+            for entry in cache.iter_entries(prefixes=["/search/format/json"]):
+                self._index_generic_comics(conn=conn, results=json.loads(entry["response"]))
+            conn.commit()
+
+    def search(self, search_term: str, limit: int = 50) -> list[dict[str, Any]]:
+        """Search the index, best matches first.
+
+        Args:
+            search_term: Search query string, each word is matched as a prefix.
+            limit: Maximum count of results.
+
+        Returns:
+            Json GenericComics which matched the search term.
+        """
+        query = _match_query(search_term=search_term)
+        if not query:
+            return []
+        with self._connect() as conn:
+            rows = conn.execute(
+                "SELECT document.data FROM search JOIN document ON document.id = search.rowid "
+                "WHERE search MATCH ? ORDER BY bm25(search, 10.0, 5.0, 1.0, 2.0, 2.0) LIMIT ?;",
+                (query, limit),
+            ).fetchall()
+        return [json.loads(x["data"]) for x in rows]
@@ -0,0 +1,246 @@
+"""The Serialization module.
+
+This module provides the following classes:
+
+- Codec
+
+This module provides the following functions:
+
+- from_bytes
+- to_bytes
+"""
+
+__all__ = ["Codec", "from_bytes", "to_bytes"]
+
+import json
+import struct
+from collections.abc import Callable
+from datetime import date, datetime
+from decimal import Decimal
+from enum import Enum, IntEnum
+from functools import cache
+from hashlib import blake2b
+from types import NoneType, UnionType
+from typing import Any, Final, NamedTuple, TypeVar, Union, get_args, get_origin
+
+from pydantic import HttpUrl
+
+from himon.schemas import BaseModel
+
+try:
+    import msgpack
+except ImportError:
+    msgpack = None
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+T = TypeVar("T", bound=BaseModel)
+
+MAGIC: Final[bytes] = b"HMN"
+# Magic, schema hash, codec
+HEADER: Final[struct.Struct] = struct.Struct("<3sIB")
+
+
+class Codec(IntEnum):
+    """Encoding of a serialized model."""
+
+    JSON = 1
+    MSGPACK = 2
+
+
+class _Field(NamedTuple):
+    name: str
+    model: type[BaseModel] | None
+    sequence: type[list | tuple] | None
+    convert: Callable[[Any], Any] | None
+
+
+def _parse_datetime(value: str) -> datetime:
+    # Python 3.10 doesn't parse a `Z` suffix
+    return datetime.fromisoformat(value.replace("Z", "+00:00"))
+
+
+def _converter(annotation: Any) -> Callable[[Any], Any] | None:  # noqa: ANN401
+    if annotation is datetime:
+        return _parse_datetime
+    if annotation is date:
+        return date.fromisoformat
+    if annotation is Decimal:
+        return Decimal
+    if annotation is HttpUrl:
+        return HttpUrl
+    if isinstance(annotation, type) and issubclass(annotation, Enum):
+        return annotation
+    return None
+
+
+@cache
+def _fields(model_type: type[BaseModel]) -> tuple[_Field, ...]:
+    """Describe how to pack and construct each field of a model, in schema order."""
+    output = []
+    for name, field in model_type.model_fields.items():
+        annotation = field.annotation
+        if get_origin(annotation) in {Union, UnionType}:
+            annotation = next(x for x in get_args(annotation) if x is not NoneType)
+        sequence = None
+        if get_origin(annotation) in {list, tuple}:
+            sequence = get_origin(annotation)
+            annotation = get_args(annotation)[0]
+        model = (
+            annotation
+            if isinstance(annotation, type) and issubclass(annotation, BaseModel)
+            else None
+        )
+        output.append(
+            _Field(name=name, model=model, sequence=sequence, convert=_converter(annotation))
+        )
+    return tuple(output)
+
+
+@cache
+def _schema_hash(model_type: type[BaseModel]) -> int:
+    """Hash the name and annotation of each field, including those of nested models, in order.
+
+    Values are packed by position, so any change to the layout changes the hash and payloads
+    of the old layout are rejected instead of decoded into the wrong fields.
+    """
+    layout = [
+        f"{field.name}:{info.annotation!r}"
+        + (f":{_schema_hash(model_type=field.model)}" if field.model else "")
+        for field, info in zip(
+            _fields(model_type=model_type), model_type.model_fields.values(), strict=True
+        )
+    ]
+    digest = blake2b("\n".join(layout).encode("UTF-8"), digest_size=4).digest()
+    return int.from_bytes(digest, "little")
+
+
+def _pack(model_type: type[BaseModel], data: dict[str, Any]) -> list[Any]:
+    """Convert a Json dump of a model into a list of its values, in schema order."""
+    output = []
+    for field in _fields(model_type=model_type):
+        value = data[field.name]
+        if field.model and value is not None:
+            value = (
+                [_pack(model_type=field.model, data=x) for x in value]
+                if field.sequence
+                else _pack(model_type=field.model, data=value)
+            )
+        output.append(value)
+    return output
+
+
+def _unpack(model_type: type[BaseModel], values: list[Any]) -> dict[str, Any]:
+    """Convert packed values back into a dict of the model fields, ready to be validated."""
+    output = {}
+    for field, value in zip(_fields(model_type=model_type), values, strict=True):
+        if value is not None:
+            if field.model:
+                value = (  # noqa: PLW2901
+                    [_unpack(model_type=field.model, values=x) for x in value]
+                    if field.sequence
+                    else _unpack(model_type=field.model, values=value)
+                )
+            elif field.convert:
+                value = (  # noqa: PLW2901
+                    [field.convert(x) for x in value] if field.sequence else field.convert(value)
+                )
+        output[field.name] = value
+    return output
+
+
+def _construct(model_type: type[T], values: list[Any]) -> T:
+    """Build a model from packed values, converting types without validating them."""
+    output = {}
+    for field, value in zip(_fields(model_type=model_type), values, strict=True):
+        if value is not None:
+            if field.model:
+                value = (  # noqa: PLW2901
+                    [_construct(model_type=field.model, values=x) for x in value]
+                    if field.sequence
+                    else _construct(model_type=field.model, values=value)
+                )
+            elif field.convert:
+                value = (  # noqa: PLW2901
+                    [field.convert(x) for x in value] if field.sequence else field.convert(value)
+                )
+            if field.sequence is tuple:
+                value = tuple(value)  # noqa: PLW2901
+        output[field.name] = value
+    # Equivalent to `model_construct`, without the per-field default handling
+    model = model_type.__new__(model_type)
+    object.__setattr__(model, "__dict__", output)
+    object.__setattr__(model, "__pydantic_fields_set__", set(output))
+    object.__setattr__(model, "__pydantic_extra__", None)
+    object.__setattr__(model, "__pydantic_private__", None)
+    return model
+
+
+def to_bytes(model: BaseModel, codec: Codec | None = None) -> bytes:
+    """Serialize a model into a compact binary payload.
+
+    The payload starts with a header containing a hash of the model's field layout and the
+    codec, followed by the field values in schema order, without their names.
+
+    Args:
+        model: Model to serialize, such as a Comic or Series.
+        codec: Encoding to use, defaults to msgpack if it's installed otherwise Json.
+
+    Returns:
+        The serialized model.
+
+    Raises:
+        ValueError: If msgpack is requested but not installed.
+    """
+    if codec is None:
+        codec = Codec.MSGPACK if msgpack else Codec.JSON
+    values = _pack(model_type=type(model), data=model.model_dump(mode="json"))
+    if codec == Codec.MSGPACK:
+        if not msgpack:
+            raise ValueError("msgpack serialization requires the msgpack package")
+        body = msgpack.packb(values)
+    elif orjson:
+        body = orjson.dumps(values)
+    else:
+        body = json.dumps(values, separators=(",", ":")).encode("UTF-8")
+    return HEADER.pack(MAGIC, _schema_hash(model_type=type(model)), codec) + body
+
+
+def from_bytes(data: bytes, model_type: type[T], trusted: bool = False) -> T:
+    """Deserialize a payload created by `to_bytes`.
+
+    Args:
+        data: The serialized model.
+        model_type: Type of the serialized model, such as Comic or Series.
+        trusted: Skip validation, only use for payloads Himon created.
+
+    Returns:
+        The deserialized model.
+
+    Raises:
+        ValueError: If the payload isn't supported, was serialized from a different layout of
+            the model's fields, or fails validation.
+    """
+    if len(data) < HEADER.size:
+        raise ValueError("Payload isn't a Himon serialized model")
+    magic, schema_hash, codec = HEADER.unpack_from(data)
+    if magic != MAGIC:
+        raise ValueError("Payload isn't a supported Himon serialized model")
+    if schema_hash != _schema_hash(model_type=model_type):
+        msg = f"Payload isn't a serialized {model_type.__name__}, or its fields have changed"
+        raise ValueError(msg)
+    body = memoryview(data)[HEADER.size :]
+    if codec == Codec.MSGPACK:
+        if not msgpack:
+            raise ValueError("msgpack serialization requires the msgpack package")
+        values = msgpack.unpackb(body)
+    elif codec == Codec.JSON:
+        values = orjson.loads(body) if orjson else json.loads(bytes(body))
+    else:
+        msg = f"Unknown codec: {codec}"
+        raise ValueError(msg)
+    if trusted:
+        return _construct(model_type=model_type, values=values)
+    return model_type.model_validate(_unpack(model_type=model_type, values=values))
@@ -7,15 +7,104 @@
 
 __all__ = ["SQLiteCache"]
 
+import atexit
 import json
+import re
 import sqlite3
-from collections.abc import Generator
+from collections.abc import Generator, Iterable
 from contextlib import contextmanager
+from dataclasses import dataclass
 from datetime import datetime, timedelta, timezone
+from hashlib import blake2b
+from itertools import islice
 from pathlib import Path
-from typing import Any
+from threading import Condition, Lock, Thread
+from typing import Any, Final
 
 from himon import get_cache_root
+from himon.cache_backend import CacheStats
+from himon.profiling import stage
+
+# Key of the reference replacing a sub-document, when stored by content hash
+REF_KEY: Final[str] = "$ref"
+# SQLite limits the count of variables in a statement
+MAX_VARIABLES: Final[int] = 900
+
+
+def normalize_identifier(value: str | int) -> str:
+    """Remove everything except letters and numbers from an identifier, and uppercase it.
+
+    Leading zeros are stripped too, as the API returns UPCs and ISBNs as numbers, so a scanned
+    `0`-prefixed barcode matches the stored value.
+
+    Args:
+        value: Identifier such as a UPC, ISBN or SKU.
+
+    Returns:
+        The normalized identifier.
+    """
+    return re.sub(r"[^0-9A-Za-z]", "", str(value)).upper().lstrip("0")
+
+
+def split_documents(value: Any, documents: dict[str, str], root: bool = True) -> Any:  # noqa: ANN401
+    """Replace each nested object with an `id` by a reference to its content hash.
+
+    Args:
+        value: Json response, or part of one.
+        documents: Populated with the Json of each sub-document, by content hash.
+        root: If the value is the whole response, which is never replaced.
+
+    Returns:
+        The value with its sub-documents replaced by `{"$ref": <hash>}`.
+    """
+    if isinstance(value, list):
+        return [split_documents(value=x, documents=documents, root=False) for x in value]
+    if not isinstance(value, dict):
+        return value
+    value = {k: split_documents(value=v, documents=documents, root=False) for k, v in value.items()}
+    if root or "id" not in value:
+        return value
+    data = json.dumps(value, separators=(",", ":"))
+    key = blake2b(data.encode("UTF-8"), digest_size=16).hexdigest()
+    documents[key] = data
+    return {REF_KEY: key}
+
+
+def _find_refs(value: Any, refs: set[str]) -> None:  # noqa: ANN401
+    if isinstance(value, list):
+        for item in value:
+            _find_refs(value=item, refs=refs)
+    elif isinstance(value, dict):
+        if len(value) == 1 and REF_KEY in value:
+            refs.add(value[REF_KEY])
+        else:
+            for item in value.values():
+                _find_refs(value=item, refs=refs)
+
+
+def _join_documents(value: Any, documents: dict[str, Any]) -> Any:  # noqa: ANN401
+    if isinstance(value, list):
+        return [_join_documents(value=x, documents=documents) for x in value]
+    if isinstance(value, dict):
+        if len(value) == 1 and REF_KEY in value:
+            return _join_documents(value=documents[value[REF_KEY]], documents=documents)
+        return {k: _join_documents(value=v, documents=documents) for k, v in value.items()}
+    return value
+
+
+@dataclass
+class _Pending:
+    data: str
+    timestamp: str
+    etag: str | None = None
+    last_modified: str | None = None
+
+
+@dataclass
+class _PendingMiss:
+    status: int
+    data: str | None
+    timestamp: str
 
 
 class SQLiteCache:
@@ -24,40 +113,137 @@ class SQLiteCache:
     Args:
         path: Path to database.
         expiry: How long to keep cache results.
+        negative_expiry: How long to keep cached misses, such as not found and empty results.
+        stale_expiry: How long to keep expired cache results for revalidation, after `expiry`.
+            Expired results are only revalidated, or used while a CircuitBreaker is open, until
+            then, 0 removes them as soon as they expire.
+        dedup: Store each unique sub-document, such as a Series or GenericComic, once by content
+            hash instead of inside every response. Responses are reassembled when read, in
+            either mode.
+        write_behind: Buffer inserts, touches, misses, entities and identifiers in memory, and
+            write them from a background thread in a single transaction, instead of committing
+            each one. Buffered writes are returned by selects until written, and are flushed by
+            `close` or at exit.
+        flush_size: Count of buffered writes which triggers a write, in write-behind mode.
+        flush_interval: Longest time (in seconds) an insert is buffered, in write-behind mode.
     """
 
-    def __init__(self, path: Path | None = None, expiry: int | None = 14):
+    def __init__(  # noqa: PLR0917
+        self,
+        path: Path | None = None,
+        expiry: int | None = 14,
+        negative_expiry: int | None = 1,
+        stale_expiry: int = 7,
+        dedup: bool = False,
+        write_behind: bool = False,
+        flush_size: int = 500,
+        flush_interval: float = 1,
+    ):
         self._db_path = path or (get_cache_root() / "cache.sqlite")
         self._expiry = expiry
+        self._negative_expiry = negative_expiry
+        self._stale_expiry = stale_expiry
+        self._dedup = dedup
+        self._hits = 0
+        self._misses = 0
+        self._flush_size = flush_size
+        self._flush_interval = flush_interval
+        self._pending: dict[str, _Pending] = {}
+        self._pending_misses: dict[str, _PendingMiss] = {}
+        self._pending_entities: dict[tuple[str, int], _Pending] = {}
+        self._pending_identifiers: dict[tuple[str, str], int] = {}
+        # Kinds of the buffered identifiers by value, so lookups don't scan the buffer
+        self._pending_identifier_kinds: dict[str, set[str]] = {}
+        self._condition = Condition()
+        self._write_lock = Lock()
+        self._writer: Thread | None = None
         self.initialize()
         self.cleanup()
+        if write_behind:
+            self._writer = Thread(target=self._run_writer, name="himon-cache-writer", daemon=True)
+            self._writer.start()
+            atexit.register(self.close)
 
     @contextmanager
     def _connect(self) -> Generator[sqlite3.Connection]:
         conn = None
-        try:
-            conn = sqlite3.connect(self._db_path)
-            conn.row_factory = sqlite3.Row
-            conn.execute("PRAGMA foreign_keys = ON")
-            yield conn
-        finally:
-            if conn:
-                conn.close()
+        with stage(name="cache"):
+            try:
+                conn = sqlite3.connect(self._db_path)
+                conn.row_factory = sqlite3.Row
+                conn.execute("PRAGMA foreign_keys = ON")
+                yield conn
+            finally:
+                if conn:
+                    conn.close()
 
     def initialize(self) -> None:
-        """Create the cache table if it doesn't exist."""
+        """Create the cache tables if they don't exist."""
         with self._connect() as conn:
             conn.execute(
                 """
                 CREATE TABLE IF NOT EXISTS cache (
                     query TEXT NOT NULL PRIMARY KEY,
                     response TEXT,
+                    timestamp TIMESTAMP,
+                    etag TEXT,
+                    last_modified TEXT
+                );
+                """
+            )
+            columns = {x["name"] for x in conn.execute("PRAGMA table_info(cache);")}
+            if "etag" not in columns:
+                conn.execute("ALTER TABLE cache ADD COLUMN etag TEXT;")
+            if "last_modified" not in columns:
+                conn.execute("ALTER TABLE cache ADD COLUMN last_modified TEXT;")
+            conn.execute(
+                """
+                CREATE TABLE IF NOT EXISTS negative_cache (
+                    query TEXT NOT NULL PRIMARY KEY,
+                    status INTEGER NOT NULL,
+                    response TEXT,
                     timestamp TIMESTAMP
                 );
                 """
             )
+            conn.execute(
+                """
+                CREATE TABLE IF NOT EXISTS entity (
+                    type TEXT NOT NULL,
+                    id INTEGER NOT NULL,
+                    data TEXT,
+                    timestamp TIMESTAMP,
+                    PRIMARY KEY (type, id)
+                );
+                """
+            )
+            conn.execute(
+                """
+                CREATE TABLE IF NOT EXISTS identifier (
+                    value TEXT NOT NULL,
+                    kind TEXT NOT NULL,
+                    comic_id INTEGER NOT NULL,
+                    PRIMARY KEY (value, kind)
+                ) WITHOUT ROWID;
+                """
+            )
+            conn.execute(
+                """
+                CREATE TABLE IF NOT EXISTS document (
+                    hash TEXT NOT NULL PRIMARY KEY,
+                    data TEXT NOT NULL
+                ) WITHOUT ROWID;
+                """
+            )
             conn.commit()
 
+    @property
+    def fresh_since(self) -> datetime | None:
+        """Time after which cached entries are fresh, None if they never expire."""
+        if not self._expiry:
+            return None
+        return datetime.now(tz=timezone.utc) - timedelta(days=self._expiry)
+
     def select(self, query: str) -> dict[str, Any]:
         """Retrieve data from the cache database.
 
@@ -67,6 +253,10 @@ def select(self, query: str) -> dict[str, Any]:
         Returns:
             Empty dict or select results.
         """
+        pending = self._select_pending(query=query)
+        if pending is not None:
+            self._hits += 1
+            return json.loads(pending.data)
         with self._connect() as conn:
             if self._expiry:
                 expiry = datetime.now(tz=timezone.utc) - timedelta(days=self._expiry)
@@ -76,37 +266,686 @@ def select(self, query: str) -> dict[str, Any]:
                 ).fetchone()
             else:
                 row = conn.execute("SELECT * FROM cache WHERE query = ?;", (query,)).fetchone()
-            return json.loads(row["response"]) if row else {}
+            response = self._load(conn=conn, response=row["response"]) if row else None
+            if response is None:
+                self._misses += 1
+                return {}
+            self._hits += 1
+            return response
+
+    def select_many(self, queries: Iterable[str]) -> dict[str, Any]:
+        """Retrieve data from the cache database for many queries at once.
+
+        Args:
+            queries: Url strings used as keys.
+
+        Returns:
+            The cached response of each query found.
+        """
+        queries = list(dict.fromkeys(queries))
+        output = {}
+        for query in queries:
+            pending = self._select_pending(query=query)
+            if pending is not None:
+                output[query] = json.loads(pending.data)
+        remaining = [x for x in queries if x not in output]
+        expiry = (
+            datetime.now(tz=timezone.utc) - timedelta(days=self._expiry) if self._expiry else None
+        )
+        with self._connect() as conn:
+            for index in range(0, len(remaining), MAX_VARIABLES):
+                batch = remaining[index : index + MAX_VARIABLES]
+                for row in conn.execute(
+                    "SELECT query, response, timestamp FROM cache "  # noqa: S608
+                    f"WHERE query IN ({', '.join('?' * len(batch))});",
+                    batch,
+                ):
+                    if expiry is None or row["timestamp"] > expiry.isoformat():
+                        response = self._load(conn=conn, response=row["response"])
+                        if response is not None:
+                            output[row["query"]] = response
+        self._hits += len(output)
+        self._misses += len(queries) - len(output)
+        return output
 
-    def insert(self, query: str, response: dict[str, Any]) -> None:
+    def select_stale(self, query: str) -> dict[str, Any]:
+        """Retrieve data from the cache database, including entries expired within `stale_expiry`.
+
+        Args:
+            query: Url string used as key.
+
+        Returns:
+            Empty dict or the `response`, `etag` and `last_modified` of the entry.
+        """
+        with self._condition:
+            pending = self._pending.get(query)
+        if pending is not None:
+            return {
+                "response": json.loads(pending.data),
+                "etag": pending.etag,
+                "last_modified": pending.last_modified,
+            }
+        stale_since = (
+            self.fresh_since - timedelta(days=self._stale_expiry) if self.fresh_since else None
+        )
+        with self._connect() as conn:
+            row = conn.execute(
+                "SELECT response, etag, last_modified, timestamp FROM cache WHERE query = ?;",
+                (query,),
+            ).fetchone()
+            if row and stale_since and row["timestamp"] <= stale_since.isoformat():
+                row = None
+            response = self._load(conn=conn, response=row["response"]) if row else None
+            if response is None:
+                return {}
+            return {
+                "response": response,
+                "etag": row["etag"],
+                "last_modified": row["last_modified"],
+            }
+
+    def insert(
+        self,
+        query: str,
+        response: dict[str, Any],
+        etag: str | None = None,
+        last_modified: str | None = None,
+    ) -> None:
         """Insert data into the cache database.
 
         Args:
             query: Url string used as key.
             response: Response dict from url.
+            etag: ETag header of the response, used to revalidate the entry.
+            last_modified: Last-Modified header of the response, used to revalidate the entry.
         """
+        timestamp = datetime.now(tz=timezone.utc).isoformat()
+        if self._buffer(
+            pending=self._pending,
+            entries={
+                query: _Pending(
+                    data=json.dumps(response),
+                    timestamp=timestamp,
+                    etag=etag,
+                    last_modified=last_modified,
+                )
+            },
+        ):
+            return
         with self._connect() as conn:
             conn.execute(
-                "INSERT INTO cache (query, response, timestamp) VALUES (?, ?, ?);",
-                (query, json.dumps(response), datetime.now(tz=timezone.utc).isoformat()),
+                "INSERT OR REPLACE INTO cache (query, response, timestamp, etag, last_modified) "
+                "VALUES (?, ?, ?, ?, ?);",
+                (query, self._dump(conn=conn, response=response), timestamp, etag, last_modified),
             )
             conn.commit()
 
+    def insert_many(self, entries: dict[str, Any]) -> None:
+        """Insert data for many queries into the cache database, in a single transaction.
+
+        Args:
+            entries: Response dict of each url string.
+        """
+        timestamp = datetime.now(tz=timezone.utc).isoformat()
+        if self._buffer(
+            pending=self._pending,
+            entries={
+                query: _Pending(data=json.dumps(response), timestamp=timestamp)
+                for query, response in entries.items()
+            },
+        ):
+            return
+        with self._connect() as conn:
+            conn.executemany(
+                "INSERT OR REPLACE INTO cache (query, response, timestamp) VALUES (?, ?, ?);",
+                [
+                    (query, self._dump(conn=conn, response=response), timestamp)
+                    for query, response in entries.items()
+                ],
+            )
+            conn.commit()
+
+    def touch(self, query: str) -> None:
+        """Mark an entry as fresh without rewriting its response.
+
+        Args:
+            query: Url string used as key.
+        """
+        timestamp = datetime.now(tz=timezone.utc).isoformat()
+        stale = self.select_stale(query=query) if self._writer is not None else {}
+        if stale and self._buffer(
+            pending=self._pending,
+            entries={
+                query: _Pending(
+                    data=json.dumps(stale["response"]),
+                    timestamp=timestamp,
+                    etag=stale["etag"],
+                    last_modified=stale["last_modified"],
+                )
+            },
+        ):
+            return
+        with self._connect() as conn:
+            conn.execute("UPDATE cache SET timestamp = ? WHERE query = ?;", (timestamp, query))
+            conn.commit()
+
+    def contains(self, query: str) -> bool:
+        """Check if the cache database has a fresh entry or miss, without loading it.
+
+        Args:
+            query: Url string used as key.
+
+        Returns:
+            True if a fresh entry or miss exists.
+        """
+        if self._select_pending(query=query) is not None or self._select_pending_miss(query=query):
+            return True
+        with self._connect() as conn:
+            for table, days in (("cache", self._expiry), ("negative_cache", self._negative_expiry)):
+                if days:
+                    expiry = datetime.now(tz=timezone.utc) - timedelta(days=days)
+                    row = conn.execute(
+                        f"SELECT 1 FROM {table} WHERE query = ? and timestamp > ?;",  # noqa: S608
+                        (query, expiry.isoformat()),
+                    ).fetchone()
+                else:
+                    row = conn.execute(
+                        f"SELECT 1 FROM {table} WHERE query = ?;",  # noqa: S608
+                        (query,),
+                    ).fetchone()
+                if row:
+                    return True
+        return False
+
+    def select_negative(self, query: str) -> tuple[int, Any] | None:
+        """Retrieve a cached miss from the cache database.
+
+        Args:
+            query: Url string used as key.
+
+        Returns:
+            None or the status code and empty response of the cached miss.
+        """
+        pending = self._select_pending_miss(query=query)
+        if pending is not None:
+            return pending.status, json.loads(pending.data) if pending.data else None
+        with self._connect() as conn:
+            if self._negative_expiry:
+                expiry = datetime.now(tz=timezone.utc) - timedelta(days=self._negative_expiry)
+                row = conn.execute(
+                    "SELECT * FROM negative_cache WHERE query = ? and timestamp > ?;",
+                    (query, expiry.isoformat()),
+                ).fetchone()
+            else:
+                row = conn.execute(
+                    "SELECT * FROM negative_cache WHERE query = ?;", (query,)
+                ).fetchone()
+            if not row:
+                return None
+            return row["status"], json.loads(row["response"]) if row["response"] else None
+
+    def insert_negative(
+        self, query: str, status: int, response: dict[str, Any] | list[Any] | None = None
+    ) -> None:
+        """Insert a miss into the cache database, separate from the cached responses.
+
+        Args:
+            query: Url string used as key.
+            status: Status code returned from url.
+            response: Empty response from url, if there was one.
+        """
+        miss = _PendingMiss(
+            status=status,
+            data=None if response is None else json.dumps(response),
+            timestamp=datetime.now(tz=timezone.utc).isoformat(),
+        )
+        if self._buffer(pending=self._pending_misses, entries={query: miss}):
+            return
+        with self._connect() as conn:
+            conn.execute(
+                "INSERT OR REPLACE INTO negative_cache (query, status, response, timestamp) "
+                "VALUES (?, ?, ?, ?);",
+                (query, miss.status, miss.data, miss.timestamp),
+            )
+            conn.commit()
+
+    def select_entity(self, entity_type: str, entity_id: int) -> dict[str, Any]:
+        """Retrieve an entity from the cache database.
+
+        Args:
+            entity_type: Type of entity, such as `series`.
+            entity_id: Identifier used by League of Comic Geeks.
+
+        Returns:
+            Empty dict or select results.
+        """
+        with self._condition:
+            pending = self._pending_entities.get((entity_type, int(entity_id)))
+        if pending is not None and self._is_pending_fresh(pending.timestamp, days=self._expiry):
+            return json.loads(pending.data)
+        with self._connect() as conn:
+            if self._expiry:
+                expiry = datetime.now(tz=timezone.utc) - timedelta(days=self._expiry)
+                row = conn.execute(
+                    "SELECT * FROM entity WHERE type = ? and id = ? and timestamp > ?;",
+                    (entity_type, entity_id, expiry.isoformat()),
+                ).fetchone()
+            else:
+                row = conn.execute(
+                    "SELECT * FROM entity WHERE type = ? and id = ?;", (entity_type, entity_id)
+                ).fetchone()
+            return json.loads(row["data"]) if row else {}
+
+    def insert_entities(self, entity_type: str, entities: list[dict[str, Any]]) -> None:
+        """Insert entities embedded in other responses into the cache database.
+
+        Args:
+            entity_type: Type of entity, such as `series`.
+            entities: Entity dicts, each containing its own `id`.
+        """
+        timestamp = datetime.now(tz=timezone.utc).isoformat()
+        pending = {
+            (entity_type, int(x["id"])): _Pending(data=json.dumps(x), timestamp=timestamp)
+            for x in entities
+        }
+        if self._buffer(pending=self._pending_entities, entries=pending):
+            return
+        with self._connect() as conn:
+            conn.executemany(
+                "INSERT OR REPLACE INTO entity (type, id, data, timestamp) VALUES (?, ?, ?, ?);",
+                [(*key, x.data, x.timestamp) for key, x in pending.items()],
+            )
+            conn.commit()
+
+    def insert_identifiers(self, identifiers: list[tuple[str, str | int, int]]) -> None:
+        """Insert identifiers, such as UPCs and SKUs, of cached Comics into the cache database.
+
+        Args:
+            identifiers: The kind of identifier, its value and the Comic id it belongs to.
+        """
+        pending = {
+            (normalize_identifier(value=value), kind): comic_id
+            for kind, value, comic_id in identifiers
+            if normalize_identifier(value=value)
+        }
+        with self._condition:
+            if self._buffer(pending=self._pending_identifiers, entries=pending):
+                for value, kind in pending:
+                    self._pending_identifier_kinds.setdefault(value, set()).add(kind)
+                return
+        with self._connect() as conn:
+            conn.executemany(
+                "INSERT OR REPLACE INTO identifier (value, kind, comic_id) VALUES (?, ?, ?);",
+                [(*key, comic_id) for key, comic_id in pending.items()],
+            )
+            conn.commit()
+
+    def select_identifier(self, value: str | int, kind: str | None = None) -> int | None:
+        """Retrieve the Comic id an identifier belongs to, matching its whole value.
+
+        Args:
+            value: Value of the identifier, characters other than letters and numbers are ignored.
+            kind: Only match this kind of identifier, such as `upc`, `isbn`, `sku` or
+                `sku_diamond`.
+
+        Returns:
+            None or the Comic id.
+        """
+        value = normalize_identifier(value=value)
+        if not value:
+            return None
+        with self._condition:
+            kinds = [kind] if kind else self._pending_identifier_kinds.get(value, ())
+            pending = next(
+                (
+                    self._pending_identifiers[value, x]
+                    for x in kinds
+                    if (value, x) in self._pending_identifiers
+                ),
+                None,
+            )
+        if pending is not None:
+            return pending
+        kind_clause = " AND kind = :kind" if kind else ""
+        with self._connect() as conn:
+            row = conn.execute(
+                f"SELECT comic_id FROM identifier WHERE value = :value{kind_clause};",  # noqa: S608
+                {"value": value, "kind": kind},
+            ).fetchone()
+            return row["comic_id"] if row else None
+
+    def iter_entries(
+        self, prefixes: list[str] | None = None, since: datetime | None = None
+    ) -> Generator[dict[str, Any]]:
+        """Iterate over the cached responses, without loading them all into memory.
+
+        Args:
+            prefixes: Only include entries whose url starts with one of these, such as an endpoint.
+            since: Only include entries cached after this time.
+
+        Returns:
+            Entries containing the `query`, raw Json `response`, `timestamp`, `etag` and
+            `last_modified`.
+        """
+        clauses = []
+        values = []
+        if prefixes:
+            clauses.append("(" + " OR ".join(["instr(query, ?) = 1"] * len(prefixes)) + ")")
+            values.extend(prefixes)
+        if since:
+            clauses.append("timestamp > ?")
+            values.append(since.isoformat())
+        where = f" WHERE {' AND '.join(clauses)}" if clauses else ""
+        self.flush()
+        with self._connect() as conn:
+            for row in conn.execute(
+                "SELECT query, response, timestamp, etag, last_modified FROM cache"  # noqa: S608
+                f"{where} ORDER BY query;",
+                values,
+            ):
+                entry = dict(row)
+                if f'"{REF_KEY}"' in entry["response"]:
+                    response = self._load(conn=conn, response=entry["response"])
+                    if response is None:
+                        continue
+                    entry["response"] = json.dumps(response)
+                yield entry
+
+    def merge(self, entries: Iterable[dict[str, Any]], batch_size: int = 1_000) -> int:
+        """Insert entries into the cache database, keeping whichever copy is newest.
+
+        Args:
+            entries: Entries in the format returned by `iter_entries`.
+            batch_size: Count of entries written per statement.
+
+        Returns:
+            Count of entries inserted or replaced.
+        """
+        entries = iter(entries)
+        self.flush()
+        with self._connect() as conn:
+            changes = 0
+            while batch := list(islice(entries, batch_size)):
+                if self._dedup:
+                    batch = [
+                        {**x, "response": self._dump(conn=conn, response=json.loads(x["response"]))}
+                        for x in batch
+                    ]
+                # Only count the cache rows, not the sub-documents written by `_dump`
+                changes += conn.executemany(
+                    """
+                    INSERT INTO cache (query, response, timestamp, etag, last_modified)
+                    VALUES (:query, :response, :timestamp, :etag, :last_modified)
+                    ON CONFLICT (query) DO UPDATE SET
+                        response = excluded.response,
+                        timestamp = excluded.timestamp,
+                        etag = excluded.etag,
+                        last_modified = excluded.last_modified
+                    WHERE excluded.timestamp > cache.timestamp;
+                    """,
+                    [{"etag": None, "last_modified": None, **x} for x in batch],
+                ).rowcount
+            conn.commit()
+            return changes
+
     def delete(self, query: str) -> None:
         """Remove entry from the cache with the provided url.
 
         Args:
           query: Url string used as key.
         """
+        self.flush()
         with self._connect() as conn:
             conn.execute("DELETE FROM cache WHERE query = ?;", (query,))
+            conn.execute("DELETE FROM negative_cache WHERE query = ?;", (query,))
+            conn.commit()
+
+    def _dump(self, conn: sqlite3.Connection, response: Any) -> str:  # noqa: ANN401
+        """Serialize a response, storing its sub-documents separately if deduplicating."""
+        if not self._dedup:
+            return json.dumps(response)
+        documents = {}
+        response = split_documents(value=response, documents=documents)
+        conn.executemany(
+            "INSERT OR IGNORE INTO document (hash, data) VALUES (?, ?);", documents.items()
+        )
+        return json.dumps(response, separators=(",", ":"))
+
+    @staticmethod
+    def _select_documents(conn: sqlite3.Connection, refs: set[str]) -> dict[str, Any]:
+        """Load referenced sub-documents, and every sub-document they reference in turn."""
+        documents = {}
+        refs = set(refs)
+        while refs:
+            batch = list(islice(refs, MAX_VARIABLES))
+            refs.difference_update(batch)
+            for row in conn.execute(
+                "SELECT hash, data FROM document "  # noqa: S608
+                f"WHERE hash IN ({', '.join('?' * len(batch))});",
+                batch,
+            ):
+                documents[row["hash"]] = json.loads(row["data"])
+                _find_refs(value=documents[row["hash"]], refs=refs)
+            refs.difference_update(documents)
+        return documents
+
+    def _load(self, conn: sqlite3.Connection, response: str) -> Any:  # noqa: ANN401
+        """Deserialize a response, reassembling any sub-documents stored separately.
+
+        Returns None if a sub-document is missing, so the response is treated as a miss.
+        """
+        output = json.loads(response)
+        if f'"{REF_KEY}"' not in response:
+            return output
+        refs = set()
+        _find_refs(value=output, refs=refs)
+        documents = self._select_documents(conn=conn, refs=refs)
+        try:
+            return _join_documents(value=output, documents=documents)
+        except KeyError:
+            return None
+
+    def prune_documents(self) -> int:
+        """Remove sub-documents no longer referenced by any cached response.
+
+        References are read in a write transaction, so no other connection can reference a
+        sub-document between it being found unreferenced and removed.
+
+        Returns:
+            Count of sub-documents removed.
+        """
+        self.flush()
+        with self._connect() as conn:
+            conn.execute("BEGIN IMMEDIATE;")
+            refs = set()
+            for row in conn.execute(
+                "SELECT response FROM cache WHERE instr(response, ?) > 0;", (f'"{REF_KEY}"',)
+            ):
+                _find_refs(value=json.loads(row["response"]), refs=refs)
+            referenced = self._select_documents(conn=conn, refs=refs)
+            orphans = [
+                (row["hash"],)
+                for row in conn.execute("SELECT hash FROM document;").fetchall()
+                if row["hash"] not in referenced
+            ]
+            conn.executemany("DELETE FROM document WHERE hash = ?;", orphans)
             conn.commit()
+            return len(orphans)
+
+    def delete_many(self, queries: Iterable[str]) -> None:
+        """Remove entries from the cache for many urls at once.
+
+        Args:
+          queries: Url strings used as keys.
+        """
+        values = [(x,) for x in queries]
+        self.flush()
+        with self._connect() as conn:
+            conn.executemany("DELETE FROM cache WHERE query = ?;", values)
+            conn.executemany("DELETE FROM negative_cache WHERE query = ?;", values)
+            conn.commit()
+
+    def stats(self) -> CacheStats:
+        """Measure the size and usage of the cache database.
+
+        Returns:
+            The count and size of the cached responses, and the hits and misses of selects.
+        """
+        self.flush()
+        with self._connect() as conn:
+            entries, size = conn.execute(
+                "SELECT COUNT(*), COALESCE(SUM(LENGTH(response)), 0) FROM cache;"
+            ).fetchone()
+            size += conn.execute("SELECT COALESCE(SUM(LENGTH(data)), 0) FROM document;").fetchone()[
+                0
+            ]
+        return CacheStats(entries=entries, size=size, hits=self._hits, misses=self._misses)
+
+    @staticmethod
+    def _is_pending_fresh(timestamp: str, days: int | None) -> bool:
+        return (
+            not days
+            or timestamp > (datetime.now(tz=timezone.utc) - timedelta(days=days)).isoformat()
+        )
+
+    def _select_pending(self, query: str) -> _Pending | None:
+        """Retrieve a fresh buffered insert, which hasn't been written yet."""
+        with self._condition:
+            pending = self._pending.get(query)
+        if pending is None or not self._is_pending_fresh(pending.timestamp, days=self._expiry):
+            return None
+        return pending
+
+    def _select_pending_miss(self, query: str) -> _PendingMiss | None:
+        """Retrieve a fresh buffered miss, which hasn't been written yet."""
+        with self._condition:
+            pending = self._pending_misses.get(query)
+        if pending is None or not self._is_pending_fresh(
+            pending.timestamp, days=self._negative_expiry
+        ):
+            return None
+        return pending
+
+    def _pending_count(self) -> int:
+        return (
+            len(self._pending)
+            + len(self._pending_misses)
+            + len(self._pending_entities)
+            + len(self._pending_identifiers)
+        )
+
+    def _buffer(self, pending: dict[Any, Any], entries: dict[Any, Any]) -> bool:
+        """Buffer writes for the background writer, False if not in write-behind mode."""
+        with self._condition:
+            if self._writer is None:
+                return False
+            pending.update(entries)
+            if self._pending_count() >= self._flush_size:
+                self._condition.notify_all()
+        return True
+
+    def _run_writer(self) -> None:
+        while True:
+            with self._condition:
+                self._condition.wait_for(
+                    lambda: self._writer is None or self._pending_count() >= self._flush_size,
+                    timeout=self._flush_interval,
+                )
+                if self._writer is None:
+                    return
+            try:
+                self.flush()
+            except sqlite3.Error:
+                with self._condition:
+                    self._condition.wait(timeout=self._flush_interval)
+
+    def _write_pending(
+        self,
+        conn: sqlite3.Connection,
+        pending: dict[str, _Pending],
+        misses: dict[str, _PendingMiss],
+        entities: dict[tuple[str, int], _Pending],
+        identifiers: dict[tuple[str, str], int],
+    ) -> None:
+        """Write buffered inserts, misses, entities and identifiers, without committing."""
+        conn.executemany(
+            "INSERT OR REPLACE INTO cache "
+            "(query, response, timestamp, etag, last_modified) VALUES (?, ?, ?, ?, ?);",
+            [
+                (
+                    query,
+                    self._dump(conn=conn, response=json.loads(x.data)) if self._dedup else x.data,
+                    x.timestamp,
+                    x.etag,
+                    x.last_modified,
+                )
+                for query, x in pending.items()
+            ],
+        )
+        conn.executemany(
+            "INSERT OR REPLACE INTO negative_cache (query, status, response, timestamp) "
+            "VALUES (?, ?, ?, ?);",
+            [(query, x.status, x.data, x.timestamp) for query, x in misses.items()],
+        )
+        conn.executemany(
+            "INSERT OR REPLACE INTO entity (type, id, data, timestamp) VALUES (?, ?, ?, ?);",
+            [(*key, x.data, x.timestamp) for key, x in entities.items()],
+        )
+        conn.executemany(
+            "INSERT OR REPLACE INTO identifier (value, kind, comic_id) VALUES (?, ?, ?);",
+            [(*key, comic_id) for key, comic_id in identifiers.items()],
+        )
+
+    def flush(self) -> None:
+        """Write the buffered writes to the cache database, in a single transaction."""
+        with self._write_lock:
+            with self._condition:
+                buffers = [
+                    (x, dict(x))
+                    for x in (
+                        self._pending,
+                        self._pending_misses,
+                        self._pending_entities,
+                        self._pending_identifiers,
+                    )
+                ]
+            if not any(written for _, written in buffers):
+                return
+            with self._connect() as conn:
+                self._write_pending(conn, *(written for _, written in buffers))
+                conn.commit()
+            with self._condition:
+                for pending, written in buffers:
+                    for key, entry in written.items():
+                        if pending.get(key) is entry:
+                            del pending[key]
+                for value, kind in buffers[-1][1].keys() - self._pending_identifiers.keys():
+                    kinds = self._pending_identifier_kinds[value]
+                    kinds.discard(kind)
+                    if not kinds:
+                        del self._pending_identifier_kinds[value]
+
+    def close(self) -> None:
+        """Stop the background writer, writing every buffered insert."""
+        with self._condition:
+            writer, self._writer = self._writer, None
+            self._condition.notify_all()
+        if writer is not None:
+            writer.join()
+            atexit.unregister(self.close)
+        self.flush()
 
     def cleanup(self) -> None:
         """Remove all expired entries from the cache database."""
-        if not self._expiry:
-            return
-        expiry = datetime.now(tz=timezone.utc) - timedelta(days=self._expiry)
         with self._connect() as conn:
-            conn.execute("DELETE FROM cache WHERE timestamp < ?;", (expiry.isoformat(),))
+            if self._expiry:
+                expiry = datetime.now(tz=timezone.utc) - timedelta(days=self._expiry)
+                stale_expiry = expiry - timedelta(days=self._stale_expiry)
+                conn.execute("DELETE FROM cache WHERE timestamp < ?;", (stale_expiry.isoformat(),))
+                conn.execute("DELETE FROM entity WHERE timestamp < ?;", (expiry.isoformat(),))
+            if self._negative_expiry:
+                expiry = datetime.now(tz=timezone.utc) - timedelta(days=self._negative_expiry)
+                conn.execute(
+                    "DELETE FROM negative_cache WHERE timestamp < ?;", (expiry.isoformat(),)
+                )
             conn.commit()
@@ -0,0 +1,282 @@
+"""The TableExport module.
+
+This module provides the following functions:
+
+- export_tables
+"""
+
+__all__ = ["export_tables"]
+
+import csv
+import json
+from collections.abc import Iterator
+from datetime import date
+from importlib.util import find_spec
+from pathlib import Path
+from typing import Any, Final, Literal, Protocol
+
+from pydantic import ValidationError
+
+from himon.exceptions import ServiceError
+from himon.schemas import get_adapter
+from himon.schemas.comic import Comic
+from himon.schemas.series import Series
+from himon.sqlite_cache import SQLiteCache
+
+# Column names and their type, used for the Arrow schema
+COLUMNS: Final[dict[str, tuple[tuple[str, str], ...]]] = {
+    "comics": (
+        ("id", "int"),
+        ("series_id", "int"),
+        ("publisher_id", "int"),
+        ("publisher_name", "str"),
+        ("title", "str"),
+        ("format", "str"),
+        ("is_variant", "bool"),
+        ("parent_id", "int"),
+        ("date_release", "date"),
+        ("date_foc", "date"),
+        ("date_cover", "date"),
+        ("price", "float"),
+        ("pages", "int"),
+        ("upc", "int"),
+        ("isbn", "int"),
+        ("sku", "str"),
+        ("sku_diamond", "str"),
+        ("count_pulls", "int"),
+        ("count_collected", "int"),
+        ("count_read", "int"),
+        ("date_modified", "datetime"),
+    ),
+    "variants": (
+        ("comic_id", "int"),
+        ("id", "int"),
+        ("title", "str"),
+        ("cover_type", "str"),
+        ("date_release", "date"),
+        ("price", "float"),
+        ("sku", "str"),
+        ("date_modified", "datetime"),
+    ),
+    "creators": (
+        ("comic_id", "int"),
+        ("creator_id", "int"),
+        ("name", "str"),
+        ("role_id", "int"),
+        ("role", "str"),
+    ),
+    "characters": (
+        ("comic_id", "int"),
+        ("character_id", "int"),
+        ("name", "str"),
+        ("full_name", "str"),
+        ("parent_name", "str"),
+        ("universe_name", "str"),
+        ("publisher_name", "str"),
+        ("character_type", "str"),
+    ),
+    "series": (
+        ("id", "int"),
+        ("title", "str"),
+        ("volume", "int"),
+        ("year_begin", "int"),
+        ("year_end", "int"),
+        ("publisher_id", "int"),
+        ("publisher_name", "str"),
+        ("date_modified", "datetime"),
+    ),
+}
+
+
+class _TableWriter(Protocol):
+    def write(self, rows: list[dict[str, Any]]) -> None: ...
+
+    def close(self) -> None: ...
+
+
+class _CsvWriter:
+    def __init__(self, path: Path, columns: list[str]):
+        self._stream = path.open("w", encoding="UTF-8", newline="")
+        self._writer = csv.DictWriter(self._stream, fieldnames=columns)
+        self._writer.writeheader()
+
+    def write(self, rows: list[dict[str, Any]]) -> None:
+        self._writer.writerows(
+            {
+                key: value.isoformat() if isinstance(value, date) else value
+                for key, value in row.items()
+            }
+            for row in rows
+        )
+
+    def close(self) -> None:
+        self._stream.close()
+
+
+def _arrow_schema(columns: tuple[tuple[str, str], ...]) -> Any:  # noqa: ANN401
+    """Build the Arrow schema of a table, requires pyarrow."""
+    import pyarrow as pa  # noqa: PLC0415
+
+    types = {
+        "int": pa.int64(),
+        "str": pa.string(),
+        "bool": pa.bool_(),
+        "float": pa.float64(),
+        "date": pa.date32(),
+        "datetime": pa.timestamp("s", tz="UTC"),
+    }
+    return pa.schema([(name, types[kind]) for name, kind in columns])
+
+
+class _ArrowWriter:
+    def __init__(
+        self,
+        path: Path,
+        columns: tuple[tuple[str, str], ...],
+        file_format: Literal["parquet", "feather"],
+    ):
+        import pyarrow as pa  # noqa: PLC0415
+        from pyarrow import parquet  # noqa: PLC0415
+
+        self._pa = pa
+        self._schema = _arrow_schema(columns=columns)
+        self._writer = (
+            parquet.ParquetWriter(path, self._schema)
+            if file_format == "parquet"
+            else pa.ipc.new_file(path, self._schema)
+        )
+
+    def write(self, rows: list[dict[str, Any]]) -> None:
+        self._writer.write_batch(self._pa.RecordBatch.from_pylist(rows, schema=self._schema))
+
+    def close(self) -> None:
+        self._writer.close()
+
+
+def _series_row(series: Series) -> dict[str, Any]:
+    return {name: getattr(series, name) for name, _ in COLUMNS["series"]}
+
+
+def _comic_rows(comic: Comic) -> Iterator[tuple[str, dict[str, Any]]]:
+    """Flatten a Comic into the rows of each table."""
+    row = {name: getattr(comic, name) for name, _ in COLUMNS["comics"]}
+    row["format"] = comic.format.value
+    row["price"] = float(comic.price) if comic.price is not None else None
+    yield "comics", row
+    for variant in comic.variants:
+        yield (
+            "variants",
+            {
+                "comic_id": comic.id,
+                "id": variant.id,
+                "title": variant.title,
+                "cover_type": variant.cover_type.name,
+                "date_release": variant.date_release,
+                "price": float(variant.price) if variant.price is not None else None,
+                "sku": variant.sku,
+                "date_modified": variant.date_modified,
+            },
+        )
+    for creator in comic.creators:
+        for role_id, role in creator.roles.items():
+            yield (
+                "creators",
+                {
+                    "comic_id": comic.id,
+                    "creator_id": creator.id,
+                    "name": creator.name,
+                    "role_id": role_id,
+                    "role": role,
+                },
+            )
+    for character in comic.characters:
+        yield (
+            "characters",
+            {
+                "comic_id": comic.id,
+                "character_id": character.id,
+                "name": character.name,
+                "full_name": character.full_name,
+                "parent_name": character.parent_name,
+                "universe_name": character.universe_name,
+                "publisher_name": character.publisher_name,
+                "character_type": character.character_type.name,
+            },
+        )
+
+
+def _iter_rows(cache: SQLiteCache) -> Iterator[tuple[str, dict[str, Any]]]:
+    """Validate the cached Comics and Series one at a time, flattening them into rows."""
+    comic_adapter = get_adapter(model_type=Comic)
+    series_adapter = get_adapter(model_type=Series)
+    seen_series = set()
+    try:
+        for entry in cache.iter_entries(prefixes=["/comic/format/json"]):
+            comic = comic_adapter.validate_python(json.loads(entry["response"]))
+            yield from _comic_rows(comic=comic)
+            if comic.series.id not in seen_series:
+                seen_series.add(comic.series.id)
+                yield "series", _series_row(series=comic.series)
+        for entry in cache.iter_entries(prefixes=["/series/format/json"]):
+            result = json.loads(entry["response"])
+            series = series_adapter.validate_python(result.get("details", result))
+            if series.id not in seen_series:
+                seen_series.add(series.id)
+                yield "series", _series_row(series=series)
+    except ValidationError as err:
+        raise ServiceError(err) from err
+
+
+def export_tables(
+    cache: SQLiteCache,
+    directory: Path,
+    file_format: Literal["csv", "parquet", "feather"] = "csv",
+    chunk_size: int = 1_000,
+) -> dict[str, int]:
+    """Stream the cached Comics and Series into flat tables, for use in analytics tools.
+
+    Writes `comics`, `variants`, `creators` (one row per role), `characters` and `series`
+    tables. Entries are validated one at a time and rows are written in chunks, so memory use
+    doesn't grow with the size of the cache.
+
+    Args:
+        cache: SQLiteCache to export.
+        directory: Directory to write a file per table into.
+        file_format: Either `csv`, or `parquet` or `feather` (Arrow IPC) which require pyarrow.
+        chunk_size: Count of rows buffered per table before being written.
+
+    Returns:
+        Count of rows written to each table.
+
+    Raises:
+        ValueError: If parquet or feather is requested but pyarrow isn't installed.
+        ServiceError: If a cached entry fails validation.
+    """
+    if file_format != "csv" and not find_spec("pyarrow"):
+        msg = f"{file_format.title()} export requires the pyarrow package"
+        raise ValueError(msg)
+    directory.mkdir(parents=True, exist_ok=True)
+    writers: dict[str, _TableWriter] = {}
+    for table, columns in COLUMNS.items():
+        path = directory / f"{table}.{file_format}"
+        writers[table] = (
+            _CsvWriter(path=path, columns=[name for name, _ in columns])
+            if file_format == "csv"
+            else _ArrowWriter(path=path, columns=columns, file_format=file_format)
+        )
+    buffers: dict[str, list[dict[str, Any]]] = {x: [] for x in COLUMNS}
+    counts = dict.fromkeys(COLUMNS, 0)
+    try:
+        for table, row in _iter_rows(cache=cache):
+            buffers[table].append(row)
+            counts[table] += 1
+            if len(buffers[table]) >= chunk_size:
+                writers[table].write(rows=buffers[table])
+                buffers[table] = []
+        for table, rows in buffers.items():
+            if rows:
+                writers[table].write(rows=rows)
+    finally:
+        for writer in writers.values():
+            writer.close()
+    return counts
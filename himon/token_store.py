@@ -0,0 +1,97 @@
+"""The TokenStore module.
+
+This module provides the following classes:
+
+- TokenStore
+"""
+
+__all__ = ["TokenStore"]
+
+import json
+import os
+import tempfile
+from datetime import datetime, timedelta, timezone
+from pathlib import Path
+from threading import Lock
+
+from himon import get_cache_root
+
+
+class TokenStore:
+    """The TokenStore object saves access tokens between sessions, keyed by client id.
+
+    Tokens are written to a Json file only readable by the current user, and are replaced
+    atomically so concurrent processes never read a partial file.
+
+    Args:
+        path: Path to the token file.
+        expiry: How long to use a token for (in days), before requesting a new one.
+    """
+
+    def __init__(self, path: Path | None = None, expiry: int | None = 1):
+        self._path = path or (get_cache_root() / "tokens.json")
+        self._expiry = expiry
+        self._lock = Lock()
+
+    def _read(self) -> dict[str, dict[str, str]]:
+        try:
+            return json.loads(self._path.read_text(encoding="UTF-8"))
+        except (FileNotFoundError, json.JSONDecodeError):
+            return {}
+
+    def _write(self, tokens: dict[str, dict[str, str]]) -> None:
+        # Each writer uses its own temporary file, so concurrent writes never interleave
+        fd, temp_path = tempfile.mkstemp(dir=self._path.parent, suffix=".tmp")
+        try:
+            os.fchmod(fd, 0o600)
+            with os.fdopen(fd, "w", encoding="UTF-8") as stream:
+                json.dump(tokens, stream)
+            Path(temp_path).replace(self._path)
+        except BaseException:
+            Path(temp_path).unlink(missing_ok=True)
+            raise
+
+    def select(self, client_id: str) -> str | None:
+        """Retrieve the saved access token of a client.
+
+        Args:
+            client_id: Client Id the token was generated for.
+
+        Returns:
+            None or the access token, if it hasn't expired.
+        """
+        with self._lock:
+            entry = self._read().get(client_id)
+        if not entry:
+            return None
+        if self._expiry is not None:
+            timestamp = datetime.fromisoformat(entry["timestamp"])
+            if timestamp + timedelta(days=self._expiry) < datetime.now(tz=timezone.utc):
+                return None
+        return entry["access_token"]
+
+    def insert(self, client_id: str, access_token: str) -> None:
+        """Save the access token of a client, replacing any existing one.
+
+        Args:
+            client_id: Client Id the token was generated for.
+            access_token: The access token.
+        """
+        with self._lock:
+            tokens = self._read()
+            tokens[client_id] = {
+                "access_token": access_token,
+                "timestamp": datetime.now(tz=timezone.utc).isoformat(),
+            }
+            self._write(tokens=tokens)
+
+    def delete(self, client_id: str) -> None:
+        """Remove the saved access token of a client.
+
+        Args:
+            client_id: Client Id the token was generated for.
+        """
+        with self._lock:
+            tokens = self._read()
+            if tokens.pop(client_id, None) is not None:
+                self._write(tokens=tokens)
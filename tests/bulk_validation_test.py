@@ -0,0 +1,53 @@
+"""The BulkValidation test module.
+
+This module contains tests for validating cached responses across processes.
+"""
+
+import json
+
+import pytest
+
+from himon.bulk_validation import validate_entries
+from himon.league_of_comic_geeks import LeagueOfComicGeeks
+from himon.schemas.comic import Comic
+from himon.schemas.generic import GenericComic
+
+
+def get_title(comic: Comic) -> str:
+    """Project a Comic to its title."""
+    return comic.title
+
+
+@pytest.mark.parametrize("workers", [1, 2])
+def test_validate_entries(session: LeagueOfComicGeeks, workers: int) -> None:
+    """Test cached Comics validate the same in worker processes as in this one."""
+    entries = list(session.cache.iter_entries(prefixes=["/comic/format/json"]))
+    expected = {x["query"]: Comic.model_validate(json.loads(x["response"])) for x in entries}
+
+    assert dict(validate_entries(entries=entries, chunk_size=1)) == expected
+    assert dict(
+        validate_entries(entries=entries, projection=get_title, workers=workers, chunk_size=1)
+    ) == {query: comic.title for query, comic in expected.items()}
+
+
+def test_validate_entries_errors(session: LeagueOfComicGeeks) -> None:
+    """Test invalid entries are reported and skipped, and list responses are validated."""
+    entries = [
+        {"query": "/comic/format/json?comic_id=1", "response": '{"id": "Invalid"}'},
+        {"query": "/comic/format/json?comic_id=2", "response": '{"id": '},
+        *session.cache.iter_entries(prefixes=["/search/format/json"]),
+    ]
+    errors = []
+    results = dict(
+        validate_entries(
+            entries=entries,
+            model_type=GenericComic,
+            workers=1,
+            on_error=lambda query, _: errors.append(query),
+        )
+    )
+    assert errors == ["/comic/format/json?comic_id=1", "/comic/format/json?comic_id=2"]
+    assert results
+    assert all(isinstance(x, GenericComic) for value in results.values() for x in value)
+    with pytest.raises(ValueError, match="requires a projection"):
+        next(validate_entries(entries=entries, workers=2))
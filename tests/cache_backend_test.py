@@ -0,0 +1,76 @@
+"""The CacheBackend test module.
+
+This module contains tests for SQLiteCache, MemoryCache and ShardedFileCache as CacheBackends.
+"""
+
+from collections.abc import Callable
+from pathlib import Path
+
+import pytest
+
+from himon.cache_backend import CacheBackend
+from himon.file_cache import ShardedFileCache
+from himon.league_of_comic_geeks import LeagueOfComicGeeks
+from himon.memory_cache import MemoryCache
+from himon.sqlite_cache import SQLiteCache
+
+BACKENDS = {
+    "sqlite": lambda path, expiry: SQLiteCache(
+        path=path / "cache.sqlite", expiry=expiry, stale_expiry=0
+    ),
+    "memory": lambda _, expiry: MemoryCache(expiry=expiry),
+    "file": lambda path, expiry: ShardedFileCache(path=path / "files", expiry=expiry),
+}
+
+
+@pytest.mark.parametrize("backend", BACKENDS)
+def test_backend(backend: str, tmp_path: Path) -> None:
+    """Test each backend stores, retrieves and removes responses."""
+    cache = BACKENDS[backend](tmp_path, 14)
+    assert isinstance(cache, CacheBackend)
+
+    cache.insert(query="/comic/format/json?comic_id=1", response={"id": 1})
+    cache.insert_many(
+        entries={"/comic/format/json?comic_id=2": {"id": 2}, "/search/format/json?query=a": [1]}
+    )
+    assert cache.select(query="/comic/format/json?comic_id=1") == {"id": 1}
+    assert cache.select(query="/comic/format/json?comic_id=3") == {}
+    assert cache.select_many(
+        queries=["/comic/format/json?comic_id=2", "/search/format/json?query=a", "/unknown"]
+    ) == {"/comic/format/json?comic_id=2": {"id": 2}, "/search/format/json?query=a": [1]}
+    assert cache.contains(query="/comic/format/json?comic_id=2")
+
+    cache.delete(query="/comic/format/json?comic_id=1")
+    cache.delete_many(queries=["/comic/format/json?comic_id=2", "/unknown"])
+    assert not cache.contains(query="/comic/format/json?comic_id=1")
+    assert not cache.contains(query="/comic/format/json?comic_id=2")
+
+    stats = cache.stats()
+    assert stats.entries == 1
+    assert stats.size > 0
+    assert stats.hits == 3
+    assert stats.misses == 2
+
+
+@pytest.mark.parametrize("backend", BACKENDS)
+def test_backend_expiry(backend: str, tmp_path: Path) -> None:
+    """Test each backend ignores, then cleans up, expired responses."""
+    cache = BACKENDS[backend](tmp_path, -1)
+    cache.insert(query="/comic/format/json?comic_id=1", response={"id": 1})
+
+    assert cache.select(query="/comic/format/json?comic_id=1") == {}
+    assert cache.select_many(queries=["/comic/format/json?comic_id=1"]) == {}
+    assert not cache.contains(query="/comic/format/json?comic_id=1")
+    cache.cleanup()
+    assert cache.stats().entries == 0
+
+
+def test_memory_cache_session(offline_session: Callable[..., LeagueOfComicGeeks]) -> None:
+    """Test a session reads responses from a MemoryCache, without SQLite-only extras."""
+    memory_session = offline_session(
+        queries=["/comic/format/json?comic_id=2710631"], cache=MemoryCache()
+    )
+
+    result = memory_session.get_comic(comic_id=2710631)
+    assert result.id == 2710631
+    assert memory_session.lookup_by_identifier(identifier=result.upc) is None
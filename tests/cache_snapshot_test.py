@@ -0,0 +1,42 @@
+"""The CacheSnapshot test module.
+
+This module contains tests for exporting and importing cache snapshots.
+"""
+
+from pathlib import Path
+
+from himon.cache_snapshot import export_snapshot, import_snapshot
+from himon.sqlite_cache import SQLiteCache
+
+
+def test_snapshot(tmp_path: Path) -> None:
+    """Test a filtered snapshot is merged keeping the newest entries."""
+    source = SQLiteCache(path=tmp_path / "source.sqlite")
+    source.insert(query="/comic/format/json?comic_id=1", response={"id": "1"})
+    source.insert(query="/series/format/json?series_id=1", response={"id": "1"})
+    target = SQLiteCache(path=tmp_path / "target.sqlite")
+    target.insert(query="/comic/format/json?comic_id=1", response={"id": "newer"})
+    target.insert(query="/comic/format/json?comic_id=2", response={"id": "2"})
+
+    snapshot = tmp_path / "snapshot.jsonl.gz"
+    assert export_snapshot(cache=source, path=snapshot, endpoints=["/comic/format/json"]) == 1
+    assert import_snapshot(cache=target, path=snapshot) == 0
+    assert target.select(query="/comic/format/json?comic_id=1") == {"id": "newer"}
+    assert target.select(query="/series/format/json?series_id=1") == {}
+
+    assert export_snapshot(cache=target, path=snapshot) == 2
+    assert import_snapshot(cache=source, path=snapshot) == 2
+    assert source.select(query="/comic/format/json?comic_id=1") == {"id": "newer"}
+    assert source.select(query="/comic/format/json?comic_id=2") == {"id": "2"}
+
+
+def test_snapshot_expired(tmp_path: Path) -> None:
+    """Test expired entries are only exported when a max age is set."""
+    SQLiteCache(path=tmp_path / "source.sqlite").insert(
+        query="/series/format/json?series_id=1", response={"id": "1"}
+    )
+    source = SQLiteCache(path=tmp_path / "source.sqlite", expiry=-1, stale_expiry=2)
+
+    snapshot = tmp_path / "snapshot.jsonl.gz"
+    assert export_snapshot(cache=source, path=snapshot) == 0
+    assert export_snapshot(cache=source, path=snapshot, max_age=1) == 1
@@ -0,0 +1,56 @@
+"""The CacheWarmer test module.
+
+This module contains tests for CacheWarmer.
+"""
+
+from collections.abc import Callable
+from io import StringIO
+from pathlib import Path
+
+import pytest
+from pytest_httpx import HTTPXMock
+
+from himon.__main__ import read_ids
+from himon.cache_warmer import CacheWarmer
+from himon.league_of_comic_geeks import LeagueOfComicGeeks
+
+
+def test_warm(offline_session: Callable[..., LeagueOfComicGeeks], tmp_path: Path) -> None:
+    """Test fresh and checkpointed ids are skipped without making requests."""
+    offline = offline_session(queries=["/comic/format/json?comic_id=2710631"])
+    offline.cache.insert_negative(query="/comic/format/json?comic_id=1", status=404)
+    checkpoint = tmp_path / "warm.checkpoint"
+    checkpoint.write_text("series:100096\n")
+
+    warmer = CacheWarmer(session=offline, checkpoint=checkpoint)
+    progress = warmer.warm(ids=[("comic", 2710631), ("comic", 1), ("series", 100096)])
+    assert progress.total == 3
+    assert progress.skipped == 3
+    assert progress.fetched == 0
+    assert progress.failed == 0
+    assert not checkpoint.exists()
+
+
+def test_warm_rate_limited(
+    offline_session: Callable[..., LeagueOfComicGeeks], tmp_path: Path, httpx_mock: HTTPXMock
+) -> None:
+    """Test ids stopped by the rate limit fail without being checkpointed."""
+    httpx_mock.add_response(status_code=429, headers={"Retry-After": "60"})
+    checkpoint = tmp_path / "warm.checkpoint"
+
+    warmer = CacheWarmer(session=offline_session(), checkpoint=checkpoint, workers=1)
+    progress = warmer.warm(ids=[("comic", 1)])
+    assert progress.failed == 1
+    assert not checkpoint.exists()
+
+
+def test_read_ids(capsys: pytest.CaptureFixture[str]) -> None:
+    """Test invalid ids are skipped with a warning giving their file and line number."""
+    stream = StringIO("# Comics\n2710631\n\nBlackest Night\n6257084  # Variant\n")
+    stream.name = "comics.txt"
+
+    assert list(read_ids(kind="comic", streams=[stream])) == [
+        ("comic", 2710631),
+        ("comic", 6257084),
+    ]
+    assert "comics.txt:4: Skipping invalid comic id `Blackest Night`" in capsys.readouterr().err
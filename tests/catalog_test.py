@@ -0,0 +1,35 @@
+"""The Catalog test module.
+
+This module contains tests for Catalog.
+"""
+
+from datetime import date
+from pathlib import Path
+
+from himon.catalog import Catalog
+from himon.league_of_comic_geeks import LeagueOfComicGeeks
+from himon.schemas.comic import KeyEventType
+
+
+def test_catalog(session: LeagueOfComicGeeks, tmp_path: Path) -> None:
+    """Test Comics are queryable by Series, Creator, Character and Key Event."""
+    catalog = Catalog(path=tmp_path / "catalog.sqlite")
+    for comic_id in (2710631, 6257084):
+        catalog.add_comic(comic=session.get_comic(comic_id=comic_id))
+    catalog.add_comic(comic=session.get_comic(comic_id=2710631))
+
+    assert catalog.comics_by_series(series_id=100096) == [2710631]
+    assert catalog.comics_by_creator(creator_id=257) == [2710631]
+    assert catalog.comics_by_creator(creator_id=257, role="writer") == [2710631]
+    assert catalog.comics_by_creator(creator_id=257, role="Colorist") == []
+    assert catalog.comics_by_character(character_id=42) == [2710631]
+
+    events = catalog.key_events(
+        key_event_type=KeyEventType.FIRST_APPEARANCE,
+        released_after=date(2009, 1, 1),
+        released_before=date(2009, 12, 31),
+    )
+    assert len(events) >= 1
+    assert {x["comic_id"] for x in events} == {2710631}
+    assert events[0]["date_release"] == date(2009, 7, 15)
+    assert catalog.key_events(released_after=date(2025, 1, 1)) == []
@@ -0,0 +1,65 @@
+"""The CircuitBreaker test module.
+
+This module contains tests for CircuitBreaker.
+"""
+
+from collections.abc import Callable
+from pathlib import Path
+
+import pytest
+from pytest_httpx import HTTPXMock
+
+from himon.circuit_breaker import CircuitBreaker, CircuitState
+from himon.exceptions import CircuitOpenError, ServiceError
+from himon.league_of_comic_geeks import LeagueOfComicGeeks
+from himon.sqlite_cache import SQLiteCache
+
+
+def test_circuit_breaker() -> None:
+    """Test a circuit opens after repeated failures and is closed by a successful probe."""
+    breaker = CircuitBreaker(failure_threshold=2, reset_timeout=60)
+    breaker.record(endpoint="/comic/format/json", success=False)
+    assert breaker.state(endpoint="/comic/format/json") == CircuitState.CLOSED
+    breaker.record(endpoint="/comic/format/json", success=False)
+    assert breaker.states() == {"/comic/format/json": CircuitState.OPEN}
+    with pytest.raises(CircuitOpenError):
+        breaker.before_request(endpoint="/comic/format/json")
+    breaker.before_request(endpoint="/series/format/json")
+
+    breaker.reset_timeout = 0
+    assert breaker.state(endpoint="/comic/format/json") == CircuitState.HALF_OPEN
+    breaker.before_request(endpoint="/comic/format/json")
+    with pytest.raises(CircuitOpenError):
+        breaker.before_request(endpoint="/comic/format/json")
+    breaker.record(endpoint="/comic/format/json", success=True)
+    assert breaker.state(endpoint="/comic/format/json") == CircuitState.CLOSED
+
+
+def test_circuit_open(
+    offline_session: Callable[..., LeagueOfComicGeeks], tmp_path: Path, httpx_mock: HTTPXMock
+) -> None:
+    """Test an open circuit fails fast, serving expired entries, until the service recovers."""
+    cache = SQLiteCache(path=tmp_path / "cache.sqlite", expiry=-1, stale_expiry=2)
+    cache.insert(query="/series/format/json?series_id=1", response={"id": 1})
+    breaker = CircuitBreaker(failure_threshold=2, reset_timeout=60)
+    session = offline_session(cache=cache, circuit_breaker=breaker)
+    httpx_mock.add_response(status_code=503)
+    httpx_mock.add_response(status_code=503)
+    for _ in range(2):
+        with pytest.raises(ServiceError):
+            session._get_request(endpoint="/series/format/json", params={"series_id": "1"})  # noqa: SLF001
+    assert breaker.state(endpoint="/series/format/json") == CircuitState.OPEN
+
+    assert session._get_request(  # noqa: SLF001
+        endpoint="/series/format/json", params={"series_id": "1"}
+    ) == {"id": 1}
+    with pytest.raises(CircuitOpenError):
+        session._get_request(endpoint="/series/format/json", params={"series_id": "2"})  # noqa: SLF001
+    assert len(httpx_mock.get_requests()) == 2
+
+    breaker.reset_timeout = 0
+    httpx_mock.add_response(json={"id": 2})
+    assert session._get_request(  # noqa: SLF001
+        endpoint="/series/format/json", params={"series_id": "2"}
+    ) == {"id": 2}
+    assert breaker.state(endpoint="/series/format/json") == CircuitState.CLOSED
@@ -0,0 +1,40 @@
+"""The ComicCollection test module.
+
+This module contains tests for ComicCollection.
+"""
+
+from datetime import date
+
+import pytest
+
+from himon.comic_collection import ComicCollection
+from himon.league_of_comic_geeks import LeagueOfComicGeeks
+from himon.schemas.generic import ComicFormat
+
+
+def test_comic_collection(session: LeagueOfComicGeeks) -> None:
+    """Test Comics are filtered and grouped using the collection indexes."""
+    first = session.get_comic(comic_id=2710631)
+    second = session.get_comic(comic_id=6257084)
+    collection = ComicCollection(comics=[second, first])
+
+    assert len(collection) == 2
+    assert collection[1] is first
+    assert collection.get(comic_id=2710631) is first
+    assert collection.get(comic_id=-1) is None
+    assert collection.filter() == [second, first]
+    assert collection.filter(series_id=100096) == [first]
+    assert collection.filter(format=ComicFormat.COMIC, publisher_id=first.publisher_id) == [first]
+    assert collection.filter(creator_id=257, role="writer") == [first]
+    assert collection.filter(creator_id=257, role="Colorist") == []
+    assert collection.filter(character_id=42) == [first]
+    assert collection.filter(
+        released_after=date(2009, 1, 1), released_before=date(2009, 12, 31)
+    ) == [first]
+    assert collection.filter(series_id=100096, released_after=date(2025, 1, 1)) == []
+
+    groups = collection.group_by(key="series_id")
+    assert groups[100096] == [first]
+    assert sum(len(x) for x in groups.values()) == 2
+    with pytest.raises(ValueError, match="Unable to group by"):
+        collection.group_by(key="title")
@@ -4,10 +4,14 @@
 """
 
 import os
+import shutil
+from collections.abc import Callable, Generator, Iterable
 from pathlib import Path
+from typing import Any
 
 import pytest
 
+from himon.cache_backend import CacheBackend
 from himon.league_of_comic_geeks import LeagueOfComicGeeks
 from himon.sqlite_cache import SQLiteCache
 
@@ -31,14 +35,56 @@ def access_token() -> str | None:
 
 
 @pytest.fixture(scope="session")
-def session(client_id: str, client_secret: str, access_token: str | None) -> LeagueOfComicGeeks:
-    """Set the Himon session fixture."""
-    service = LeagueOfComicGeeks(
+def session(
+    client_id: str,
+    client_secret: str,
+    access_token: str | None,
+    tmp_path_factory: pytest.TempPathFactory,
+) -> LeagueOfComicGeeks:
+    """Set the Himon session fixture, using a copy of the test cache so it's never modified."""
+    cache_path = tmp_path_factory.mktemp("session") / "cache.sqlite"
+    shutil.copyfile(Path("tests/cache.sqlite"), cache_path)
+    return LeagueOfComicGeeks(
         client_id=client_id,
         client_secret=client_secret,
         access_token=access_token,
-        cache=SQLiteCache(path=Path("tests/cache.sqlite"), expiry=None),
+        cache=SQLiteCache(path=cache_path, expiry=None),
     )
-    if not access_token:
-        service.access_token = service.generate_access_token()
-    return service
+
+
+@pytest.fixture
+def offline_session(
+    session: LeagueOfComicGeeks, tmp_path: Path
+) -> Callable[..., LeagueOfComicGeeks]:
+    """Create sessions with placeholder credentials, caching copies of test cache entries.
+
+    The returned function takes the queries to copy, the cache to copy them into, a temporary
+    SQLiteCache if not set, and any other arguments of LeagueOfComicGeeks.
+    """
+
+    def _offline_session(
+        queries: Iterable[str] = (), cache: CacheBackend | None = None, **kwargs: Any
+    ) -> LeagueOfComicGeeks:
+        if cache is None:
+            cache = SQLiteCache(path=tmp_path / "offline.sqlite")
+        if queries:
+            cache.insert_many(entries=session.cache.select_many(queries=queries))
+        return LeagueOfComicGeeks(
+            **{
+                "client_id": "Invalid",
+                "client_secret": "Invalid",
+                "access_token": "Invalid",
+                "cache": cache,
+                **kwargs,
+            }
+        )
+
+    return _offline_session
+
+
+@pytest.fixture(autouse=True)
+def mocked_rate_limit(request: pytest.FixtureRequest) -> Generator[None]:
+    """Return the rate limit tokens used by mocked requests, they never reach the API."""
+    yield
+    if "httpx_mock" in request.fixturenames:
+        LeagueOfComicGeeks._get_limiter().buckets()[0].flush()  # noqa: SLF001
@@ -0,0 +1,54 @@
+"""The FrozenCache test module.
+
+This module contains tests for FrozenCache.
+"""
+
+from collections.abc import Callable
+from pathlib import Path
+
+from himon.frozen_cache import FrozenCache
+from himon.league_of_comic_geeks import LeagueOfComicGeeks
+from himon.sqlite_cache import SQLiteCache
+
+
+def test_frozen_cache(
+    session: LeagueOfComicGeeks, offline_session: Callable[..., LeagueOfComicGeeks], tmp_path: Path
+) -> None:
+    """Test entries are read from the snapshot before the cache."""
+    cache = SQLiteCache(path=tmp_path / "cache.sqlite")
+    cache.insert(
+        query="/comic/format/json?comic_id=2710631",
+        response=session.cache.select(query="/comic/format/json?comic_id=2710631"),
+    )
+    for index in range(100):
+        cache.insert(query=f"/series/format/json?series_id={index}", response={"id": index})
+
+    snapshot = FrozenCache.build(cache=cache, path=tmp_path / "cache.frozen")
+    try:
+        assert len(snapshot) == 101
+        assert snapshot.select(query="/series/format/json?series_id=42") == {"id": 42}
+        assert snapshot.select(query="/series/format/json?series_id=100") == {}
+        assert "/comic/format/json?comic_id=2710631" in snapshot
+        raw = snapshot.select_raw(query="/series/format/json?series_id=42")
+
+        offline = offline_session(snapshot=snapshot)
+        assert offline.get_comic(comic_id=2710631).title == "Blackest Night #1"
+    finally:
+        snapshot.close()
+    # Entries read are copies, so remain usable once the snapshot is closed
+    assert raw == b'{"id": 42}'
+
+
+def test_frozen_cache_expired(tmp_path: Path) -> None:
+    """Test expired entries aren't frozen."""
+    SQLiteCache(path=tmp_path / "cache.sqlite").insert(
+        query="/series/format/json?series_id=1", response={"id": 1}
+    )
+    cache = SQLiteCache(path=tmp_path / "cache.sqlite", expiry=-1, stale_expiry=2)
+
+    snapshot = FrozenCache.build(cache=cache, path=tmp_path / "cache.frozen")
+    try:
+        assert len(snapshot) == 0
+        assert "/series/format/json?series_id=1" not in snapshot
+    finally:
+        snapshot.close()
@@ -0,0 +1,29 @@
+"""The Frozen test module.
+
+This module contains tests for the frozen model variants.
+"""
+
+import pytest
+from pydantic import TypeAdapter, ValidationError
+
+from himon.league_of_comic_geeks import LeagueOfComicGeeks
+from himon.schemas.frozen import FrozenComic, FrozenSeries, freeze
+
+
+def test_frozen_comic(session: LeagueOfComicGeeks) -> None:
+    """Test frozen Comics are immutable, hashable and not revalidated when nested."""
+    result = session.cache.select(query="/comic/format/json?comic_id=2710631")
+    comic = TypeAdapter(FrozenComic).validate_python(result)
+    assert isinstance(comic.series, FrozenSeries)
+    assert isinstance(comic.creators, tuple)
+    assert comic.creators[0].roles
+
+    with pytest.raises(ValidationError):
+        comic.title = "Invalid"
+    assert FrozenComic.model_validate(comic) is comic
+
+    frozen = freeze(model=session.get_comic(comic_id=2710631))
+    assert frozen == comic
+    assert hash(frozen) == hash(comic)
+    assert len({frozen, comic, comic.series}) == 2
+    assert freeze(model=comic) is comic
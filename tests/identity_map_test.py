@@ -0,0 +1,27 @@
+"""The IdentityMap test module.
+
+This module contains tests for IdentityMap.
+"""
+
+from collections.abc import Callable
+
+from himon.identity_map import IdentityMap
+from himon.league_of_comic_geeks import LeagueOfComicGeeks
+
+
+def test_identity_map(
+    session: LeagueOfComicGeeks, offline_session: Callable[..., LeagueOfComicGeeks]
+) -> None:
+    """Test repeated strings and sub-objects are shared between compacted Comics."""
+    compact = offline_session(
+        queries=["/comic/format/json?comic_id=2710631"], identity_map=IdentityMap()
+    )
+
+    first = compact.get_comic(comic_id=2710631)
+    second = compact.get_comic(comic_id=2710631)
+    assert first is not second
+    assert first.series is second.series
+    assert first.creators[0] is second.creators[0]
+    assert first.collected_in[0] is second.collected_in[0]
+    assert first.characters[0].universe_name is second.characters[0].universe_name
+    assert first == session.get_comic(comic_id=2710631)
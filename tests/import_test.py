@@ -0,0 +1,45 @@
+"""The Import test module.
+
+This module contains tests guarding the import time of himon.
+"""
+
+import subprocess
+import sys
+
+
+def _imported_modules(statement: str) -> set[str]:
+    output = subprocess.run(  # noqa: S603
+        [sys.executable, "-c", f"import sys; {statement}; print(' '.join(sys.modules))"],
+        capture_output=True,
+        check=True,
+        text=True,
+    )
+    return set(output.stdout.split())
+
+
+def test_package_import() -> None:
+    """Test importing the package doesn't import its dependencies."""
+    modules = _imported_modules("import himon")
+    assert not {"httpx", "pydantic", "pyrate_limiter", "himon.league_of_comic_geeks"} & modules
+
+
+def test_client_import() -> None:
+    """Test importing the client doesn't import httpx or the rate limiter until used."""
+    modules = _imported_modules(
+        "import himon.league_of_comic_geeks; from himon.schemas.comic import Comic; "
+        "assert not Comic.__pydantic_complete__"
+    )
+    assert "himon.schemas.comic" in modules
+    assert not {"httpx", "pyrate_limiter"} & modules
+
+
+def test_lazy_attributes() -> None:
+    """Test the main classes are available from the packages."""
+    import himon  # noqa: PLC0415
+    from himon import schemas  # noqa: PLC0415
+    from himon.league_of_comic_geeks import LeagueOfComicGeeks  # noqa: PLC0415
+    from himon.schemas.comic import Comic  # noqa: PLC0415
+
+    assert himon.LeagueOfComicGeeks is LeagueOfComicGeeks
+    assert schemas.Comic is Comic
+    assert "SQLiteCache" in dir(himon)
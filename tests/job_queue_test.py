@@ -0,0 +1,76 @@
+"""The JobQueue test module.
+
+This module contains tests for JobQueue.
+"""
+
+import re
+from collections.abc import Callable
+from pathlib import Path
+
+import pytest
+from pytest_httpx import HTTPXMock
+
+from himon.job_queue import LEASE_EXPIRED, Job, JobQueue, JobStatus
+from himon.league_of_comic_geeks import LeagueOfComicGeeks
+
+
+def test_enqueue(tmp_path: Path) -> None:
+    """Test pending lookups are deduplicated and survive reopening the queue."""
+    queue = JobQueue(path=tmp_path / "jobs.sqlite")
+    job_id = queue.enqueue(kind="comic", value=2710631)
+    assert queue.enqueue(kind="comic", value="2710631") == job_id
+    assert queue.enqueue(kind="search", value="Blackest Night") != job_id
+    with pytest.raises(ValueError, match="Unknown type"):
+        queue.enqueue(kind="publisher", value=1)
+
+    reopened = JobQueue(path=tmp_path / "jobs.sqlite")
+    assert reopened.get(job_id=job_id).status == JobStatus.PENDING
+    assert reopened.counts()[JobStatus.PENDING] == 2
+    assert reopened.claim().id == job_id
+    assert reopened.get(job_id=job_id).status == JobStatus.RUNNING
+
+
+def test_drain(
+    session: LeagueOfComicGeeks,
+    offline_session: Callable[..., LeagueOfComicGeeks],
+    tmp_path: Path,
+    httpx_mock: HTTPXMock,
+) -> None:
+    """Test Jobs are run and cached, retrying errors and failing not found lookups."""
+    result = session.cache.select(query="/comic/format/json?comic_id=2710631")
+    httpx_mock.add_response(url=re.compile(r".*comic_id=1$"), status_code=404)
+    httpx_mock.add_response(url=re.compile(r".*comic_id=2710631$"), status_code=500)
+    httpx_mock.add_response(url=re.compile(r".*comic_id=2710631$"), json=result)
+    draining = offline_session()
+    queue = JobQueue(path=tmp_path / "jobs.sqlite", retry_delay=0)
+    found = queue.enqueue(kind="comic", value=2710631)
+    missing = queue.enqueue(kind="comic", value=1)
+
+    finished: list[Job] = []
+    assert queue.drain(session=draining, callback=finished.append, poll_interval=0) == 3
+    assert {x.id: x.status for x in finished} == {found: JobStatus.DONE, missing: JobStatus.FAILED}
+    assert queue.get(job_id=found).attempts == 2
+    assert queue.get(job_id=missing).attempts == 1
+    assert draining.cache.contains(query="/comic/format/json?comic_id=2710631")
+
+
+def test_drain_invalid(offline_session: Callable[..., LeagueOfComicGeeks], tmp_path: Path) -> None:
+    """Test Jobs which can't succeed are failed without retrying."""
+    queue = JobQueue(path=tmp_path / "jobs.sqlite", retry_delay=0)
+    job_id = queue.enqueue(kind="comic", value="Invalid")
+
+    assert queue.drain(session=offline_session(), poll_interval=0) == 1
+    assert queue.get(job_id=job_id).status == JobStatus.FAILED
+    assert queue.get(job_id=job_id).attempts == 1
+
+
+def test_lease_expired(tmp_path: Path) -> None:
+    """Test a Job whose lease expired is failed once it's out of attempts."""
+    queue = JobQueue(path=tmp_path / "jobs.sqlite", max_attempts=2, lease=0)
+    job_id = queue.enqueue(kind="comic", value=2710631)
+    assert queue.claim().attempts == 1
+    assert queue.claim().attempts == 2
+
+    assert queue.claim() is None
+    assert queue.get(job_id=job_id).status == JobStatus.FAILED
+    assert queue.get(job_id=job_id).error == LEASE_EXPIRED
@@ -0,0 +1,65 @@
+"""The Prefetcher test module.
+
+This module contains tests for Prefetcher.
+"""
+
+import re
+from collections.abc import Callable
+
+from pytest_httpx import HTTPXMock
+
+from himon.league_of_comic_geeks import LeagueOfComicGeeks
+from himon.prefetcher import Prefetcher
+
+
+def test_prefetcher(
+    session: LeagueOfComicGeeks,
+    offline_session: Callable[..., LeagueOfComicGeeks],
+    httpx_mock: HTTPXMock,
+) -> None:
+    """Test the Comics related to a requested Comic are cached in the background."""
+    result = session.cache.select(query="/comic/format/json?comic_id=2710631")
+    httpx_mock.add_response(
+        url=re.compile(r".*/comic/format/json.*"), json=result, is_reusable=True
+    )
+    related = {x["id"] for x in [*result["variants"], *result["collected_in"]]}
+
+    prefetching = offline_session()
+    prefetcher = Prefetcher(session=prefetching, reserve=0)
+    try:
+        prefetching.get_comic(comic_id=2710631)
+        assert prefetcher.join(timeout=30)
+    finally:
+        prefetcher.close()
+    assert prefetching.prefetcher is None
+
+    # Prefetched Comics don't queue their own related Comics, the Series is embedded
+    assert len(httpx_mock.get_requests()) == len(related) + 1
+    for comic_id in related:
+        assert prefetching.cache.contains(query=f"/comic/format/json?comic_id={comic_id}")
+
+
+def test_prefetcher_rate_limited(
+    session: LeagueOfComicGeeks,
+    offline_session: Callable[..., LeagueOfComicGeeks],
+    httpx_mock: HTTPXMock,
+) -> None:
+    """Test ids stopped by the rate limit are requeued, and failures don't stop the thread."""
+    result = session.cache.select(query="/comic/format/json?comic_id=2710631")
+    httpx_mock.add_response(status_code=429, headers={"Retry-After": "1"})
+    httpx_mock.add_response(status_code=500)
+    httpx_mock.add_response(json=result)
+
+    prefetching = offline_session()
+    prefetcher = Prefetcher(session=prefetching, reserve=0, backoff=0)
+    try:
+        prefetcher.queue(kind="comic", ids=[1])
+        assert prefetcher.join(timeout=30)
+        prefetcher.queue(kind="comic", ids=[2])
+        assert prefetcher.join(timeout=30)
+    finally:
+        prefetcher.close()
+
+    assert len(httpx_mock.get_requests()) == 3
+    assert not prefetching.cache.contains(query="/comic/format/json?comic_id=1")
+    assert prefetching.cache.contains(query="/comic/format/json?comic_id=2")
@@ -0,0 +1,28 @@
+"""The Profiling test module.
+
+This module contains tests for profile.
+"""
+
+from pathlib import Path
+
+import pytest
+
+import himon
+from himon.league_of_comic_geeks import LeagueOfComicGeeks
+
+
+def test_profile(session: LeagueOfComicGeeks, tmp_path: Path) -> None:
+    """Test calls made inside a profile are bucketed by stage."""
+    with himon.profile(path=tmp_path / "himon.prof") as profile:
+        session.get_comic(comic_id=2710631)
+        with pytest.raises(RuntimeError, match="Only one profile"), himon.profile():
+            pass
+
+    assert profile.stages["validate:Comic"].calls == 1
+    assert profile.stages["cache"].calls >= 1
+    assert profile.stats is not None
+    assert profile.snapshot is not None
+    assert "validate:Comic" in profile.summary(limit=5)
+    assert (tmp_path / "himon.prof").exists()
+    assert (tmp_path / "himon.txt").exists()
+    assert (tmp_path / "himon.tracemalloc").exists()
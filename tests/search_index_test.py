@@ -0,0 +1,29 @@
+"""The SearchIndex test module.
+
+This module contains tests for SearchIndex.
+"""
+
+from collections.abc import Callable
+from pathlib import Path
+
+from himon.league_of_comic_geeks import LeagueOfComicGeeks
+from himon.search_index import SearchIndex
+
+
+def test_search_local(
+    session: LeagueOfComicGeeks, offline_session: Callable[..., LeagueOfComicGeeks], tmp_path: Path
+) -> None:
+    """Test searching cached Comics by title, creator and character."""
+    search_index = SearchIndex(path=tmp_path / "search.sqlite")
+    search_index.rebuild(cache=session.cache)
+    offline = offline_session(search_index=search_index)
+
+    results = offline.search_local(search_term="Blackest Night #1")
+    result = next(x for x in results if x.id == 2710631)
+    assert result.title == "Blackest Night #1"
+    assert result.series_name == "Blackest Night"
+    assert result.series_begin == 2009
+
+    assert 2710631 in {x.id for x in offline.search_local(search_term="geoff johns")}
+    assert 6257084 in {x.id for x in offline.search_local(search_term="wanda")}
+    assert offline.search_local(search_term="Unknown Title") == []
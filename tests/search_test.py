@@ -3,11 +3,17 @@
 This module contains tests for SearchResult objects.
 """
 
+from collections.abc import Callable
 from datetime import date
 from decimal import Decimal
+from pathlib import Path
 
-from himon.league_of_comic_geeks import LeagueOfComicGeeks
+import pytest
+from pytest_httpx import HTTPXMock
+
+from himon.league_of_comic_geeks import LeagueOfComicGeeks, iter_json_array
 from himon.schemas.generic import ComicFormat
+from himon.sqlite_cache import SQLiteCache
 
 
 def test_search(session: LeagueOfComicGeeks) -> None:
@@ -37,3 +43,59 @@ def test_search(session: LeagueOfComicGeeks) -> None:
     assert result.count_pulls == 45
     assert result.is_enabled is True
     assert result.date_collected is None
+
+
+def test_iter_search_cached(session: LeagueOfComicGeeks) -> None:
+    """Test streaming cached search results with a limit."""
+    results = list(session.iter_search(search_term="Blackest Night #1", limit=2))
+    assert len(results) == 2
+    assert [x.id for x in results] == [x.id for x in session.search("Blackest Night #1")[:2]]
+
+
+def test_iter_search_stream(
+    session: LeagueOfComicGeeks,
+    offline_session: Callable[..., LeagueOfComicGeeks],
+    httpx_mock: HTTPXMock,
+) -> None:
+    """Test search results are streamed and only cached once fully read."""
+    results = session.cache.select(query="/search/format/json?query=Blackest+Night+%231")
+    httpx_mock.add_response(json=results, is_reusable=True)
+    streaming = offline_session()
+    cache = streaming.cache
+
+    first = next(streaming.iter_search(search_term="Blackest Night #1", limit=1))
+    assert first.id == int(results[0]["id"])
+    assert cache.select(query="/search/format/json?query=Blackest+Night+%231") == {}
+
+    assert len(list(streaming.iter_search(search_term="Blackest Night #1"))) == len(results)
+    assert cache.select(query="/search/format/json?query=Blackest+Night+%231") == results
+
+
+def test_iter_search_not_modified(
+    session: LeagueOfComicGeeks,
+    offline_session: Callable[..., LeagueOfComicGeeks],
+    tmp_path: Path,
+    httpx_mock: HTTPXMock,
+) -> None:
+    """Test expired search results are revalidated before being streamed."""
+    query = "/search/format/json?query=Blackest+Night+%231"
+    results = session.cache.select(query=query)
+    cache = SQLiteCache(path=tmp_path / "cache.sqlite", expiry=-1, stale_expiry=2)
+    cache.insert(query=query, response=results, etag='"abc"')
+    httpx_mock.add_response(status_code=304, match_headers={"If-None-Match": '"abc"'})
+    streaming = offline_session(cache=cache)
+
+    streamed = list(streaming.iter_search(search_term="Blackest Night #1"))
+    assert [x.id for x in streamed] == [int(x["id"]) for x in results]
+
+
+def test_iter_json_array() -> None:
+    """Test Json array items are decoded across chunk boundaries."""
+    text = '[{"id": 1, "title": "A, ]"}, 12345, [2, 3]]'
+    chunks = [text[x : x + 3] for x in range(0, len(text), 3)]
+    assert list(iter_json_array(chunks=chunks)) == [{"id": 1, "title": "A, ]"}, 12345, [2, 3]]
+    assert list(iter_json_array(chunks=["{}"])) == []
+    with pytest.raises(ValueError, match="Expected a Json array"):
+        list(iter_json_array(chunks=['{"error": "Invalid"}']))
+    with pytest.raises(ValueError, match="Expecting"):
+        list(iter_json_array(chunks=["[1, 2"]))
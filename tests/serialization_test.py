@@ -0,0 +1,61 @@
+"""The Serialization test module.
+
+This module contains tests for to_bytes and from_bytes.
+"""
+
+import pytest
+
+from himon.league_of_comic_geeks import LeagueOfComicGeeks
+from himon.schemas import BaseModel
+from himon.schemas.comic import Comic
+from himon.schemas.frozen import FrozenComic, freeze
+from himon.schemas.series import Series
+from himon.serialization import Codec, from_bytes, to_bytes
+
+
+@pytest.mark.parametrize("trusted", [True, False])
+def test_round_trip(session: LeagueOfComicGeeks, trusted: bool) -> None:
+    """Test Comics and Series are unchanged after being serialized."""
+    comic = session.get_comic(comic_id=2710631)
+    data = to_bytes(model=comic, codec=Codec.JSON)
+    assert len(data) < len(comic.model_dump_json())
+    assert from_bytes(data=data, model_type=Comic, trusted=trusted) == comic
+    assert Series.from_bytes(comic.series.to_bytes(), trusted=trusted) == comic.series
+
+    frozen = freeze(model=comic)
+    assert FrozenComic.from_bytes(frozen.to_bytes(), trusted=trusted) == frozen
+
+
+def test_msgpack(session: LeagueOfComicGeeks) -> None:
+    """Test the msgpack codec, if it's installed."""
+    pytest.importorskip("msgpack")
+    comic = session.get_comic(comic_id=6257084)
+    assert Comic.from_bytes(to_bytes(model=comic, codec=Codec.MSGPACK)) == comic
+
+
+def test_invalid_payload() -> None:
+    """Test payloads without the header are rejected."""
+    with pytest.raises(ValueError, match="Payload isn't"):
+        from_bytes(data=b'{"id": 1}', model_type=Series)
+
+
+def test_changed_fields() -> None:
+    """Test payloads are rejected once the fields of their model are reordered or retyped."""
+
+    class Before(BaseModel):
+        id: int
+        title: str
+
+    class Reordered(BaseModel):
+        title: str
+        id: int
+
+    class Retyped(BaseModel):
+        id: str
+        title: str
+
+    data = to_bytes(model=Before(id=1, title="Title"), codec=Codec.JSON)
+    assert from_bytes(data=data, model_type=Before, trusted=True) == Before(id=1, title="Title")
+    for model_type in (Reordered, Retyped, Series):
+        with pytest.raises(ValueError, match="fields have changed"):
+            from_bytes(data=data, model_type=model_type, trusted=True)
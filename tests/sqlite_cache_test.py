@@ -0,0 +1,265 @@
+"""The SQLiteCache test module.
+
+This module contains tests for SQLiteCache.
+"""
+
+import json
+import sqlite3
+import time
+from collections.abc import Callable
+from pathlib import Path
+
+import pytest
+from pytest_httpx import HTTPXMock
+
+from himon.cache_snapshot import export_snapshot, import_snapshot
+from himon.exceptions import NotFoundError
+from himon.league_of_comic_geeks import LeagueOfComicGeeks
+from himon.sqlite_cache import SQLiteCache
+
+
+def test_negative_cache(tmp_path: Path) -> None:
+    """Test misses are stored separately from the cached responses."""
+    cache = SQLiteCache(path=tmp_path / "cache.sqlite")
+    cache.insert_negative(query="/comic/format/json?comic_id=1", status=404)
+    cache.insert_negative(query="/search/format/json?query=Invalid", status=200, response=[])
+
+    assert cache.select(query="/comic/format/json?comic_id=1") == {}
+    assert cache.select_negative(query="/comic/format/json?comic_id=1") == (404, None)
+    assert cache.select_negative(query="/search/format/json?query=Invalid") == (200, [])
+    assert cache.select_negative(query="/series/format/json?series_id=1") is None
+
+    cache.delete(query="/comic/format/json?comic_id=1")
+    assert cache.select_negative(query="/comic/format/json?comic_id=1") is None
+
+
+def test_negative_cache_expiry(tmp_path: Path) -> None:
+    """Test misses expire using their own expiry."""
+    cache = SQLiteCache(path=tmp_path / "cache.sqlite", negative_expiry=-1)
+    cache.insert_negative(query="/comic/format/json?comic_id=1", status=404)
+    assert cache.select_negative(query="/comic/format/json?comic_id=1") is None
+
+
+def test_stale_entry(tmp_path: Path) -> None:
+    """Test expired entries are kept for revalidation until touched."""
+    cache = SQLiteCache(path=tmp_path / "cache.sqlite", expiry=-1, stale_expiry=2)
+    short_cache = SQLiteCache(path=tmp_path / "cache.sqlite", expiry=-1, stale_expiry=0)
+    cache.insert(query="/series/format/json?series_id=1", response={"id": 1}, etag='"abc"')
+
+    assert cache.select(query="/series/format/json?series_id=1") == {}
+    assert short_cache.select_stale(query="/series/format/json?series_id=1") == {}
+    assert cache.select_stale(query="/series/format/json?series_id=1") == {
+        "response": {"id": 1},
+        "etag": '"abc"',
+        "last_modified": None,
+    }
+
+
+def test_not_modified(
+    offline_session: Callable[..., LeagueOfComicGeeks], tmp_path: Path, httpx_mock: HTTPXMock
+) -> None:
+    """Test an expired entry is refreshed by a Not Modified response."""
+    cache = SQLiteCache(path=tmp_path / "cache.sqlite", expiry=-1, stale_expiry=2)
+    cache.insert(query="/series/format/json?series_id=1", response={"id": 1}, etag='"abc"')
+    httpx_mock.add_response(status_code=304, match_headers={"If-None-Match": '"abc"'})
+    session = offline_session(cache=cache)
+
+    assert session._get_request(  # noqa: SLF001
+        endpoint="/series/format/json", params={"series_id": "1"}
+    ) == {"id": 1}
+
+
+def test_cached_not_found(offline_session: Callable[..., LeagueOfComicGeeks]) -> None:
+    """Test a cached not found is raised without making a request."""
+    session = offline_session()
+    session.cache.insert_negative(query="/comic/format/json?comic_id=1", status=404)
+    session.cache.insert_negative(
+        query="/search/format/json?query=Invalid", status=200, response=[]
+    )
+
+    with pytest.raises(NotFoundError):
+        session.get_comic(comic_id=1)
+    assert session.search(search_term="Invalid") == []
+
+
+def test_embedded_series(
+    session: LeagueOfComicGeeks,
+    offline_session: Callable[..., LeagueOfComicGeeks],
+    httpx_mock: HTTPXMock,
+) -> None:
+    """Test the Series embedded in a requested Comic is used by get_series."""
+    httpx_mock.add_response(json=session.cache.select(query="/comic/format/json?comic_id=2710631"))
+    offline = offline_session()
+    assert not offline.is_cached(kind="series", entity_id=100096)
+    offline.get_comic(comic_id=2710631)
+
+    assert offline.is_cached(kind="comic", entity_id=2710631)
+    assert offline.is_cached(kind="series", entity_id=100096)
+    assert offline.cache.select_entity(entity_type="generic_comic", entity_id=5608951) != {}
+    result = offline.get_series(series_id=100096)
+    assert result.id == 100096
+    assert result.title == "Blackest Night"
+
+
+def test_lookup_by_identifier(
+    session: LeagueOfComicGeeks,
+    offline_session: Callable[..., LeagueOfComicGeeks],
+    httpx_mock: HTTPXMock,
+) -> None:
+    """Test Comics and Variants can be found by their identifiers once requested."""
+    httpx_mock.add_response(json=session.cache.select(query="/comic/format/json?comic_id=2710631"))
+    offline = offline_session()
+    assert offline.lookup_by_identifier(identifier="MAY090106") is None
+    offline.get_comic(comic_id=2710631)
+
+    assert offline.lookup_by_identifier(identifier=76194128446000111) == 2710631
+    assert offline.lookup_by_identifier(identifier="76194128446000111", kind="upc") == 2710631
+    assert offline.lookup_by_identifier(identifier="0076194128446000111", kind="upc") == 2710631
+    assert offline.lookup_by_identifier(identifier="761941284460", kind="upc") is None
+    assert offline.lookup_by_identifier(identifier="7") is None
+    assert offline.lookup_by_identifier(identifier="may090106", kind="sku_diamond") == 2710631
+    assert offline.lookup_by_identifier(identifier="MAY090107") == 1021704
+    assert offline.lookup_by_identifier(identifier="MAY090107", kind="upc") is None
+
+
+def test_imported_comic_indexed(
+    session: LeagueOfComicGeeks,
+    offline_session: Callable[..., LeagueOfComicGeeks],
+    tmp_path: Path,
+) -> None:
+    """Test identifiers and entities are recorded for Comics imported from a snapshot."""
+    snapshot = tmp_path / "snapshot.jsonl.gz"
+    export_snapshot(cache=session.cache, path=snapshot, endpoints=["/comic/format/json"])
+    offline = offline_session()
+    assert offline.lookup_by_identifier(identifier="MAY090106") is None
+
+    import_snapshot(cache=offline.cache, path=snapshot)
+    assert offline.lookup_by_identifier(identifier="MAY090106") == 2710631
+    assert offline.cache.select_entity(entity_type="series", entity_id=100096)["id"] == "100096"
+
+
+def test_dedup(session: LeagueOfComicGeeks, tmp_path: Path) -> None:
+    """Test sub-documents are stored once by content hash and reassembled when read."""
+    entries = list(session.cache.iter_entries(prefixes=["/comic/format/json"]))
+    cache = SQLiteCache(path=tmp_path / "cache.sqlite", expiry=None, dedup=True)
+    assert cache.merge(entries=entries) == len(entries)
+    assert cache.merge(entries=entries) == 0
+    for entry in entries:
+        assert cache.select(query=entry["query"]) == json.loads(entry["response"])
+    assert list(cache.iter_entries()) == [
+        {**x, "response": json.dumps(json.loads(x["response"]))} for x in entries
+    ]
+    assert cache.prune_documents() == 0
+
+    result = session.cache.select(query="/comic/format/json?comic_id=2710631")
+    cache.insert(query="/comic/format/json?comic_id=1", response=result)
+    assert cache.select(query="/comic/format/json?comic_id=1") == result
+    assert (
+        SQLiteCache(path=tmp_path / "cache.sqlite").select(query="/comic/format/json?comic_id=1")
+        == result
+    )
+
+    for entry in entries:
+        cache.delete(query=entry["query"])
+    assert cache.prune_documents() > 0
+    assert cache.select(query="/comic/format/json?comic_id=1") == result
+
+
+def test_dedup_missing_document(session: LeagueOfComicGeeks, tmp_path: Path) -> None:
+    """Test a response referencing a removed sub-document is treated as a miss."""
+    query = "/comic/format/json?comic_id=2710631"
+    cache = SQLiteCache(path=tmp_path / "cache.sqlite", dedup=True)
+    cache.insert(query=query, response=session.cache.select(query=query))
+    conn = sqlite3.connect(tmp_path / "cache.sqlite")
+    conn.execute("DELETE FROM document WHERE hash = (SELECT MIN(hash) FROM document);")
+    conn.commit()
+    conn.close()
+
+    assert cache.select(query=query) == {}
+    assert cache.select_many(queries=[query]) == {}
+    assert cache.select_stale(query=query) == {}
+    assert list(cache.iter_entries()) == []
+    assert cache.stats().misses == 2
+
+
+def test_write_behind(tmp_path: Path) -> None:
+    """Test buffered inserts are readable before they're written, and written on close."""
+    cache = SQLiteCache(path=tmp_path / "cache.sqlite", write_behind=True, flush_interval=60)
+    reader = SQLiteCache(path=tmp_path / "cache.sqlite")
+    cache.insert(query="/series/format/json?series_id=1", response={"id": 1}, etag='"abc"')
+    cache.insert_many(entries={"/series/format/json?series_id=2": {"id": 2}})
+
+    assert cache.select(query="/series/format/json?series_id=1") == {"id": 1}
+    assert cache.select_many(
+        queries=["/series/format/json?series_id=1", "/series/format/json?series_id=2"]
+    ) == {
+        "/series/format/json?series_id=1": {"id": 1},
+        "/series/format/json?series_id=2": {"id": 2},
+    }
+    assert cache.contains(query="/series/format/json?series_id=2")
+    assert cache.select_stale(query="/series/format/json?series_id=1")["etag"] == '"abc"'
+    assert reader.select(query="/series/format/json?series_id=1") == {}
+
+    cache.close()
+    assert reader.select_many(
+        queries=["/series/format/json?series_id=1", "/series/format/json?series_id=2"]
+    ) == {
+        "/series/format/json?series_id=1": {"id": 1},
+        "/series/format/json?series_id=2": {"id": 2},
+    }
+    cache.insert(query="/series/format/json?series_id=3", response={"id": 3})
+    assert reader.select(query="/series/format/json?series_id=3") == {"id": 3}
+
+
+def test_write_behind_extras(tmp_path: Path) -> None:
+    """Test misses, entities, identifiers and touches are buffered with the inserts."""
+    SQLiteCache(path=tmp_path / "cache.sqlite").insert(
+        query="/series/format/json?series_id=1", response={"id": 1}, etag='"abc"'
+    )
+    cache = SQLiteCache(path=tmp_path / "cache.sqlite", write_behind=True, flush_interval=60)
+    reader = SQLiteCache(path=tmp_path / "cache.sqlite")
+    timestamp = next(reader.iter_entries())["timestamp"]
+    cache.touch(query="/series/format/json?series_id=1")
+    cache.insert_negative(query="/comic/format/json?comic_id=1", status=404)
+    cache.insert_entities(entity_type="series", entities=[{"id": 2}])
+    cache.insert_identifiers(identifiers=[("upc", "761941284460", 3), ("sku", "0761941284460", 4)])
+
+    assert cache.select_negative(query="/comic/format/json?comic_id=1") == (404, None)
+    assert cache.contains(query="/comic/format/json?comic_id=1")
+    assert cache.select_entity(entity_type="series", entity_id=2) == {"id": 2}
+    assert cache.select_identifier(value="761941284460") in {3, 4}
+    assert cache.select_identifier(value="761941284460", kind="upc") == 3
+    assert cache.select_identifier(value="761941284460", kind="sku") == 4
+    assert cache.select_identifier(value="761941284460", kind="isbn") is None
+    assert cache.select_stale(query="/series/format/json?series_id=1")["etag"] == '"abc"'
+    assert reader.select_negative(query="/comic/format/json?comic_id=1") is None
+    assert reader.select_entity(entity_type="series", entity_id=2) == {}
+    assert reader.select_identifier(value="761941284460") is None
+    assert next(reader.iter_entries())["timestamp"] == timestamp
+
+    cache.close()
+    assert reader.select_negative(query="/comic/format/json?comic_id=1") == (404, None)
+    assert reader.select_entity(entity_type="series", entity_id=2) == {"id": 2}
+    assert reader.select_identifier(value="761941284460", kind="upc") == 3
+    assert reader.select_identifier(value="761941284460", kind="sku") == 4
+    assert not cache._pending_identifier_kinds  # noqa: SLF001
+    entry = next(reader.iter_entries())
+    assert entry["timestamp"] > timestamp
+    assert entry["etag"] == '"abc"'
+
+
+def test_write_behind_flush_size(tmp_path: Path) -> None:
+    """Test the background writer writes once enough inserts are buffered."""
+    cache = SQLiteCache(
+        path=tmp_path / "cache.sqlite", write_behind=True, flush_size=2, flush_interval=60
+    )
+    reader = SQLiteCache(path=tmp_path / "cache.sqlite")
+    cache.insert_many(entries={"/comic/format/json?comic_id=1": {"id": 1}})
+    cache.insert_many(entries={"/comic/format/json?comic_id=2": {"id": 2}})
+
+    deadline = time.monotonic() + 5
+    while not reader.contains(query="/comic/format/json?comic_id=2"):
+        assert time.monotonic() < deadline
+        time.sleep(0.01)
+    assert reader.select(query="/comic/format/json?comic_id=1") == {"id": 1}
+    cache.close()
@@ -0,0 +1,65 @@
+"""The TableExport test module.
+
+This module contains tests for export_tables.
+"""
+
+import csv
+from collections.abc import Callable
+from datetime import datetime, timezone
+from pathlib import Path
+
+import pytest
+
+from himon.league_of_comic_geeks import LeagueOfComicGeeks
+from himon.table_export import COLUMNS, _arrow_schema, export_tables
+
+QUERIES = ["/comic/format/json?comic_id=2710631", "/comic/format/json?comic_id=6257084"]
+
+
+def test_export_csv(offline_session: Callable[..., LeagueOfComicGeeks], tmp_path: Path) -> None:
+    """Test cached Comics are flattened into CSV tables."""
+    cache = offline_session(queries=QUERIES).cache
+    counts = export_tables(cache=cache, directory=tmp_path / "tables", chunk_size=10)
+    assert counts["comics"] == 2
+    assert counts["series"] == 2
+
+    with (tmp_path / "tables" / "comics.csv").open(encoding="UTF-8") as stream:
+        comics = {int(x["id"]): x for x in csv.DictReader(stream)}
+    assert comics[2710631]["series_id"] == "100096"
+    assert comics[2710631]["date_release"] == "2009-07-15"
+    assert comics[2710631]["format"] == "Comic"
+    with (tmp_path / "tables" / "creators.csv").open(encoding="UTF-8") as stream:
+        creators = list(csv.DictReader(stream))
+    assert len(creators) == counts["creators"]
+    assert {"comic_id": "2710631", "creator_id": "257", "role": "Writer"}.items() <= next(
+        x for x in creators if x["creator_id"] == "257"
+    ).items()
+
+
+def test_arrow_schema() -> None:
+    """Test rows are converted to Arrow with timestamps in UTC, if pyarrow is installed."""
+    pa = pytest.importorskip("pyarrow")
+    schema = _arrow_schema(columns=COLUMNS["variants"])
+    assert schema.field("date_modified").type == pa.timestamp("s", tz="UTC")
+
+    modified = datetime(2024, 1, 2, 3, 4, 5, tzinfo=timezone.utc)
+    table = pa.Table.from_pylist(
+        [{"comic_id": 1, "id": 2, "price": 3.99, "date_modified": modified}], schema=schema
+    )
+    assert table.column("date_modified").to_pylist() == [modified]
+
+
+def test_export_parquet(offline_session: Callable[..., LeagueOfComicGeeks], tmp_path: Path) -> None:
+    """Test cached Comics are written to Parquet, if pyarrow is installed."""
+    parquet = pytest.importorskip("pyarrow.parquet")
+    cache = offline_session(queries=QUERIES).cache
+    counts = export_tables(cache=cache, directory=tmp_path, file_format="parquet")
+    assert parquet.read_table(tmp_path / "characters.parquet").num_rows == counts["characters"]
+
+
+def test_export_feather(offline_session: Callable[..., LeagueOfComicGeeks], tmp_path: Path) -> None:
+    """Test cached Comics are written to Feather, if pyarrow is installed."""
+    feather = pytest.importorskip("pyarrow.feather")
+    cache = offline_session(queries=QUERIES).cache
+    counts = export_tables(cache=cache, directory=tmp_path, file_format="feather")
+    assert feather.read_table(tmp_path / "comics.feather").num_rows == counts["comics"]
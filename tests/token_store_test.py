@@ -0,0 +1,73 @@
+"""The TokenStore test module.
+
+This module contains tests for TokenStore.
+"""
+
+import json
+import re
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime, timedelta, timezone
+from pathlib import Path
+
+from pytest_httpx import HTTPXMock
+
+from himon.league_of_comic_geeks import LeagueOfComicGeeks
+from himon.token_store import TokenStore
+
+
+def test_token_store(tmp_path: Path) -> None:
+    """Test tokens are saved per client id and expire."""
+    store = TokenStore(path=tmp_path / "tokens.json")
+    assert store.select(client_id="Client") is None
+    store.insert(client_id="Client", access_token="Token")  # noqa: S106
+    assert store.select(client_id="Client") == "Token"
+    assert store.select(client_id="Other") is None
+    assert (tmp_path / "tokens.json").stat().st_mode & 0o777 == 0o600
+
+    tokens = json.loads((tmp_path / "tokens.json").read_text(encoding="UTF-8"))
+    tokens["Client"]["timestamp"] = (datetime.now(tz=timezone.utc) - timedelta(days=2)).isoformat()
+    (tmp_path / "tokens.json").write_text(json.dumps(tokens), encoding="UTF-8")
+    assert store.select(client_id="Client") is None
+    assert TokenStore(path=tmp_path / "tokens.json", expiry=None).select(client_id="Client")
+
+    store.delete(client_id="Client")
+    assert TokenStore(path=tmp_path / "tokens.json", expiry=None).select(client_id="Client") is None
+
+
+def test_concurrent_writers(tmp_path: Path) -> None:
+    """Test stores sharing a file, as separate processes would, never corrupt it."""
+
+    def _insert(index: int) -> None:
+        store = TokenStore(path=tmp_path / "tokens.json")
+        for _ in range(20):
+            store.insert(client_id=f"Client{index}", access_token="Token")  # noqa: S106
+
+    with ThreadPoolExecutor(max_workers=4) as executor:
+        list(executor.map(_insert, range(4)))
+
+    tokens = json.loads((tmp_path / "tokens.json").read_text(encoding="UTF-8"))
+    assert set(tokens) <= {f"Client{x}" for x in range(4)}
+    assert [x.name for x in tmp_path.iterdir()] == ["tokens.json"]
+
+
+def test_refresh_access_token(
+    session: LeagueOfComicGeeks, tmp_path: Path, httpx_mock: HTTPXMock
+) -> None:
+    """Test a saved token skips authorizing, and a rejected token is refreshed once."""
+    result = session.cache.select(query="/series/format/json?series_id=100096")
+    store = TokenStore(path=tmp_path / "tokens.json")
+    store.insert(client_id="Client", access_token="Expired")  # noqa: S106
+    httpx_mock.add_response(match_headers={"X-API-KEY": "Expired"}, status_code=403)
+    httpx_mock.add_response(url=re.compile(r".*/authorize/format/json"), json="Refreshed")
+    httpx_mock.add_response(match_headers={"X-API-KEY": "Refreshed"}, json=result)
+
+    client = LeagueOfComicGeeks(
+        client_id="Client",
+        client_secret="Secret",  # noqa: S106
+        token_store=store,
+    )
+    assert client.access_token == "Expired"  # noqa: S105
+    assert client.get_series(series_id=100096).id == 100096
+    assert client.access_token == "Refreshed"  # noqa: S105
+    assert store.select(client_id="Client") == "Refreshed"
+    assert len(httpx_mock.get_requests()) == 3